@@ -0,0 +1,39 @@
+"""Materialized view for certificador stats by state
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-08-28
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Pre-aggregated counts per state and type, refreshed after each harvest
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_cert_stats_by_state AS
+        SELECT estado_inegi, estado, tipo, count(*) AS c
+        FROM certificadores_v2
+        GROUP BY estado_inegi, estado, tipo
+    """)
+    
+    # A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ux_mv_cert_stats_by_state',
+        'mv_cert_stats_by_state',
+        ['estado_inegi', 'estado', 'tipo'],
+        unique=True
+    )
+
+
+def downgrade():
+    op.drop_index('ux_mv_cert_stats_by_state', table_name='mv_cert_stats_by_state')
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_cert_stats_by_state")
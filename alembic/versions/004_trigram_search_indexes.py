@@ -0,0 +1,50 @@
+"""Trigram GIN indexes for substring search
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-08-29
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column) for every column searched with ILIKE '%term%'
+TRGM_INDEXES = [
+    ('ix_ec_standards_v2_ec_clave_trgm', 'ec_standards_v2', 'ec_clave'),
+    ('ix_ec_standards_v2_titulo_trgm', 'ec_standards_v2', 'titulo'),
+    ('ix_certificadores_v2_cert_id_trgm', 'certificadores_v2', 'cert_id'),
+    ('ix_certificadores_v2_nombre_legal_trgm', 'certificadores_v2', 'nombre_legal'),
+    ('ix_certificadores_v2_siglas_trgm', 'certificadores_v2', 'siglas'),
+    ('ix_certificadores_v2_municipio_trgm', 'certificadores_v2', 'municipio'),
+    ('ix_centros_centro_id_trgm', 'centros', 'centro_id'),
+    ('ix_centros_nombre_trgm', 'centros', 'nombre'),
+    ('ix_centros_municipio_trgm', 'centros', 'municipio'),
+    ('ix_sectores_nombre_trgm', 'sectores', 'nombre'),
+    ('ix_comites_nombre_trgm', 'comites', 'nombre'),
+]
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table, column in TRGM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(TRGM_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
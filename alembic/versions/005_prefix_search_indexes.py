@@ -0,0 +1,41 @@
+"""Lowercase prefix indexes for autocomplete
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-08-29
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column) for columns matched with lower(col) LIKE 'prefix%'
+PREFIX_INDEXES = [
+    ('ix_ec_standards_v2_ec_clave_lower', 'ec_standards_v2', 'ec_clave'),
+    ('ix_certificadores_v2_cert_id_lower', 'certificadores_v2', 'cert_id'),
+    ('ix_certificadores_v2_siglas_lower', 'certificadores_v2', 'siglas'),
+    ('ix_centros_centro_id_lower', 'centros', 'centro_id'),
+]
+
+
+def upgrade():
+    # text_pattern_ops lets LIKE 'prefix%' use a btree range scan in any collation
+    with op.get_context().autocommit_block():
+        for name, table, column in PREFIX_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} (lower({column}) text_pattern_ops)"
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(PREFIX_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
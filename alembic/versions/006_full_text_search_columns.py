@@ -0,0 +1,48 @@
+"""Generated tsvector columns for full-text search
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+# (table, tsvector source expression)
+SEARCH_VECTORS = [
+    ('ec_standards_v2',
+     "coalesce(ec_clave, '') || ' ' || coalesce(titulo, '')"),
+    ('certificadores_v2',
+     "coalesce(cert_id, '') || ' ' || coalesce(nombre_legal, '') || ' ' || coalesce(siglas, '')"),
+    ('centros',
+     "coalesce(centro_id, '') || ' ' || coalesce(nombre, '')"),
+]
+
+
+def upgrade():
+    for table, source in SEARCH_VECTORS:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vec tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('simple', {source})) STORED"
+        )
+    
+    with op.get_context().autocommit_block():
+        for table, _ in SEARCH_VECTORS:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_vec "
+                f"ON {table} USING gin (search_vec)"
+            )
+
+
+def downgrade():
+    for table, _ in reversed(SEARCH_VECTORS):
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vec")
+        op.drop_column(table, 'search_vec')
@@ -0,0 +1,36 @@
+"""Composite index for the EC standards list filters
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves WHERE sector_id/vigente ... ORDER BY ec_clave LIMIT n from the index
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ec_sector_vigente_clave "
+            "ON ec_standards_v2 (sector_id, vigente, ec_clave)"
+        )
+        # Most listings only ask for active standards
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ec_vigentes_sector_clave "
+            "ON ec_standards_v2 (sector_id, ec_clave) WHERE vigente = true"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_ec_vigentes_sector_clave")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_ec_sector_vigente_clave")
@@ -0,0 +1,39 @@
+"""Covering indexes for EC standards by sector and committee
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+# (index name, filter column); each INCLUDEs the columns counted and filtered
+# alongside it so the sector/comite counts are index-only scans
+COVERING_INDEXES = [
+    ('ix_ec_standards_v2_sector_id_covering', 'sector_id'),
+    ('ix_ec_standards_v2_comite_id_covering', 'comite_id'),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, column in COVERING_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON ec_standards_v2 ({column}) INCLUDE (ec_clave, vigente)"
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(COVERING_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
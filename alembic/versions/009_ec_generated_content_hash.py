@@ -0,0 +1,42 @@
+"""Generated content hash for EC standards
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-09-01
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+# Fields that define an EC standard's content for change detection. Dates
+# are left out because their text cast is not immutable.
+CONTENT_HASH_SOURCE = (
+    "md5("
+    "coalesce(titulo, '') || '|' || coalesce(version, '') || '|' || "
+    "coalesce(vigente::text, '') || '|' || coalesce(sector, '') || '|' || "
+    "coalesce(comite, '') || '|' || coalesce(nivel, '') || '|' || "
+    "coalesce(tipo_norma, '') || '|' || coalesce(duracion_horas::text, '') || '|' || "
+    "coalesce(descripcion, '')"
+    ")"
+)
+
+
+def upgrade():
+    op.drop_column('ec_standards_v2', 'content_hash')
+    op.execute(
+        f"ALTER TABLE ec_standards_v2 ADD COLUMN content_hash varchar(64) "
+        f"GENERATED ALWAYS AS ({CONTENT_HASH_SOURCE}) STORED"
+    )
+
+
+def downgrade():
+    op.drop_column('ec_standards_v2', 'content_hash')
+    op.add_column('ec_standards_v2', sa.Column('content_hash', sa.String(64)))
@@ -0,0 +1,107 @@
+"""
+Conditional GET support (ETag / Last-Modified) for read-heavy endpoints.
+"""
+
+import hashlib
+import os
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Optional, Tuple
+
+import redis
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import Session
+
+from src.models import get_db
+
+
+class DataVersionCache:
+    """
+    Caches MAX(last_seen) per set of tables for a short TTL.
+
+    Uses Redis when available so all workers share the value, falling back
+    to a per-process dict otherwise.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 30):
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/1")
+        self.ttl = ttl
+        self._local: Dict[str, Tuple[float, Optional[str]]] = {}
+
+        try:
+            self.redis_client = redis.from_url(self.redis_url, decode_responses=True)
+            self.redis_client.ping()
+        except Exception as e:
+            print(f"Data version cache using local memory: Redis connection failed - {e}")
+            self.redis_client = None
+
+    def get(self, key: str) -> Optional[str]:
+        if self.redis_client is not None:
+            try:
+                return self.redis_client.get(key)
+            except redis.RedisError:
+                pass
+
+        expires, value = self._local.get(key, (0.0, None))
+        return value if expires > time.monotonic() else None
+
+    def set(self, key: str, value: str) -> None:
+        if self.redis_client is not None:
+            try:
+                self.redis_client.setex(key, self.ttl, value)
+                return
+            except redis.RedisError:
+                pass
+
+        self._local[key] = (time.monotonic() + self.ttl, value)
+
+
+data_version_cache = DataVersionCache()
+
+
+class ConditionalGet:
+    """
+    Dependency returning 304 Not Modified when the client's ETag is current.
+
+    The ETag is derived from the newest ``last_seen`` across the given models,
+    which only moves when a harvest touches the data.
+
+    Usage:
+        @router.get("/items", dependencies=[Depends(ConditionalGet(Item))])
+    """
+
+    def __init__(self, *models):
+        self.models = models
+        self.cache_key = "data_version:" + ",".join(m.__tablename__ for m in models)
+
+    def _max_last_seen(self, db: Session) -> Optional[str]:
+        cached = data_version_cache.get(self.cache_key)
+        if cached is not None:
+            return cached or None
+
+        stmt = union_all(*(select(func.max(m.last_seen).label("ts")) for m in self.models)).subquery()
+        latest = db.execute(select(func.max(stmt.c.ts))).scalar()
+        value = latest.isoformat() if latest else ""
+        data_version_cache.set(self.cache_key, value)
+        return value or None
+
+    def __call__(self, request: Request, response: Response, db: Session = Depends(get_db)) -> None:
+        latest = self._max_last_seen(db)
+        if latest is None:
+            return
+
+        etag = '"%s"' % hashlib.blake2b(latest.encode(), digest_size=8).hexdigest()
+        headers = {
+            "ETag": etag,
+            "Last-Modified": format_datetime(
+                datetime.fromisoformat(latest).replace(tzinfo=timezone.utc), usegmt=True
+            ),
+        }
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
@@ -1,6 +1,7 @@
 """
 FastAPI main application for RENEC Harvester web interface.
 """
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import Optional
@@ -18,6 +19,7 @@ from .models import SpiderConfig, SpiderStatus
 from .spider_manager import SpiderManager
 from .auth import api_key_dependency, get_optional_api_key
 from .rate_limiter import rate_limit_middleware
+from .reference_data import load_reference_data, refresh_reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +28,16 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     app.state.spider_manager = SpiderManager()
+    try:
+        load_reference_data()
+    except Exception as e:
+        logger.warning(f"Reference data not loaded at startup: {e}")
+    refresh_task = asyncio.create_task(refresh_reference_data())
+    sampler_task = asyncio.create_task(stats.sample_resources_forever())
     yield
     # Shutdown
+    refresh_task.cancel()
+    sampler_task.cancel()
     if hasattr(app.state, 'spider_manager'):
         await app.state.spider_manager.cleanup()
 
@@ -3,7 +3,7 @@ Pydantic models for API requests and responses.
 """
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 
 
@@ -114,14 +114,18 @@ class ECStandardBase(BaseModel):
 class ECStandardResponse(ECStandardBase):
     last_seen: datetime
 
+class ECStandardPage(BaseModel):
+    items: List[ECStandardResponse]
+    next_cursor: Optional[str] = Field(None, description="Pass as 'after' to fetch the next page")
+
 class ECStandardDetail(ECStandardBase):
     comite: Optional[str]
     comite_id: Optional[int]
     descripcion: Optional[str]
     competencias: Optional[List[str]]
     tipo_norma: Optional[str]
-    fecha_publicacion: Optional[datetime]
-    fecha_vigencia: Optional[datetime]
+    fecha_publicacion: Optional[date]
+    fecha_vigencia: Optional[date]
     perfil_evaluador: Optional[str]
     criterios_evaluacion: Optional[List[str]]
     renec_url: Optional[str]
@@ -0,0 +1,59 @@
+"""
+In-memory sector and comite catalogues served without database I/O.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+
+from src.models import get_session
+from src.models.sector import Sector
+from src.models.comite import Comite
+
+logger = logging.getLogger(__name__)
+
+# ~20 sectors and ~100 comites; replaced wholesale on each load
+SECTOR_BY_ID: Dict[int, Dict[str, Any]] = {}
+COMITE_BY_ID: Dict[int, Dict[str, Any]] = {}
+
+REFRESH_INTERVAL_SECONDS = 600
+
+
+def load_reference_data() -> None:
+    """Load sector and comite names into the module-level dicts."""
+    with get_session() as session:
+        sectors = {
+            row.sector_id: {'sector_id': row.sector_id, 'nombre': row.nombre}
+            for row in session.execute(select(Sector.sector_id, Sector.nombre))
+        }
+        comites = {
+            row.comite_id: {'comite_id': row.comite_id, 'nombre': row.nombre}
+            for row in session.execute(select(Comite.comite_id, Comite.nombre))
+        }
+
+    # Update in place only after both queries succeed. Readers run
+    # concurrently in the threadpool, so never empty the dicts: add or
+    # overwrite current entries first, then drop the ones that disappeared.
+    _replace_contents(SECTOR_BY_ID, sectors)
+    _replace_contents(COMITE_BY_ID, comites)
+    logger.info(f"Loaded {len(sectors)} sectors and {len(comites)} comites")
+
+
+def _replace_contents(target: Dict[int, Dict[str, Any]], new: Dict[int, Dict[str, Any]]) -> None:
+    """Make ``target`` equal ``new`` without it ever being empty in between."""
+    target.update(new)
+    for key in target.keys() - new.keys():
+        del target[key]
+
+
+async def refresh_reference_data(interval: int = REFRESH_INTERVAL_SECONDS) -> None:
+    """Reload the catalogues every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(load_reference_data)
+        except Exception as e:
+            logger.warning(f"Reference data refresh failed: {e}")
@@ -0,0 +1,133 @@
+"""
+Response caching for read-mostly API endpoints.
+"""
+
+import inspect
+import os
+import time
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+import redis
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+
+
+class ResponseCache:
+    """
+    Stores rendered JSON response bodies keyed by request path and query.
+
+    Uses Redis when available so all workers share entries, falling back
+    to a per-process dict otherwise.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, prefix: str = "renec:response"):
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/1")
+        self.prefix = prefix
+        self._local: Dict[str, Tuple[float, bytes]] = {}
+
+        try:
+            self.redis_client = redis.from_url(self.redis_url)
+            self.redis_client.ping()
+        except Exception as e:
+            print(f"Response cache using local memory: Redis connection failed - {e}")
+            self.redis_client = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        key = f"{self.prefix}:{key}"
+        if self.redis_client is not None:
+            try:
+                return self.redis_client.get(key)
+            except redis.RedisError:
+                pass
+
+        expires, body = self._local.get(key, (0.0, None))
+        return body if expires > time.monotonic() else None
+
+    def set(self, key: str, body: bytes, ttl: int) -> None:
+        key = f"{self.prefix}:{key}"
+        if self.redis_client is not None:
+            try:
+                self.redis_client.setex(key, ttl, body)
+                return
+            except redis.RedisError:
+                pass
+
+        self._local[key] = (time.monotonic() + ttl, body)
+
+    def clear(self) -> None:
+        """Drop every cached response, e.g. after a harvest changed the data."""
+        self._local.clear()
+        if self.redis_client is not None:
+            try:
+                keys = list(self.redis_client.scan_iter(f"{self.prefix}:*"))
+                if keys:
+                    self.redis_client.delete(*keys)
+            except redis.RedisError:
+                pass
+
+
+response_cache = ResponseCache()
+
+
+def cache_response(expire: int = 60) -> Callable:
+    """
+    Cache a GET handler's JSON body for ``expire`` seconds.
+
+    The handler's return value (a dict/list, pydantic models, or a JSON
+    ``Response``) is rendered once and replayed for identical path + query
+    strings. Errors (HTTPException) and non-200 responses are never cached.
+    A matching ``Cache-Control: public, max-age`` header lets clients and
+    CDNs cache as well. Both sync and async handlers are supported.
+
+    Usage:
+        @router.get("/items")
+        @cache_response(expire=60)
+        def list_items(...): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        # FastAPI injects the request through this extra keyword parameter
+        parameters = list(signature.parameters.values()) + [
+            inspect.Parameter("_cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+        ]
+        cache_control = {"Cache-Control": f"public, max-age={expire}"}
+
+        def lookup(request: Request) -> Tuple[str, Optional[Response]]:
+            key = f"{request.url.path}?{request.url.query}"
+            body = response_cache.get(key)
+            if body is None:
+                return key, None
+            return key, Response(content=body, media_type="application/json", headers=cache_control)
+
+        def store(key: str, result) -> Response:
+            if not isinstance(result, Response):
+                # Pydantic models (and lists of them) are not orjson-serializable
+                result = ORJSONResponse(jsonable_encoder(result))
+
+            if result.status_code == 200 and result.media_type == "application/json":
+                response_cache.set(key, result.body, expire)
+                result.headers.update(cache_control)
+
+            return result
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, _cache_request: Request, **kwargs):
+                key, cached = lookup(_cache_request)
+                if cached is not None:
+                    return cached
+                return store(key, await func(*args, **kwargs))
+        else:
+            @wraps(func)
+            def wrapper(*args, _cache_request: Request, **kwargs):
+                key, cached = lookup(_cache_request)
+                if cached is not None:
+                    return cached
+                return store(key, func(*args, **kwargs))
+
+        wrapper.__signature__ = signature.replace(parameters=parameters)
+        return wrapper
+
+    return decorator
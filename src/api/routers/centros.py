@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
-from src.models import get_session
+from src.models import get_db
 from src.models.centro import Centro
 from src.api.models import PaginationParams, CentroResponse, CentroDetail
 
@@ -17,13 +17,13 @@ router = APIRouter()
 
 
 @router.get("/centros", response_model=List[CentroResponse])
-async def list_centros(
+def list_centros(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
     estado_inegi: Optional[str] = Query(None, description="Filter by INEGI state code"),
     municipio: Optional[str] = Query(None, description="Filter by municipality"),
     search: Optional[str] = Query(None, description="Search in ID and name"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     List evaluation centers with pagination and filtering.
@@ -75,9 +75,9 @@ async def list_centros(
 
 
 @router.get("/centros/{centro_id}", response_model=CentroDetail)
-async def get_centro(
+def get_centro(
     centro_id: str,
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get detailed information for a specific evaluation center.
@@ -141,10 +141,10 @@ async def get_centro(
 
 
 @router.get("/centros/{centro_id}/ec-standards")
-async def get_centro_standards(
+def get_centro_standards(
     centro_id: str,
     vigente: Optional[bool] = Query(None, description="Filter by vigente status"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get all EC standards that this center can evaluate.
@@ -186,9 +186,9 @@ async def get_centro_standards(
 
 
 @router.get("/centros/by-state/{estado_inegi}")
-async def get_centros_by_state(
+def get_centros_by_state(
     estado_inegi: str,
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get all evaluation centers in a specific state.
@@ -222,8 +222,8 @@ async def get_centros_by_state(
 
 
 @router.get("/centros/stats/by-state")
-async def get_centros_stats_by_state(
-    db: Session = Depends(get_session)
+def get_centros_stats_by_state(
+    db: Session = Depends(get_db)
 ):
     """
     Get evaluation center statistics grouped by state.
@@ -267,11 +267,11 @@ async def get_centros_stats_by_state(
 
 
 @router.get("/centros/nearby")
-async def get_nearby_centros(
+def get_nearby_centros(
     estado_inegi: str = Query(..., description="INEGI state code"),
     municipio: Optional[str] = Query(None, description="Municipality name"),
     limit: int = Query(10, ge=1, le=50, description="Max number of results"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Find evaluation centers in a specific location.
@@ -5,25 +5,40 @@ from typing import List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, case, lambda_stmt, table, column
+from sqlalchemy.orm import Session, selectinload
 
-from src.models import get_session, CertificadorV2 as Certificador
+from src.models import get_db, CertificadorV2 as Certificador, ECStandardV2 as ECStandard
+from src.models.relations import ECEEC
+from src.api.conditional import ConditionalGet
 from src.api.models import PaginationParams, CertificadorResponse, CertificadorDetail
 
 
 router = APIRouter()
 
+# 304 Not Modified until a harvest touches the underlying rows
+certificadores_etag = ConditionalGet(Certificador)
+certificador_standards_etag = ConditionalGet(Certificador, ECStandard)
 
-@router.get("/certificadores", response_model=List[CertificadorResponse])
-async def list_certificadores(
+# Materialized view created by migration 003 (see refresh_materialized_views)
+mv_cert_stats_by_state = table(
+    'mv_cert_stats_by_state',
+    column('estado_inegi'),
+    column('estado'),
+    column('tipo'),
+    column('c')
+)
+
+
+@router.get("/certificadores", response_model=List[CertificadorResponse], dependencies=[Depends(certificadores_etag)])
+def list_certificadores(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
     tipo: Optional[str] = Query(None, description="Filter by type (ECE/OC)"),
     estado_inegi: Optional[str] = Query(None, description="Filter by INEGI state code"),
     estatus: Optional[str] = Query(None, description="Filter by status (Vigente/Cancelado)"),
     search: Optional[str] = Query(None, description="Search in ID, name, and acronym"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     List certificadores with pagination and filtering.
@@ -35,28 +50,31 @@ async def list_certificadores(
     - **estatus**: Filter by status (Vigente or Cancelado)
     - **search**: Search in ID, legal name, and acronym
     """
-    query = select(Certificador)
+    # lambda_stmt caches the compiled SQL per combination of enabled filters;
+    # closure variables are extracted as bound parameters on each call.
+    query = lambda_stmt(lambda: select(Certificador))
     
     # Apply filters
     if tipo:
-        query = query.where(Certificador.tipo == tipo.upper())
+        tipo_upper = tipo.upper()
+        query += lambda q: q.where(Certificador.tipo == tipo_upper)
     
     if estado_inegi:
-        query = query.where(Certificador.estado_inegi == estado_inegi)
+        query += lambda q: q.where(Certificador.estado_inegi == estado_inegi)
     
     if estatus:
-        query = query.where(Certificador.estatus == estatus)
+        query += lambda q: q.where(Certificador.estatus == estatus)
     
     if search:
         search_term = f"%{search}%"
-        query = query.where(
+        query += lambda q: q.where(
             (Certificador.cert_id.ilike(search_term)) |
             (Certificador.nombre_legal.ilike(search_term)) |
             (Certificador.siglas.ilike(search_term))
         )
     
     # Apply pagination
-    query = query.offset(skip).limit(limit)
+    query += lambda q: q.offset(skip).limit(limit)
     
     # Execute query
     result = db.execute(query)
@@ -80,31 +98,31 @@ async def list_certificadores(
     ]
 
 
-@router.get("/certificadores/{cert_id}", response_model=CertificadorDetail)
-async def get_certificador(
+@router.get("/certificadores/{cert_id}", response_model=CertificadorDetail, dependencies=[Depends(certificador_standards_etag)])
+def get_certificador(
     cert_id: str,
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get detailed information for a specific certificador.
     
     - **cert_id**: The certificador ID (e.g., ECE001-99)
     """
-    cert = db.query(Certificador).filter(Certificador.cert_id == cert_id).first()
+    # Accreditations (and their EC standard, joined in) load in one extra
+    # SELECT ... WHERE cert_id IN (...) instead of one query per standard.
+    cert = db.execute(
+        select(Certificador)
+        .where(Certificador.cert_id == cert_id)
+        .options(selectinload(Certificador.acreditaciones))
+    ).scalar_one_or_none()
     
     if not cert:
         raise HTTPException(status_code=404, detail=f"Certificador {cert_id} not found")
     
-    # Get accredited EC standards
-    from src.models.relations import ECEEC
-    from src.models import ECStandardV2 as ECStandard
-    
     ec_standards = []
     if cert.tipo == 'ECE':
-        ece_relations = db.query(ECEEC).filter(ECEEC.cert_id == cert_id).all()
-        
-        for rel in ece_relations:
-            ec = db.query(ECStandard).filter(ECStandard.ec_clave == rel.ec_clave).first()
+        for rel in cert.acreditaciones:
+            ec = rel.ec_standard
             if ec:
                 ec_standards.append({
                     'ec_clave': ec.ec_clave,
@@ -138,11 +156,11 @@ async def get_certificador(
     )
 
 
-@router.get("/certificadores/{cert_id}/ec-standards")
-async def get_certificador_standards(
+@router.get("/certificadores/{cert_id}/ec-standards", dependencies=[Depends(certificador_standards_etag)])
+def get_certificador_standards(
     cert_id: str,
     vigente: Optional[bool] = Query(None, description="Filter by vigente status"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get all EC standards that this certificador can accredit.
@@ -163,9 +181,6 @@ async def get_certificador_standards(
             'message': 'Only ECE (Entidad de Certificación y Evaluación) can accredit standards'
         }
     
-    from src.models.relations import ECEEC
-    from src.models import ECStandardV2 as ECStandard
-    
     query = db.query(ECStandard).join(
         ECEEC, ECEEC.ec_clave == ECStandard.ec_clave
     ).filter(ECEEC.cert_id == cert_id)
@@ -199,11 +214,11 @@ async def get_certificador_standards(
     }
 
 
-@router.get("/certificadores/by-state/{estado_inegi}")
-async def get_certificadores_by_state(
+@router.get("/certificadores/by-state/{estado_inegi}", dependencies=[Depends(certificadores_etag)])
+def get_certificadores_by_state(
     estado_inegi: str,
     tipo: Optional[str] = Query(None, description="Filter by type (ECE/OC)"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get all certificadores in a specific state.
@@ -244,46 +259,42 @@ async def get_certificadores_by_state(
     }
 
 
+# No ConditionalGet here: the counts come from a materialized view that lags
+# certificadores_v2.last_seen until it is refreshed
 @router.get("/certificadores/stats/by-state")
-async def get_certificadores_stats_by_state(
-    db: Session = Depends(get_session)
+def get_certificadores_stats_by_state(
+    db: Session = Depends(get_db)
 ):
     """
     Get certificador statistics grouped by state.
     """
-    # Query to get counts by state and type
-    stats = db.query(
-        Certificador.estado_inegi,
-        Certificador.estado,
-        Certificador.tipo,
-        func.count(Certificador.cert_id).label('count')
-    ).group_by(
-        Certificador.estado_inegi,
-        Certificador.estado,
-        Certificador.tipo
+    # Per (state, tipo) counts come pre-aggregated from the materialized
+    # view refreshed after each harvest; pivot and rank the states in SQL
+    counts = mv_cert_stats_by_state
+    total = func.sum(counts.c.c).label('total')
+    stats = db.execute(
+        select(
+            counts.c.estado_inegi,
+            counts.c.estado,
+            func.sum(case((counts.c.tipo == 'ECE', counts.c.c), else_=0)).label('ece'),
+            func.sum(case((counts.c.tipo == 'OC', counts.c.c), else_=0)).label('oc'),
+            total
+        ).group_by(
+            counts.c.estado_inegi,
+            counts.c.estado
+        ).order_by(total.desc())
     ).all()
     
-    # Organize by state
-    state_stats = {}
-    for stat in stats:
-        if stat.estado_inegi not in state_stats:
-            state_stats[stat.estado_inegi] = {
-                'estado_inegi': stat.estado_inegi,
-                'estado_nombre': stat.estado,
-                'total': 0,
-                'ECE': 0,
-                'OC': 0
-            }
-        
-        state_stats[stat.estado_inegi][stat.tipo] = stat.count
-        state_stats[stat.estado_inegi]['total'] += stat.count
-    
-    # Convert to list and sort by total
-    result = sorted(
-        state_stats.values(),
-        key=lambda x: x['total'],
-        reverse=True
-    )
+    result = [
+        {
+            'estado_inegi': stat.estado_inegi,
+            'estado_nombre': stat.estado,
+            'total': stat.total,
+            'ECE': stat.ece,
+            'OC': stat.oc
+        }
+        for stat in stats
+    ]
     
     # Add national summary
     total_ece = sum(s['ECE'] for s in result)
@@ -1,18 +1,119 @@
 """
 Data access and export API endpoints.
 """
-from fastapi import APIRouter, Query, HTTPException, Response
-from typing import Optional, List
-from datetime import datetime
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
+from typing import Iterator, Optional, List
+from datetime import datetime, timedelta
 import json
 import csv
 import io
 
+from sqlalchemy import select, func, literal, case, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from src.models import get_db, ECStandardV2, CertificadorV2, Centro
+from ..conditional import ConditionalGet
 from ..models import DataResponse, DataItem, ExportFormat
 
 router = APIRouter()
 
 
+def _items_union():
+    """Project every harvested entity onto a common (type, status, sector, last_seen) shape."""
+    return union_all(
+        select(
+            literal("ec_standard").label("type"),
+            case((ECStandardV2.vigente.is_(True), "active"), else_="inactive").label("status"),
+            ECStandardV2.sector.label("sector"),
+            ECStandardV2.last_seen.label("last_seen"),
+        ),
+        select(
+            literal("certificador").label("type"),
+            CertificadorV2.estatus.label("status"),
+            literal(None).label("sector"),
+            CertificadorV2.last_seen.label("last_seen"),
+        ),
+        select(
+            literal("evaluation_center").label("type"),
+            literal(None).label("status"),
+            literal(None).label("sector"),
+            Centro.last_seen.label("last_seen"),
+        ),
+    ).subquery("items")
+
+
+def _query_items(
+    type_filter: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    search: Optional[str] = None
+) -> Iterator[DataItem]:
+    """Yield data items matching the given filters.
+
+    Shared by /data (which paginates) and /export (which consumes it fully).
+    """
+    # Mock data for development - replace with actual database queries
+    mock_items = [
+        DataItem(
+            id="1",
+            type="ec_standard",
+            title="Instalación de sistemas de aire acondicionado",
+            code="EC0221",
+            sector="Construcción",
+            last_updated=datetime.now(),
+            status="active"
+        ),
+        DataItem(
+            id="2", 
+            type="certificador",
+            title="Instituto Nacional de Certificación",
+            code="CERT001", 
+            sector="Educación",
+            last_updated=datetime.now(),
+            status="active"
+        ),
+        DataItem(
+            id="3",
+            type="course",
+            title="Curso de Soldadura Industrial",
+            code="CURSO-SOL-001",
+            sector="Manufactura", 
+            last_updated=datetime.now(),
+            status="pending"
+        ),
+        DataItem(
+            id="4",
+            type="evaluation_center",
+            title="Centro de Evaluación Técnica Industrial",
+            code="CETI-001",
+            sector="Industria",
+            last_updated=datetime.now(),
+            status="active"
+        ),
+        DataItem(
+            id="5",
+            type="sector",
+            title="Sector de Tecnologías de la Información",
+            code="SECT-TI",
+            sector="Tecnología",
+            last_updated=datetime.now(), 
+            status="active"
+        )
+    ]
+    
+    search_lower = search.lower() if search else None
+    
+    for item in mock_items:
+        if type_filter and item.type != type_filter:
+            continue
+        if status_filter and item.status != status_filter:
+            continue
+        if search_lower and not (
+            search_lower in item.title.lower() or search_lower in item.code.lower()
+        ):
+            continue
+        yield item
+
+
 @router.get("/data", response_model=DataResponse)
 async def get_data(
     page: int = Query(1, ge=1),
@@ -23,70 +124,7 @@ async def get_data(
 ):
     """Get paginated data with optional filtering and search."""
     try:
-        # Mock data for development - replace with actual database queries
-        mock_items = [
-            DataItem(
-                id="1",
-                type="ec_standard",
-                title="Instalación de sistemas de aire acondicionado",
-                code="EC0221",
-                sector="Construcción",
-                last_updated=datetime.now(),
-                status="active"
-            ),
-            DataItem(
-                id="2", 
-                type="certificador",
-                title="Instituto Nacional de Certificación",
-                code="CERT001", 
-                sector="Educación",
-                last_updated=datetime.now(),
-                status="active"
-            ),
-            DataItem(
-                id="3",
-                type="course",
-                title="Curso de Soldadura Industrial",
-                code="CURSO-SOL-001",
-                sector="Manufactura", 
-                last_updated=datetime.now(),
-                status="pending"
-            ),
-            DataItem(
-                id="4",
-                type="evaluation_center",
-                title="Centro de Evaluación Técnica Industrial",
-                code="CETI-001",
-                sector="Industria",
-                last_updated=datetime.now(),
-                status="active"
-            ),
-            DataItem(
-                id="5",
-                type="sector",
-                title="Sector de Tecnologías de la Información",
-                code="SECT-TI",
-                sector="Tecnología",
-                last_updated=datetime.now(), 
-                status="active"
-            )
-        ]
-        
-        # Apply filters
-        filtered_items = mock_items
-        
-        if type_filter:
-            filtered_items = [item for item in filtered_items if item.type == type_filter]
-        
-        if status_filter:
-            filtered_items = [item for item in filtered_items if item.status == status_filter]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_items = [
-                item for item in filtered_items
-                if search_lower in item.title.lower() or search_lower in item.code.lower()
-            ]
+        filtered_items = list(_query_items(type_filter, status_filter, search))
         
         # Apply pagination
         total = len(filtered_items)
@@ -148,15 +186,7 @@ async def export_data(
 ):
     """Export data in various formats (JSON, CSV, Excel)."""
     try:
-        # Get data using same filtering logic as /data endpoint
-        data_response = await get_data(
-            page=1,
-            per_page=10000,  # Large number to get all data
-            type_filter=type_filter,
-            status_filter=status_filter
-        )
-        
-        items = data_response.items
+        items = list(_query_items(type_filter, status_filter))
         
         if format == ExportFormat.JSON:
             # Export as JSON
@@ -213,41 +243,63 @@ async def export_data(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/summary")
-async def get_data_summary():
+@router.get("/summary", dependencies=[Depends(ConditionalGet(ECStandardV2, CertificadorV2, Centro))])
+def get_data_summary(db: Session = Depends(get_db)):
     """Get summary statistics of available data."""
     try:
-        # Mock summary data - replace with actual database aggregations
+        items = _items_union()
+        now = func.now()
+
+        # One scan computes every rollup: GROUPING SETS yields one row group per
+        # dimension plus the grand total, with freshness buckets as FILTER aggregates.
+        stmt = select(
+            items.c.type,
+            items.c.status,
+            items.c.sector,
+            func.grouping(items.c.type).label("g_type"),
+            func.grouping(items.c.status).label("g_status"),
+            func.grouping(items.c.sector).label("g_sector"),
+            func.count().label("total"),
+            func.max(items.c.last_seen).label("last_updated"),
+            func.count().filter(items.c.last_seen > now - timedelta(hours=24)).label("last_24h"),
+            func.count().filter(items.c.last_seen > now - timedelta(days=7)).label("last_week"),
+            func.count().filter(items.c.last_seen > now - timedelta(days=30)).label("last_month"),
+        ).group_by(
+            func.grouping_sets(items.c.type, items.c.status, items.c.sector, tuple_())
+        )
+
         summary = {
-            "total_items": 4765,
-            "by_type": {
-                "ec_standard": 1250,
-                "certificador": 890,
-                "evaluation_center": 450,
-                "course": 2100,
-                "sector": 75
-            },
-            "by_status": {
-                "active": 4234,
-                "pending": 456,
-                "error": 75
-            },
-            "by_sector": {
-                "Construcción": 1200,
-                "Educación": 890,
-                "Manufactura": 1100,
-                "Tecnología": 675,
-                "Servicios": 900
-            },
-            "last_updated": datetime.now().isoformat(),
+            "total_items": 0,
+            "by_type": {},
+            "by_status": {},
+            "by_sector": {},
+            "last_updated": None,
             "data_freshness": {
-                "last_24h": 234,
-                "last_week": 1456,
-                "last_month": 3890
+                "last_24h": 0,
+                "last_week": 0,
+                "last_month": 0
             }
         }
-        
+
+        for row in db.execute(stmt):
+            if not row.g_type:
+                summary["by_type"][row.type] = row.total
+            elif not row.g_status:
+                if row.status is not None:
+                    summary["by_status"][row.status] = row.total
+            elif not row.g_sector:
+                if row.sector is not None:
+                    summary["by_sector"][row.sector] = row.total
+            else:
+                summary["total_items"] = row.total
+                summary["last_updated"] = row.last_updated.isoformat() if row.last_updated else None
+                summary["data_freshness"] = {
+                    "last_24h": row.last_24h,
+                    "last_week": row.last_week,
+                    "last_month": row.last_month
+                }
+
         return summary
     
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
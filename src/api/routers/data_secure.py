@@ -23,7 +23,7 @@ router = APIRouter()
 
 
 @router.get("/data/ec-standards", response_model=APIResponse)
-async def get_ec_standards(
+def get_ec_standards(
     pagination: PaginationParams = Depends(),
     filters: EntityFilterParams = Depends(),
     date_range: DateRangeParams = Depends(),
@@ -73,7 +73,7 @@ async def get_ec_standards(
 
 
 @router.get("/data/ec-standards/{code}", response_model=APIResponse)
-async def get_ec_standard_by_code(
+def get_ec_standard_by_code(
     code: str = Path(..., pattern="^EC\\d{4}$", description="EC Standard code"),
     api_key: Optional[str] = Depends(get_optional_api_key),
     db: Session = Depends(get_db)
@@ -101,7 +101,7 @@ async def get_ec_standard_by_code(
 
 
 @router.post("/data/search", response_model=APIResponse)
-async def search_entities(
+def search_entities(
     search: SearchParams,
     entity_type: str = Query(..., pattern="^(ec_standard|certificador|centro|sector|all)$"),
     api_key: str = Depends(api_key_dependency),
@@ -190,7 +190,7 @@ async def export_data(
 
 
 @router.get("/data/stats", response_model=APIResponse)
-async def get_statistics(
+def get_statistics(
     api_key: Optional[str] = Depends(get_optional_api_key),
     db: Session = Depends(get_db)
 ):
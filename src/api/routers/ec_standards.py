@@ -1,39 +1,54 @@
 """
 EC Standards API endpoints.
 """
-from typing import List, Optional
+from typing import Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
-from src.models import get_session, ECStandardV2 as ECStandard
-from src.api.models import PaginationParams, ECStandardResponse, ECStandardDetail
+from src.models import get_db, ECStandardV2 as ECStandard, CertificadorV2 as Certificador
+from src.models.relations import ECEEC
+from src.api.response_cache import cache_response
+from src.api.models import PaginationParams, ECStandardResponse, ECStandardDetail, ECStandardPage
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/ec-standards", response_model=List[ECStandardResponse])
-async def list_ec_standards(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+@router.get("/ec-standards", response_model=ECStandardPage)
+@cache_response(expire=60)
+def list_ec_standards(
+    after: Optional[str] = Query(None, description="Return records after this EC code (next_cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
     vigente: Optional[bool] = Query(None, description="Filter by vigente status"),
     sector_id: Optional[int] = Query(None, description="Filter by sector ID"),
     search: Optional[str] = Query(None, description="Search in code and title"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
-    List EC standards with pagination and filtering.
+    List EC standards with keyset pagination and filtering.
     
-    - **skip**: Number of records to skip (for pagination)
+    - **after**: Cursor from the previous page's next_cursor
     - **limit**: Maximum number of records to return
     - **vigente**: Filter by active/inactive status
     - **sector_id**: Filter by sector ID
     - **search**: Search in EC code and title
     """
-    query = select(ECStandard)
+    # Select only the listed columns; rows map straight onto the response
+    query = select(
+        ECStandard.ec_clave,
+        ECStandard.titulo,
+        ECStandard.version,
+        ECStandard.vigente,
+        ECStandard.sector,
+        ECStandard.sector_id,
+        ECStandard.nivel,
+        ECStandard.duracion_horas,
+        ECStandard.last_seen
+    )
     
     # Apply filters
     if vigente is not None:
@@ -49,33 +64,30 @@ async def list_ec_standards(
             (ECStandard.titulo.ilike(search_term))
         )
     
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+    # Keyset pagination: seek past the cursor instead of scanning OFFSET rows;
+    # ordering matches idx_ec_sector_vigente_clave
+    if after is not None:
+        query = query.where(ECStandard.ec_clave > after)
+    query = query.order_by(ECStandard.ec_clave).limit(limit)
     
     # Execute query
-    result = db.execute(query)
-    standards = result.scalars().all()
-    
-    return [
-        ECStandardResponse(
-            ec_clave=ec.ec_clave,
-            titulo=ec.titulo,
-            version=ec.version,
-            vigente=ec.vigente,
-            sector=ec.sector,
-            sector_id=ec.sector_id,
-            nivel=ec.nivel,
-            duracion_horas=ec.duracion_horas,
-            last_seen=ec.last_seen
-        )
-        for ec in standards
-    ]
+    rows = db.execute(query).all()
+    
+    # Rows are already typed by the database; model_construct skips validation
+    # and the whole page is serialized in a single pydantic-core call
+    items = [ECStandardResponse.model_construct(**row._mapping) for row in rows]
+    page = ECStandardPage.model_construct(
+        items=items,
+        next_cursor=items[-1].ec_clave if len(items) == limit else None
+    )
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/ec-standards/{ec_clave}", response_model=ECStandardDetail)
-async def get_ec_standard(
+@cache_response(expire=60)
+def get_ec_standard(
     ec_clave: str,
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get detailed information for a specific EC standard.
@@ -87,24 +99,23 @@ async def get_ec_standard(
     if not ec:
         raise HTTPException(status_code=404, detail=f"EC standard {ec_clave} not found")
     
-    # Get related certificadores
-    from src.models.relations import ECEEC
-    from src.models import CertificadorV2 as Certificador
-    
-    certificadores = []
-    ece_relations = db.query(ECEEC).filter(ECEEC.ec_clave == ec_clave).all()
-    
-    for rel in ece_relations:
-        cert = db.query(Certificador).filter(Certificador.cert_id == rel.cert_id).first()
-        if cert:
-            certificadores.append({
-                'cert_id': cert.cert_id,
-                'tipo': cert.tipo,
-                'nombre_legal': cert.nombre_legal,
-                'estado': cert.estado
-            })
-    
-    return ECStandardDetail(
+    # Get related certificadores in one joined query
+    rows = db.execute(
+        select(
+            Certificador.cert_id,
+            Certificador.tipo,
+            Certificador.nombre_legal,
+            Certificador.estado
+        ).join(
+            ECEEC, ECEEC.cert_id == Certificador.cert_id
+        ).where(ECEEC.ec_clave == ec_clave)
+    ).all()
+    
+    certificadores = [dict(row._mapping) for row in rows]
+    
+    # Values come straight from typed DB columns, so skip validation and let
+    # pydantic-core serialize the model in one pass
+    detail = ECStandardDetail.model_construct(
         ec_clave=ec.ec_clave,
         titulo=ec.titulo,
         version=ec.version,
@@ -127,12 +138,14 @@ async def get_ec_standard(
         last_seen=ec.last_seen,
         certificadores=certificadores
     )
+    return Response(content=detail.model_dump_json(), media_type="application/json")
 
 
 @router.get("/ec-standards/{ec_clave}/certificadores")
-async def get_ec_certificadores(
+@cache_response(expire=60)
+def get_ec_certificadores(
     ec_clave: str,
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get all certificadores that can accredit this EC standard.
@@ -142,27 +155,24 @@ async def get_ec_certificadores(
     if not ec:
         raise HTTPException(status_code=404, detail=f"EC standard {ec_clave} not found")
     
-    from src.models.relations import ECEEC
-    from src.models import CertificadorV2 as Certificador
-    
-    certificadores = []
-    ece_relations = db.query(ECEEC).filter(ECEEC.ec_clave == ec_clave).all()
-    
-    for rel in ece_relations:
-        cert = db.query(Certificador).filter(Certificador.cert_id == rel.cert_id).first()
-        if cert:
-            certificadores.append({
-                'cert_id': cert.cert_id,
-                'tipo': cert.tipo,
-                'nombre_legal': cert.nombre_legal,
-                'siglas': cert.siglas,
-                'estado': cert.estado,
-                'estado_inegi': cert.estado_inegi,
-                'estatus': cert.estatus,
-                'correo': cert.correo,
-                'telefono': cert.telefono,
-                'acreditado_desde': rel.acreditado_desde
-            })
+    rows = db.execute(
+        select(
+            Certificador.cert_id,
+            Certificador.tipo,
+            Certificador.nombre_legal,
+            Certificador.siglas,
+            Certificador.estado,
+            Certificador.estado_inegi,
+            Certificador.estatus,
+            Certificador.correo,
+            Certificador.telefono,
+            ECEEC.acreditado_desde
+        ).join(
+            ECEEC, ECEEC.cert_id == Certificador.cert_id
+        ).where(ECEEC.ec_clave == ec_clave)
+    ).all()
+    
+    certificadores = [dict(row._mapping) for row in rows]
     
     return {
         'ec_clave': ec_clave,
@@ -173,10 +183,11 @@ async def get_ec_certificadores(
 
 
 @router.get("/ec-standards/{ec_clave}/centros")
-async def get_ec_centros(
+@cache_response(expire=60)
+def get_ec_centros(
     ec_clave: str,
     estado_inegi: Optional[str] = Query(None, description="Filter by INEGI state code"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get all evaluation centers that can evaluate this EC standard.
@@ -3,28 +3,162 @@ Cross-entity search API endpoints.
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, func, or_
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, func, or_, literal, union_all, bindparam
 from sqlalchemy.orm import Session
 
-from src.models import get_session
+from src.api.reference_data import SECTOR_BY_ID, COMITE_BY_ID
+from src.api.response_cache import cache_response
+from src.models import get_db, get_session
 from src.models import ECStandardV2 as ECStandard
 from src.models import CertificadorV2 as Certificador
 from src.models.centro import Centro
 from src.models.sector import Sector
 from src.models.comite import Comite
+from src.models.relations import ECEEC, CentroEC
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+@lru_cache(maxsize=64)
+def _estado_nombre(estado_inegi: str) -> str:
+    """
+    Resolve an INEGI state code to its display name.
+    
+    The domain is the 32 Mexican states, so names are cached per process.
+    Raises LookupError (which is not cached) when no entity has the state yet.
+    """
+    with get_session() as session:
+        for model in (Certificador, Centro):
+            nombre = session.execute(
+                select(model.estado).where(
+                    model.estado_inegi == estado_inegi,
+                    model.estado.isnot(None)
+                ).limit(1)
+            ).scalar()
+            if nombre:
+                return nombre
+    
+    raise LookupError(estado_inegi)
+
+
+SEARCH_ENTITY_TYPES = ("ec_standards", "certificadores", "centros", "sectores", "comites")
+
+
+def _search_branch(entity_type: str, columns: list, condition):
+    """
+    Build one search_all branch projected onto (entity_type, item).
+    
+    The item is a JSON object keyed by column name, so differently shaped
+    entities can share a single UNION ALL.
+    """
+    item = func.json_build_object(
+        *[arg for col in columns for arg in (literal(col.key), col)]
+    )
+    return select(
+        literal(entity_type).label('entity_type'),
+        item.label('item')
+    ).where(condition)
+
+
+# Statements are built once at import; per-request values are bound by name
+# (q, term, prefix, lim) so SQLAlchemy reuses the cached compiled SQL.
+_TERM = bindparam('term')
+_PREFIX = bindparam('prefix')
+_LIMIT = bindparam('lim')
+# Whole words match through the GIN-indexed search_vec columns; partial
+# words, short or misspelled queries and partial codes fall back to the
+# trigram-indexed substring ILIKE on the ID and name/title columns
+_TS_QUERY = func.websearch_to_tsquery('simple', bindparam('q'))
+
+SEARCH_BRANCHES = {
+    'ec_standards': _search_branch(
+        'ec_standards',
+        [ECStandard.ec_clave, ECStandard.titulo, ECStandard.vigente,
+         ECStandard.sector, ECStandard.nivel],
+        or_(
+            ECStandard.search_vec.op('@@')(_TS_QUERY),
+            ECStandard.ec_clave.ilike(_TERM),
+            ECStandard.titulo.ilike(_TERM)
+        )
+    ).limit(_LIMIT),
+    'certificadores': _search_branch(
+        'certificadores',
+        [Certificador.cert_id, Certificador.tipo, Certificador.nombre_legal,
+         Certificador.siglas, Certificador.estado, Certificador.estatus],
+        or_(
+            Certificador.search_vec.op('@@')(_TS_QUERY),
+            Certificador.cert_id.ilike(_TERM),
+            Certificador.nombre_legal.ilike(_TERM),
+            Certificador.siglas.ilike(_TERM)
+        )
+    ).limit(_LIMIT),
+    'centros': _search_branch(
+        'centros',
+        [Centro.centro_id, Centro.nombre, Centro.estado, Centro.municipio],
+        or_(
+            Centro.search_vec.op('@@')(_TS_QUERY),
+            Centro.centro_id.ilike(_TERM),
+            Centro.nombre.ilike(_TERM)
+        )
+    ).limit(_LIMIT),
+    'sectores': _search_branch(
+        'sectores',
+        [Sector.sector_id, Sector.nombre],
+        Sector.nombre.ilike(_TERM)
+    ).limit(_LIMIT),
+    'comites': _search_branch(
+        'comites',
+        [Comite.comite_id, Comite.nombre, Comite.sector_id],
+        Comite.nombre.ilike(_TERM)
+    ).limit(_LIMIT),
+}
+ALL_SEARCH_TYPES = frozenset(SEARCH_BRANCHES)
+
+# Prefix match on lower(col) so the text_pattern_ops indexes give range scans
+SUGGEST_STMTS = {
+    'ec_standards': select(
+        ECStandard.ec_clave,
+        ECStandard.titulo
+    ).where(
+        or_(
+            func.lower(ECStandard.ec_clave).like(_PREFIX),
+            ECStandard.titulo.ilike(_TERM)
+        )
+    ).limit(_LIMIT),
+    'certificadores': select(
+        Certificador.cert_id,
+        Certificador.nombre_legal,
+        Certificador.siglas
+    ).where(
+        or_(
+            func.lower(Certificador.cert_id).like(_PREFIX),
+            Certificador.nombre_legal.ilike(_TERM),
+            func.lower(Certificador.siglas).like(_PREFIX)
+        )
+    ).limit(_LIMIT),
+    'centros': select(
+        Centro.centro_id,
+        Centro.nombre
+    ).where(
+        or_(
+            func.lower(Centro.centro_id).like(_PREFIX),
+            Centro.nombre.ilike(_TERM)
+        )
+    ).limit(_LIMIT),
+}
 
 
 @router.get("/search")
-async def search_all(
+def search_all(
     q: str = Query(..., min_length=2, description="Search query (minimum 2 characters)"),
     entity_types: Optional[str] = Query(None, description="Comma-separated entity types to search"),
     limit: int = Query(10, ge=1, le=50, description="Max results per entity type"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Search across all entity types.
@@ -33,151 +167,53 @@ async def search_all(
     - **entity_types**: Filter by entity types (ec_standards, certificadores, centros, sectores, comites)
     - **limit**: Maximum results per entity type
     """
-    search_term = f"%{q}%"
-    results = {}
+    params = {'q': q, 'term': f"%{q}%", 'lim': limit}
     
-    # Parse entity types
+    # Parse entity types once into a set of known branches
     if entity_types:
-        types_to_search = [t.strip() for t in entity_types.split(",")]
+        types_to_search = frozenset(t.strip() for t in entity_types.split(",")) & SEARCH_BRANCHES.keys()
     else:
-        types_to_search = ["ec_standards", "certificadores", "centros", "sectores", "comites"]
-    
-    # Search EC Standards
-    if "ec_standards" in types_to_search:
-        ec_query = db.query(ECStandard).filter(
-            or_(
-                ECStandard.ec_clave.ilike(search_term),
-                ECStandard.titulo.ilike(search_term)
-            )
-        ).limit(limit)
-        
-        ec_results = [
-            {
-                'ec_clave': ec.ec_clave,
-                'titulo': ec.titulo,
-                'vigente': ec.vigente,
-                'sector': ec.sector,
-                'nivel': ec.nivel
-            }
-            for ec in ec_query.all()
-        ]
-        
-        if ec_results:
-            results['ec_standards'] = {
-                'count': len(ec_results),
-                'items': ec_results
-            }
-    
-    # Search Certificadores
-    if "certificadores" in types_to_search:
-        cert_query = db.query(Certificador).filter(
-            or_(
-                Certificador.cert_id.ilike(search_term),
-                Certificador.nombre_legal.ilike(search_term),
-                Certificador.siglas.ilike(search_term)
-            )
-        ).limit(limit)
-        
-        cert_results = [
-            {
-                'cert_id': cert.cert_id,
-                'tipo': cert.tipo,
-                'nombre_legal': cert.nombre_legal,
-                'siglas': cert.siglas,
-                'estado': cert.estado,
-                'estatus': cert.estatus
-            }
-            for cert in cert_query.all()
-        ]
-        
-        if cert_results:
-            results['certificadores'] = {
-                'count': len(cert_results),
-                'items': cert_results
-            }
+        types_to_search = ALL_SEARCH_TYPES
     
-    # Search Centros
-    if "centros" in types_to_search:
-        centro_query = db.query(Centro).filter(
-            or_(
-                Centro.centro_id.ilike(search_term),
-                Centro.nombre.ilike(search_term)
-            )
-        ).limit(limit)
-        
-        centro_results = [
-            {
-                'centro_id': centro.centro_id,
-                'nombre': centro.nombre,
-                'estado': centro.estado,
-                'municipio': centro.municipio
-            }
-            for centro in centro_query.all()
-        ]
-        
-        if centro_results:
-            results['centros'] = {
-                'count': len(centro_results),
-                'items': centro_results
-            }
+    # Each requested entity type is one limited branch of a single UNION ALL
+    selects = [
+        SEARCH_BRANCHES[entity_type]
+        for entity_type in SEARCH_ENTITY_TYPES
+        if entity_type in types_to_search
+    ]
     
-    # Search Sectores
-    if "sectores" in types_to_search:
-        sector_query = db.query(Sector).filter(
-            Sector.nombre.ilike(search_term)
-        ).limit(limit)
-        
-        sector_results = [
-            {
-                'sector_id': sector.sector_id,
-                'nombre': sector.nombre
-            }
-            for sector in sector_query.all()
-        ]
-        
-        if sector_results:
-            results['sectores'] = {
-                'count': len(sector_results),
-                'items': sector_results
-            }
+    grouped = {}
+    if selects:
+        for row in db.execute(union_all(*selects), params):
+            grouped.setdefault(row.entity_type, []).append(row.item)
     
-    # Search Comités
-    if "comites" in types_to_search:
-        comite_query = db.query(Comite).filter(
-            Comite.nombre.ilike(search_term)
-        ).limit(limit)
-        
-        comite_results = [
-            {
-                'comite_id': comite.comite_id,
-                'nombre': comite.nombre,
-                'sector_id': comite.sector_id
-            }
-            for comite in comite_query.all()
-        ]
-        
-        if comite_results:
-            results['comites'] = {
-                'count': len(comite_results),
-                'items': comite_results
-            }
+    # Keep the canonical entity order in the response
+    results = {
+        entity_type: {
+            'count': len(grouped[entity_type]),
+            'items': grouped[entity_type]
+        }
+        for entity_type in SEARCH_ENTITY_TYPES
+        if entity_type in grouped
+    }
     
     # Calculate total results
     total_results = sum(r['count'] for r in results.values())
     
-    return {
+    return ORJSONResponse({
         'query': q,
         'total_results': total_results,
         'results': results
-    }
+    })
 
 
 @router.get("/search/suggest")
-async def search_suggestions(
+@cache_response(expire=300)
+def search_suggestions(
     q: str = Query(..., min_length=2, max_length=50, description="Partial query for suggestions"),
     entity_type: str = Query(..., description="Entity type (ec_standards, certificadores, centros)"),
     limit: int = Query(5, ge=1, le=20, description="Max suggestions"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get search suggestions for autocomplete.
@@ -186,67 +222,40 @@ async def search_suggestions(
     - **entity_type**: Type of entity to search
     - **limit**: Maximum number of suggestions
     """
-    search_term = f"{q}%"  # Prefix match for suggestions
     suggestions = []
     
-    if entity_type == "ec_standards":
-        results = db.query(
-            ECStandard.ec_clave,
-            ECStandard.titulo
-        ).filter(
-            or_(
-                ECStandard.ec_clave.ilike(search_term),
-                ECStandard.titulo.ilike(f"%{q}%")
-            )
-        ).limit(limit).all()
+    if entity_type in SUGGEST_STMTS:
+        results = db.execute(
+            SUGGEST_STMTS[entity_type],
+            {'prefix': f"{q.lower()}%", 'term': f"%{q}%", 'lim': limit}
+        ).all()
         
-        suggestions = [
-            {
-                'value': r.ec_clave,
-                'label': f"{r.ec_clave} - {r.titulo[:50]}..."
-            }
-            for r in results
-        ]
-    
-    elif entity_type == "certificadores":
-        results = db.query(
-            Certificador.cert_id,
-            Certificador.nombre_legal,
-            Certificador.siglas
-        ).filter(
-            or_(
-                Certificador.cert_id.ilike(search_term),
-                Certificador.nombre_legal.ilike(f"%{q}%"),
-                Certificador.siglas.ilike(search_term)
-            )
-        ).limit(limit).all()
+        if entity_type == "ec_standards":
+            suggestions = [
+                {
+                    'value': r.ec_clave,
+                    'label': f"{r.ec_clave} - {r.titulo[:50]}..."
+                }
+                for r in results
+            ]
         
-        suggestions = [
-            {
-                'value': r.cert_id,
-                'label': f"{r.cert_id} - {r.nombre_legal}" + (f" ({r.siglas})" if r.siglas else "")
-            }
-            for r in results
-        ]
-    
-    elif entity_type == "centros":
-        results = db.query(
-            Centro.centro_id,
-            Centro.nombre
-        ).filter(
-            or_(
-                Centro.centro_id.ilike(search_term),
-                Centro.nombre.ilike(f"%{q}%")
-            )
-        ).limit(limit).all()
+        elif entity_type == "certificadores":
+            suggestions = [
+                {
+                    'value': r.cert_id,
+                    'label': f"{r.cert_id} - {r.nombre_legal}" + (f" ({r.siglas})" if r.siglas else "")
+                }
+                for r in results
+            ]
         
-        suggestions = [
-            {
-                'value': r.centro_id,
-                'label': f"{r.centro_id} - {r.nombre}"
-            }
-            for r in results
-        ]
+        elif entity_type == "centros":
+            suggestions = [
+                {
+                    'value': r.centro_id,
+                    'label': f"{r.centro_id} - {r.nombre}"
+                }
+                for r in results
+            ]
     
     return {
         'query': q,
@@ -256,11 +265,11 @@ async def search_suggestions(
 
 
 @router.get("/search/by-location")
-async def search_by_location(
+def search_by_location(
     estado_inegi: str = Query(..., description="INEGI state code"),
     municipio: Optional[str] = Query(None, description="Municipality name"),
     entity_types: Optional[str] = Query("certificadores,centros", description="Entity types to search"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Search entities by location (state and municipality).
@@ -274,78 +283,69 @@ async def search_by_location(
     
     # Search Certificadores
     if "certificadores" in types_to_search:
-        cert_query = db.query(Certificador).filter(
-            Certificador.estado_inegi == estado_inegi
-        )
-        
+        cert_filters = [Certificador.estado_inegi == estado_inegi]
         if municipio:
-            cert_query = cert_query.filter(
-                Certificador.municipio.ilike(f"%{municipio}%")
-            )
+            cert_filters.append(Certificador.municipio.ilike(f"%{municipio}%"))
+        
+        # Totals come from one grouped count; only the returned page is fetched
+        by_tipo = dict(
+            db.query(Certificador.tipo, func.count())
+            .filter(*cert_filters)
+            .group_by(Certificador.tipo)
+            .all()
+        )
         
-        certificadores = cert_query.all()
+        # Build items straight off the cursor; only the 20-row page is fetched
+        certificadores = db.execute(
+            select(
+                Certificador.cert_id,
+                Certificador.tipo,
+                Certificador.nombre_legal,
+                Certificador.municipio,
+                Certificador.telefono,
+                Certificador.correo
+            ).where(*cert_filters).limit(20)
+        )
         
         results['certificadores'] = {
-            'count': len(certificadores),
+            'count': sum(by_tipo.values()),
             'by_tipo': {
-                'ECE': len([c for c in certificadores if c.tipo == 'ECE']),
-                'OC': len([c for c in certificadores if c.tipo == 'OC'])
+                'ECE': by_tipo.get('ECE', 0),
+                'OC': by_tipo.get('OC', 0)
             },
-            'items': [
-                {
-                    'cert_id': c.cert_id,
-                    'tipo': c.tipo,
-                    'nombre_legal': c.nombre_legal,
-                    'municipio': c.municipio,
-                    'telefono': c.telefono,
-                    'correo': c.correo
-                }
-                for c in certificadores[:20]  # Limit to 20 items
-            ]
+            'items': [dict(row) for row in certificadores.mappings()]
         }
     
     # Search Centros
     if "centros" in types_to_search:
-        centro_query = db.query(Centro).filter(
-            Centro.estado_inegi == estado_inegi
-        )
-        
+        centro_filters = [Centro.estado_inegi == estado_inegi]
         if municipio:
-            centro_query = centro_query.filter(
-                Centro.municipio.ilike(f"%{municipio}%")
-            )
+            centro_filters.append(Centro.municipio.ilike(f"%{municipio}%"))
+        
+        centro_count = db.query(func.count(Centro.id)).filter(*centro_filters).scalar()
         
-        centros = centro_query.all()
+        centros = db.execute(
+            select(
+                Centro.centro_id,
+                Centro.nombre,
+                Centro.municipio,
+                Centro.telefono,
+                Centro.correo
+            ).where(*centro_filters).limit(20)
+        )
         
         results['centros'] = {
-            'count': len(centros),
-            'items': [
-                {
-                    'centro_id': c.centro_id,
-                    'nombre': c.nombre,
-                    'municipio': c.municipio,
-                    'telefono': c.telefono,
-                    'correo': c.correo
-                }
-                for c in centros[:20]  # Limit to 20 items
-            ]
+            'count': centro_count,
+            'items': [dict(row) for row in centros.mappings()]
         }
     
     # Get location name
     estado_nombre = "Unknown"
-    if results:
-        if 'certificadores' in results and results['certificadores']['items']:
-            first_item = db.query(Certificador).filter(
-                Certificador.estado_inegi == estado_inegi
-            ).first()
-            if first_item:
-                estado_nombre = first_item.estado
-        elif 'centros' in results and results['centros']['items']:
-            first_item = db.query(Centro).filter(
-                Centro.estado_inegi == estado_inegi
-            ).first()
-            if first_item:
-                estado_nombre = first_item.estado
+    if any(r['items'] for r in results.values()):
+        try:
+            estado_nombre = _estado_nombre(estado_inegi)
+        except LookupError:
+            pass
     
     return {
         'location': {
@@ -358,10 +358,10 @@ async def search_by_location(
 
 
 @router.get("/search/related/{entity_type}/{entity_id}")
-async def search_related_entities(
+def search_related_entities(
     entity_type: str,
     entity_id: str,
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Find entities related to a specific entity.
@@ -373,9 +373,17 @@ async def search_related_entities(
     
     if entity_type == "ec_standard":
         # Verify EC exists
-        ec = db.query(ECStandard).filter(ECStandard.ec_clave == entity_id).first()
+        ec = db.execute(
+            select(
+                ECStandard.ec_clave,
+                ECStandard.titulo,
+                ECStandard.vigente,
+                ECStandard.sector_id,
+                ECStandard.comite_id
+            ).where(ECStandard.ec_clave == entity_id)
+        ).one_or_none()
         if not ec:
-            return {'error': f'EC Standard {entity_id} not found'}
+            return ORJSONResponse({'error': f'EC Standard {entity_id} not found'})
         
         related['ec_standard'] = {
             'ec_clave': ec.ec_clave,
@@ -384,73 +392,61 @@ async def search_related_entities(
         }
         
         # Get related certificadores
-        from src.models.relations import ECEEC
-        ece_relations = db.query(ECEEC).filter(ECEEC.ec_clave == entity_id).all()
-        cert_ids = [rel.cert_id for rel in ece_relations]
+        certificadores = db.execute(
+            select(
+                Certificador.cert_id,
+                Certificador.nombre_legal,
+                Certificador.tipo,
+                Certificador.estado
+            ).join(
+                ECEEC, ECEEC.cert_id == Certificador.cert_id
+            ).where(ECEEC.ec_clave == entity_id)
+        ).all()
         
-        if cert_ids:
-            certificadores = db.query(Certificador).filter(
-                Certificador.cert_id.in_(cert_ids)
-            ).all()
-            
+        if certificadores:
             related['certificadores'] = {
                 'count': len(certificadores),
-                'items': [
-                    {
-                        'cert_id': c.cert_id,
-                        'nombre_legal': c.nombre_legal,
-                        'tipo': c.tipo,
-                        'estado': c.estado
-                    }
-                    for c in certificadores
-                ]
+                'items': [dict(c._mapping) for c in certificadores]
             }
         
         # Get related centros
-        from src.models.relations import CentroEC
-        centro_relations = db.query(CentroEC).filter(CentroEC.ec_clave == entity_id).all()
-        centro_ids = [rel.centro_id for rel in centro_relations]
+        centros = db.execute(
+            select(
+                Centro.centro_id,
+                Centro.nombre,
+                Centro.estado,
+                Centro.municipio
+            ).join(
+                CentroEC, CentroEC.centro_id == Centro.centro_id
+            ).where(CentroEC.ec_clave == entity_id)
+        ).all()
         
-        if centro_ids:
-            centros = db.query(Centro).filter(
-                Centro.centro_id.in_(centro_ids)
-            ).all()
-            
+        if centros:
             related['centros'] = {
                 'count': len(centros),
-                'items': [
-                    {
-                        'centro_id': c.centro_id,
-                        'nombre': c.nombre,
-                        'estado': c.estado,
-                        'municipio': c.municipio
-                    }
-                    for c in centros
-                ]
+                'items': [dict(c._mapping) for c in centros]
             }
         
-        # Get sector and committee
-        if ec.sector_id:
-            sector = db.query(Sector).filter(Sector.sector_id == ec.sector_id).first()
-            if sector:
-                related['sector'] = {
-                    'sector_id': sector.sector_id,
-                    'nombre': sector.nombre
-                }
+        # Sector and committee come from the startup-loaded catalogues
+        sector = SECTOR_BY_ID.get(ec.sector_id)
+        if sector:
+            related['sector'] = sector
         
-        if ec.comite_id:
-            comite = db.query(Comite).filter(Comite.comite_id == ec.comite_id).first()
-            if comite:
-                related['comite'] = {
-                    'comite_id': comite.comite_id,
-                    'nombre': comite.nombre
-                }
+        comite = COMITE_BY_ID.get(ec.comite_id)
+        if comite:
+            related['comite'] = comite
     
     elif entity_type == "certificador":
         # Similar logic for certificador relationships
-        cert = db.query(Certificador).filter(Certificador.cert_id == entity_id).first()
+        cert = db.execute(
+            select(
+                Certificador.cert_id,
+                Certificador.nombre_legal,
+                Certificador.tipo
+            ).where(Certificador.cert_id == entity_id)
+        ).first()
         if not cert:
-            return {'error': f'Certificador {entity_id} not found'}
+            return ORJSONResponse({'error': f'Certificador {entity_id} not found'})
         
         related['certificador'] = {
             'cert_id': cert.cert_id,
@@ -460,25 +456,20 @@ async def search_related_entities(
         
         # Get EC standards if ECE type
         if cert.tipo == 'ECE':
-            from src.models.relations import ECEEC
-            ece_relations = db.query(ECEEC).filter(ECEEC.cert_id == entity_id).all()
-            ec_claves = [rel.ec_clave for rel in ece_relations]
+            standards = db.execute(
+                select(
+                    ECStandard.ec_clave,
+                    ECStandard.titulo,
+                    ECStandard.vigente
+                ).join(
+                    ECEEC, ECEEC.ec_clave == ECStandard.ec_clave
+                ).where(ECEEC.cert_id == entity_id)
+            ).all()
             
-            if ec_claves:
-                standards = db.query(ECStandard).filter(
-                    ECStandard.ec_clave.in_(ec_claves)
-                ).all()
-                
+            if standards:
                 related['ec_standards'] = {
                     'count': len(standards),
-                    'items': [
-                        {
-                            'ec_clave': ec.ec_clave,
-                            'titulo': ec.titulo,
-                            'vigente': ec.vigente
-                        }
-                        for ec in standards
-                    ]
+                    'items': [dict(ec._mapping) for ec in standards]
                 }
     
-    return related
\ No newline at end of file
+    return ORJSONResponse(related)
@@ -1,28 +1,69 @@
 """
 Sectores and Comités API endpoints.
 """
+import os
 from typing import List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, func, text, lambda_stmt
+from sqlalchemy.orm import Session, raiseload
 
-from src.models import get_session
+from src.models import get_db, ECStandardV2 as ECStandard
 from src.models.sector import Sector
 from src.models.comite import Comite
+from src.api.response_cache import cache_response
 from src.api.models import SectorResponse, SectorDetail, ComiteResponse, ComiteDetail
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Outside production, any relationship touched on a fetched Sector/Comite
+# raises instead of silently issuing a lazy-load query per row
+STRICT_LOADING = (
+    [raiseload("*")] if os.getenv("ENVIRONMENT", "development") != "production" else []
+)
+
+# EC standard counts per sector / committee and committee counts per sector,
+# aggregated once and joined to the listing or stats rows
+_EC_COUNTS_BY_SECTOR = select(
+    ECStandard.sector_id,
+    func.count(ECStandard.ec_clave).label('ec_count')
+).group_by(ECStandard.sector_id).subquery()
+_EC_COUNTS_BY_COMITE = select(
+    ECStandard.comite_id,
+    func.count(ECStandard.ec_clave).label('ec_count')
+).group_by(ECStandard.comite_id).subquery()
+_COMITE_COUNTS_BY_SECTOR = select(
+    Comite.sector_id,
+    func.count(Comite.comite_id).label('comite_count')
+).group_by(Comite.sector_id).subquery()
+
+# Scalar counts as plain SQL, built once so the compiled form is reused
+_COUNT_EC_BY_SECTOR = text(
+    "SELECT COUNT(ec_clave) FROM ec_standards_v2 WHERE sector_id = :sector_id"
+)
+_COUNT_EC_BY_COMITE = text(
+    "SELECT COUNT(ec_clave) FROM ec_standards_v2 WHERE comite_id = :comite_id"
+)
+_SUMMARY_COUNTS = text("""
+    SELECT
+        (SELECT COUNT(sector_id) FROM sectors) AS total_sectors,
+        (SELECT COUNT(comite_id) FROM comites) AS total_comites,
+        COUNT(DISTINCT ec_clave) AS total_standards,
+        COUNT(ec_clave) FILTER (WHERE vigente) AS vigente_standards
+    FROM ec_standards_v2
+""")
 
 
 @router.get("/sectores", response_model=List[SectorResponse])
-async def list_sectores(
+@cache_response(expire=3600)
+def list_sectores(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
     search: Optional[str] = Query(None, description="Search in sector name"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     List productive sectors with pagination.
@@ -31,69 +72,72 @@ async def list_sectores(
     - **limit**: Maximum number of records to return
     - **search**: Search in sector name
     """
-    query = select(Sector)
+    # lambda_stmt caches the compiled SQL per combination of enabled filters;
+    # closure variables are extracted as bound parameters on each call.
+    query = lambda_stmt(lambda: select(
+        Sector,
+        func.coalesce(_EC_COUNTS_BY_SECTOR.c.ec_count, 0).label('ec_count')
+    ).outerjoin(
+        _EC_COUNTS_BY_SECTOR, _EC_COUNTS_BY_SECTOR.c.sector_id == Sector.sector_id
+    ))
     
     # Apply filters
     if search:
+        # Leading-wildcard ILIKE is served by the nombre pg_trgm GIN index
         search_term = f"%{search}%"
-        query = query.where(Sector.nombre.ilike(search_term))
+        query += lambda q: q.where(Sector.nombre.ilike(search_term))
     
-    # Apply pagination
-    query = query.offset(skip).limit(limit).order_by(Sector.sector_id)
+    # Apply pagination; one row per sector, so the page is not skewed
+    query += lambda q: q.order_by(Sector.sector_id).offset(skip).limit(limit)
     
     # Execute query
-    result = db.execute(query)
-    sectores = result.scalars().all()
-    
-    # Get EC standard counts for each sector
-    from src.models import ECStandardV2 as ECStandard
-    sector_counts = {}
-    for sector in sectores:
-        count = db.query(func.count(ECStandard.ec_clave)).filter(
-            ECStandard.sector_id == sector.sector_id
-        ).scalar()
-        sector_counts[sector.sector_id] = count
+    rows = db.execute(query).all()
     
     return [
-        SectorResponse(
+        SectorResponse.model_construct(
             sector_id=sector.sector_id,
             nombre=sector.nombre,
             descripcion=sector.descripcion,
-            total_ec_standards=sector_counts.get(sector.sector_id, 0),
+            total_ec_standards=ec_count,
             last_seen=sector.last_seen
         )
-        for sector in sectores
+        for sector, ec_count in rows
     ]
 
 
 @router.get("/sectores/{sector_id}", response_model=SectorDetail)
-async def get_sector(
+def get_sector(
     sector_id: int,
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get detailed information for a specific sector.
     
     - **sector_id**: The sector ID
     """
-    sector = db.query(Sector).filter(Sector.sector_id == sector_id).first()
+    sector = db.execute(
+        select(Sector).options(*STRICT_LOADING).where(Sector.sector_id == sector_id)
+    ).scalar_one_or_none()
     
     if not sector:
         raise HTTPException(status_code=404, detail=f"Sector {sector_id} not found")
     
     # Get committees in this sector
-    comites = db.query(Comite).filter(Comite.sector_id == sector_id).all()
+    comites = db.execute(
+        select(Comite).options(*STRICT_LOADING).where(Comite.sector_id == sector_id)
+    ).scalars().all()
     
     # Get EC standards count
-    from src.models import ECStandardV2 as ECStandard
-    ec_count = db.query(func.count(ECStandard.ec_clave)).filter(
-        ECStandard.sector_id == sector_id
-    ).scalar()
-    
-    # Get sample EC standards
-    sample_standards = db.query(ECStandard).filter(
-        ECStandard.sector_id == sector_id
-    ).limit(10).all()
+    ec_count = db.execute(_COUNT_EC_BY_SECTOR, {'sector_id': sector_id}).scalar()
+    
+    # Get sample EC standards; only the displayed columns
+    sample_standards = db.execute(
+        select(
+            ECStandard.ec_clave,
+            ECStandard.titulo,
+            ECStandard.vigente
+        ).where(ECStandard.sector_id == sector_id).limit(10)
+    ).all()
     
     return SectorDetail(
         sector_id=sector.sector_id,
@@ -111,51 +155,60 @@ async def get_sector(
             }
             for c in comites
         ],
-        sample_ec_standards=[
-            {
-                'ec_clave': ec.ec_clave,
-                'titulo': ec.titulo,
-                'vigente': ec.vigente
-            }
-            for ec in sample_standards
-        ]
+        sample_ec_standards=[dict(ec._mapping) for ec in sample_standards]
     )
 
 
 @router.get("/sectores/{sector_id}/ec-standards")
-async def get_sector_standards(
+def get_sector_standards(
     sector_id: int,
     vigente: Optional[bool] = Query(None, description="Filter by vigente status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get all EC standards in a specific sector.
     """
-    # Verify sector exists
-    sector = db.query(Sector).filter(Sector.sector_id == sector_id).first()
-    if not sector:
-        raise HTTPException(status_code=404, detail=f"Sector {sector_id} not found")
-    
-    from src.models import ECStandardV2 as ECStandard
-    
-    query = db.query(ECStandard).filter(ECStandard.sector_id == sector_id)
+    # The sector row rides along as uncorrelated subqueries and the window
+    # count carries the unpaginated total, so a normal page is one statement
+    query = select(
+        ECStandard.ec_clave,
+        ECStandard.titulo,
+        ECStandard.version,
+        ECStandard.vigente,
+        ECStandard.comite,
+        ECStandard.nivel,
+        ECStandard.duracion_horas,
+        func.count().over().label('total'),
+        select(Sector.nombre).where(Sector.sector_id == sector_id).scalar_subquery().label('nombre')
+    ).where(ECStandard.sector_id == sector_id)
     
     if vigente is not None:
-        query = query.filter(ECStandard.vigente == vigente)
-    
-    # Get total count before pagination
-    total = query.count()
+        query = query.where(ECStandard.vigente == vigente)
     
     # Apply pagination
-    standards = query.offset(skip).limit(limit).all()
-    
-    return {
+    rows = db.execute(query.order_by(ECStandard.ec_clave).offset(skip).limit(limit)).all()
+    
+    if rows and rows[0].nombre is not None:
+        sector, total = rows[0], rows[0].total
+    else:
+        # Empty page: check the sector exists and count its standards directly
+        count = select(func.count()).select_from(
+            query.with_only_columns(ECStandard.ec_clave).subquery()
+        ).scalar_subquery()
+        sector = db.execute(
+            select(Sector.nombre, count.label('total')).where(Sector.sector_id == sector_id)
+        ).one_or_none()
+        if not sector:
+            raise HTTPException(status_code=404, detail=f"Sector {sector_id} not found")
+        total = sector.total
+    
+    return ORJSONResponse({
         'sector_id': sector_id,
         'nombre': sector.nombre,
         'total_standards': total,
-        'showing': len(standards),
+        'showing': len(rows),
         'ec_standards': [
             {
                 'ec_clave': ec.ec_clave,
@@ -166,18 +219,19 @@ async def get_sector_standards(
                 'nivel': ec.nivel,
                 'duracion_horas': ec.duracion_horas
             }
-            for ec in standards
+            for ec in rows
         ]
-    }
+    })
 
 
 @router.get("/comites", response_model=List[ComiteResponse])
-async def list_comites(
+@cache_response(expire=3600)
+def list_comites(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
     sector_id: Optional[int] = Query(None, description="Filter by sector ID"),
     search: Optional[str] = Query(None, description="Search in committee name"),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     List management committees with pagination and filtering.
@@ -187,64 +241,59 @@ async def list_comites(
     - **sector_id**: Filter by sector ID
     - **search**: Search in committee name
     """
-    query = select(Comite)
+    # Sector name and count come back on the same row as the committee;
+    # lambda_stmt caches the compiled SQL per combination of enabled filters
+    query = lambda_stmt(lambda: select(
+        Comite,
+        Sector.nombre.label('sector_nombre'),
+        func.coalesce(_EC_COUNTS_BY_COMITE.c.ec_count, 0).label('ec_count')
+    ).outerjoin(
+        Sector, Sector.sector_id == Comite.sector_id
+    ).outerjoin(
+        _EC_COUNTS_BY_COMITE, _EC_COUNTS_BY_COMITE.c.comite_id == Comite.comite_id
+    ))
     
     # Apply filters
     if sector_id is not None:
-        query = query.where(Comite.sector_id == sector_id)
+        query += lambda q: q.where(Comite.sector_id == sector_id)
     
     if search:
+        # Leading-wildcard ILIKE is served by the nombre pg_trgm GIN index
         search_term = f"%{search}%"
-        query = query.where(Comite.nombre.ilike(search_term))
+        query += lambda q: q.where(Comite.nombre.ilike(search_term))
     
-    # Apply pagination
-    query = query.offset(skip).limit(limit).order_by(Comite.comite_id)
+    # Apply pagination; one row per committee, so the page is not skewed
+    query += lambda q: q.order_by(Comite.comite_id).offset(skip).limit(limit)
     
     # Execute query
-    result = db.execute(query)
-    comites = result.scalars().all()
-    
-    # Get EC standard counts for each committee
-    from src.models import ECStandardV2 as ECStandard
-    comite_counts = {}
-    for comite in comites:
-        count = db.query(func.count(ECStandard.ec_clave)).filter(
-            ECStandard.comite_id == comite.comite_id
-        ).scalar()
-        comite_counts[comite.comite_id] = count
-    
-    # Get sector names
-    sector_names = {}
-    for comite in comites:
-        if comite.sector_id and comite.sector_id not in sector_names:
-            sector = db.query(Sector).filter(Sector.sector_id == comite.sector_id).first()
-            if sector:
-                sector_names[comite.sector_id] = sector.nombre
+    rows = db.execute(query).all()
     
     return [
-        ComiteResponse(
+        ComiteResponse.model_construct(
             comite_id=comite.comite_id,
             nombre=comite.nombre,
             sector_id=comite.sector_id,
-            sector_nombre=sector_names.get(comite.sector_id, "Unknown"),
-            total_ec_standards=comite_counts.get(comite.comite_id, 0),
+            sector_nombre=sector_nombre or "Unknown",
+            total_ec_standards=ec_count,
             last_seen=comite.last_seen
         )
-        for comite in comites
+        for comite, sector_nombre, ec_count in rows
     ]
 
 
 @router.get("/comites/{comite_id}", response_model=ComiteDetail)
-async def get_comite(
+def get_comite(
     comite_id: int,
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get detailed information for a specific committee.
     
     - **comite_id**: The committee ID
     """
-    comite = db.query(Comite).filter(Comite.comite_id == comite_id).first()
+    comite = db.execute(
+        select(Comite).options(*STRICT_LOADING).where(Comite.comite_id == comite_id)
+    ).scalar_one_or_none()
     
     if not comite:
         raise HTTPException(status_code=404, detail=f"Comité {comite_id} not found")
@@ -252,7 +301,9 @@ async def get_comite(
     # Get sector info
     sector_info = None
     if comite.sector_id:
-        sector = db.query(Sector).filter(Sector.sector_id == comite.sector_id).first()
+        sector = db.execute(
+            select(Sector).options(*STRICT_LOADING).where(Sector.sector_id == comite.sector_id)
+        ).scalar_one_or_none()
         if sector:
             sector_info = {
                 'sector_id': sector.sector_id,
@@ -260,15 +311,16 @@ async def get_comite(
             }
     
     # Get EC standards count
-    from src.models import ECStandardV2 as ECStandard
-    ec_count = db.query(func.count(ECStandard.ec_clave)).filter(
-        ECStandard.comite_id == comite_id
-    ).scalar()
-    
-    # Get sample EC standards
-    sample_standards = db.query(ECStandard).filter(
-        ECStandard.comite_id == comite_id
-    ).limit(10).all()
+    ec_count = db.execute(_COUNT_EC_BY_COMITE, {'comite_id': comite_id}).scalar()
+    
+    # Get sample EC standards; only the displayed columns
+    sample_standards = db.execute(
+        select(
+            ECStandard.ec_clave,
+            ECStandard.titulo,
+            ECStandard.vigente
+        ).where(ECStandard.comite_id == comite_id).limit(10)
+    ).all()
     
     return ComiteDetail(
         comite_id=comite.comite_id,
@@ -281,52 +333,62 @@ async def get_comite(
         last_seen=comite.last_seen,
         sector=sector_info,
         total_ec_standards=ec_count,
-        sample_ec_standards=[
-            {
-                'ec_clave': ec.ec_clave,
-                'titulo': ec.titulo,
-                'vigente': ec.vigente
-            }
-            for ec in sample_standards
-        ]
+        sample_ec_standards=[dict(ec._mapping) for ec in sample_standards]
     )
 
 
 @router.get("/comites/{comite_id}/ec-standards")
-async def get_comite_standards(
+def get_comite_standards(
     comite_id: int,
     vigente: Optional[bool] = Query(None, description="Filter by vigente status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_session)
+    db: Session = Depends(get_db)
 ):
     """
     Get all EC standards managed by a specific committee.
     """
-    # Verify comite exists
-    comite = db.query(Comite).filter(Comite.comite_id == comite_id).first()
-    if not comite:
-        raise HTTPException(status_code=404, detail=f"Comité {comite_id} not found")
-    
-    from src.models import ECStandardV2 as ECStandard
-    
-    query = db.query(ECStandard).filter(ECStandard.comite_id == comite_id)
+    # The comite row rides along as uncorrelated subqueries and the window
+    # count carries the unpaginated total, so a normal page is one statement
+    query = select(
+        ECStandard.ec_clave,
+        ECStandard.titulo,
+        ECStandard.version,
+        ECStandard.vigente,
+        ECStandard.sector,
+        ECStandard.nivel,
+        ECStandard.duracion_horas,
+        func.count().over().label('total'),
+        select(Comite.nombre).where(Comite.comite_id == comite_id).scalar_subquery().label('nombre'),
+        select(Comite.sector_id).where(Comite.comite_id == comite_id).scalar_subquery().label('sector_id')
+    ).where(ECStandard.comite_id == comite_id)
     
     if vigente is not None:
-        query = query.filter(ECStandard.vigente == vigente)
-    
-    # Get total count before pagination
-    total = query.count()
+        query = query.where(ECStandard.vigente == vigente)
     
     # Apply pagination
-    standards = query.offset(skip).limit(limit).all()
-    
-    return {
+    rows = db.execute(query.order_by(ECStandard.ec_clave).offset(skip).limit(limit)).all()
+    
+    if rows and rows[0].nombre is not None:
+        comite, total = rows[0], rows[0].total
+    else:
+        # Empty page: check the comite exists and count its standards directly
+        count = select(func.count()).select_from(
+            query.with_only_columns(ECStandard.ec_clave).subquery()
+        ).scalar_subquery()
+        comite = db.execute(
+            select(Comite.nombre, Comite.sector_id, count.label('total')).where(Comite.comite_id == comite_id)
+        ).one_or_none()
+        if not comite:
+            raise HTTPException(status_code=404, detail=f"Comité {comite_id} not found")
+        total = comite.total
+    
+    return ORJSONResponse({
         'comite_id': comite_id,
         'nombre': comite.nombre,
         'sector_id': comite.sector_id,
         'total_standards': total,
-        'showing': len(standards),
+        'showing': len(rows),
         'ec_standards': [
             {
                 'ec_clave': ec.ec_clave,
@@ -337,54 +399,63 @@ async def get_comite_standards(
                 'nivel': ec.nivel,
                 'duracion_horas': ec.duracion_horas
             }
-            for ec in standards
+            for ec in rows
         ]
-    }
+    })
 
 
 @router.get("/sectores/stats/summary")
-async def get_sectores_stats(
-    db: Session = Depends(get_session)
+@cache_response(expire=3600)
+def get_sectores_stats(
+    db: Session = Depends(get_db)
 ):
     """
     Get overall statistics for sectors and committees.
     """
-    from src.models import ECStandardV2 as ECStandard
-    from src.models.relations import ECSector
-    
-    # Get sector statistics
-    sector_stats = db.query(
-        Sector.sector_id,
-        Sector.nombre,
-        func.count(func.distinct(ECStandard.ec_clave)).label('total_standards'),
-        func.count(func.distinct(Comite.comite_id)).label('total_comites')
-    ).outerjoin(
-        ECStandard, ECStandard.sector_id == Sector.sector_id
-    ).outerjoin(
-        Comite, Comite.sector_id == Sector.sector_id
-    ).group_by(
-        Sector.sector_id,
-        Sector.nombre
+    # Top 10 sectors by EC count; each count is aggregated on its own table
+    # and joined per sector, avoiding DISTINCT over a standards x comites product
+    total_standards = func.coalesce(_EC_COUNTS_BY_SECTOR.c.ec_count, 0).label('total_standards')
+    sector_stats = db.execute(
+        select(
+            Sector.sector_id,
+            Sector.nombre,
+            total_standards,
+            func.coalesce(_COMITE_COUNTS_BY_SECTOR.c.comite_count, 0).label('total_comites')
+        ).outerjoin(
+            _EC_COUNTS_BY_SECTOR, _EC_COUNTS_BY_SECTOR.c.sector_id == Sector.sector_id
+        ).outerjoin(
+            _COMITE_COUNTS_BY_SECTOR, _COMITE_COUNTS_BY_SECTOR.c.sector_id == Sector.sector_id
+        ).order_by(
+            total_standards.desc(),
+            Sector.sector_id
+        ).limit(10)
     ).all()
     
     # Convert to list
-    sectors_data = [
-        {
-            'sector_id': stat.sector_id,
-            'nombre': stat.nombre,
-            'total_standards': stat.total_standards,
-            'total_comites': stat.total_comites
-        }
-        for stat in sorted(sector_stats, key=lambda x: x.total_standards, reverse=True)
-    ]
+    sectors_data = [dict(stat._mapping) for stat in sector_stats]
+    
+    # Sectors with no standards, straight from an aggregate in the database
+    empty_sectors = db.execute(
+        select(
+            Sector.sector_id,
+            Sector.nombre,
+            select(func.count(Comite.comite_id)).where(
+                Comite.sector_id == Sector.sector_id
+            ).scalar_subquery().label('total_comites')
+        ).outerjoin(
+            ECStandard, ECStandard.sector_id == Sector.sector_id
+        ).group_by(
+            Sector.sector_id,
+            Sector.nombre
+        ).having(
+            func.count(ECStandard.ec_clave) == 0
+        )
+    ).all()
     
     # Get overall counts
-    total_sectors = db.query(func.count(Sector.sector_id)).scalar()
-    total_comites = db.query(func.count(Comite.comite_id)).scalar()
-    total_standards = db.query(func.count(func.distinct(ECStandard.ec_clave))).scalar()
-    vigente_standards = db.query(func.count(ECStandard.ec_clave)).filter(
-        ECStandard.vigente == True
-    ).scalar()
+    total_sectors, total_comites, total_standards, vigente_standards = db.execute(
+        _SUMMARY_COUNTS
+    ).one()
     
     return {
         'summary': {
@@ -394,8 +465,14 @@ async def get_sectores_stats(
             'vigente_ec_standards': vigente_standards,
             'inactive_ec_standards': total_standards - vigente_standards
         },
-        'top_sectors': sectors_data[:10],  # Top 10 sectors by EC count
+        'top_sectors': sectors_data,
         'sectors_without_standards': [
-            s for s in sectors_data if s['total_standards'] == 0
+            {
+                'sector_id': sector.sector_id,
+                'nombre': sector.nombre,
+                'total_standards': 0,
+                'total_comites': sector.total_comites
+            }
+            for sector in empty_sectors
         ]
     }
\ No newline at end of file
@@ -2,6 +2,7 @@
 Spider control API endpoints.
 """
 from fastapi import APIRouter, HTTPException, Request, BackgroundTasks, Depends
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
 
 from ..models import SpiderConfig, SpiderResponse, SpiderStatus
@@ -27,6 +28,13 @@ async def start_spider(
                 detail="Spider is already running. Stop it first."
             )
         
+        if await run_in_threadpool(spider_manager.is_overloaded):
+            raise HTTPException(
+                status_code=429,
+                detail="Scheduled harvests are queued. Try again later.",
+                headers={"Retry-After": "300"}
+            )
+        
         success = await spider_manager.start(config)
         
         if success:
@@ -42,6 +50,8 @@ async def start_spider(
                 detail="Failed to start spider"
             )
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,16 +1,21 @@
 """
 Statistics and monitoring API endpoints.
 """
-from fastapi import APIRouter, Request
-from typing import Dict, Any, List
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, List, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+import asyncio
+import numpy as np
 import psutil
 import time
 
 from ..models import SpiderStats, SystemHealth
+from ..response_cache import cache_response
 from ..spider_manager import SpiderManager
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/stats", response_model=SpiderStats)
@@ -25,18 +30,16 @@ async def get_spider_stats(request: Request):
 
 
 @router.get("/health", response_model=SystemHealth)
+@cache_response(expire=15)
 async def get_system_health():
     """Get system health status including database, Redis, and resources."""
     health = SystemHealth()
     
     try:
-        # Check memory usage
-        memory = psutil.virtual_memory()
-        health.memory_usage = memory.percent
-        
-        # Check disk usage
-        disk = psutil.disk_usage('/')
-        health.disk_usage = (disk.used / disk.total) * 100
+        # Resource usage comes from the background sampler; no syscalls here
+        sample = _resource_sample or _sample_resources()
+        health.memory_usage = sample["memory"]
+        health.disk_usage = sample["disk"]
         
         # TODO: Add actual database and Redis health checks
         health.database = "healthy"
@@ -49,39 +52,80 @@ async def get_system_health():
     return health
 
 
+# Latest memory/disk usage, refreshed by sample_resources_forever()
+_resource_sample: Dict[str, float] = {}
+
+
+def _sample_resources() -> Dict[str, float]:
+    """Read memory and disk usage percentages."""
+    disk = psutil.disk_usage('/')
+    return {
+        "memory": psutil.virtual_memory().percent,
+        "disk": (disk.used / disk.total) * 100
+    }
+
+
+async def sample_resources_forever(interval: float = 2.0):
+    """Refresh the resource sample every ``interval`` seconds until cancelled."""
+    while True:
+        try:
+            _resource_sample.update(_sample_resources())
+        except Exception as e:
+            print(f"Resource sampling error: {e}")
+        await asyncio.sleep(interval)
+
+
 @router.get("/metrics/history")
-async def get_metrics_history(hours: int = 24):
+@cache_response(expire=300)
+async def get_metrics_history(hours: int = Query(24, ge=1, le=168, description="Hours of history (max one week)")):
     """Get historical performance metrics."""
     try:
         # Mock data for now - replace with actual metrics collection
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=hours)
+        end_time = np.datetime64(datetime.now(), 'us')
+        series = _mock_metric_series(hours)
+        n = len(series[0])
         
-        # Generate mock data points every 5 minutes
-        data_points = []
-        current_time = start_time
+        # Data points every 5 minutes, oldest first
+        timestamps = np.datetime_as_string(
+            end_time - np.arange(n - 1, -1, -1) * np.timedelta64(5, 'm'), unit='us'
+        ).tolist()
         
-        while current_time <= end_time:
-            data_points.append({
-                "timestamp": current_time.isoformat(),
-                "requests": 45 + (hash(str(current_time)) % 20),  # Mock requests
-                "items": 12 + (hash(str(current_time)) % 8),      # Mock items
-                "errors": max(0, (hash(str(current_time)) % 5) - 3),  # Mock errors
-                "response_time": 150 + (hash(str(current_time)) % 100)  # Mock response time
-            })
-            current_time += timedelta(minutes=5)
+        data_points = [
+            {
+                "timestamp": ts,
+                "requests": req,
+                "items": items,
+                "errors": errors,
+                "response_time": rt
+            }
+            for ts, req, items, errors, rt in zip(timestamps, *series)
+        ]
         
-        return {
+        return ORJSONResponse({
             "data": data_points,
             "period": f"{hours} hours",
             "total_points": len(data_points)
-        }
+        })
     
     except Exception as e:
-        return {"error": str(e), "data": []}
+        return ORJSONResponse({"error": str(e), "data": []})
+
+
+@lru_cache(maxsize=32)
+def _mock_metric_series(hours: int) -> Tuple[List[int], ...]:
+    """Seeded mock series (requests, items, errors, response_time) for ``hours``."""
+    n = hours * 12 + 1
+    rng = np.random.default_rng(0)
+    return (
+        (45 + rng.integers(0, 20, n)).tolist(),
+        (12 + rng.integers(0, 8, n)).tolist(),
+        np.clip(rng.integers(-3, 2, n), 0, None).tolist(),
+        (150 + rng.integers(0, 100, n)).tolist(),
+    )
 
 
 @router.get("/metrics/components")
+@cache_response(expire=300)
 async def get_component_metrics():
     """Get per-component scraping progress and statistics."""
     try:
@@ -129,17 +173,18 @@ async def get_component_metrics():
             }
         ]
         
-        return {
+        return ORJSONResponse({
             "components": components,
             "last_updated": datetime.now().isoformat(),
             "total_progress": sum(c["scraped"] for c in components) / sum(c["total"] for c in components) * 100
-        }
+        })
     
     except Exception as e:
-        return {"error": str(e), "components": []}
+        return ORJSONResponse({"error": str(e), "components": []})
 
 
 @router.get("/metrics/errors")
+@cache_response(expire=60)
 async def get_error_metrics(limit: int = 50):
     """Get recent error statistics and details."""
     try:
@@ -171,12 +216,12 @@ async def get_error_metrics(limit: int = 50):
             }
         ]
         
-        return {
+        return ORJSONResponse({
             "errors": errors[:limit],
             "total_errors": len(errors),
             "error_rate": 2.1,  # Mock error rate percentage
             "last_updated": datetime.now().isoformat()
-        }
+        })
     
     except Exception as e:
-        return {"error": str(e), "errors": []}
\ No newline at end of file
+        return ORJSONResponse({"error": str(e), "errors": []})
\ No newline at end of file
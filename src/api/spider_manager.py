@@ -2,36 +2,82 @@
 Spider management class for controlling Scrapy spiders via API.
 """
 import asyncio
-import subprocess
+import os
 import signal
 import time
+from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 import psutil
+import redis
 
 from .models import SpiderConfig, SpiderStatus, SpiderStats
+from .reference_data import load_reference_data
+from .response_cache import response_cache
+from src.models.base import refresh_materialized_views
+
+# How often the monitor task refreshes the spider counters
+STATS_INTERVAL_SECONDS = 5
+
+# Project root the spider runs in (scrapy.cfg lives there)
+SPIDER_CWD = Path(os.getenv("RENEC_SPIDER_CWD", Path(__file__).resolve().parents[2]))
+
+# Celery queue (a Redis list on the broker) that scheduled harvests wait in
+HARVEST_QUEUE = "harvest"
 
 
 class SpiderManager:
     """Manages spider processes and provides status/control interface."""
     
+    # Scrapy command line; only the placeholders change between runs
+    _CMD_TEMPLATE = (
+        "python", "-m", "scrapy", "crawl", "renec",
+        "-a", "mode={mode}",
+        "-a", "max_depth={max_depth}",
+        "-s", "CONCURRENT_REQUESTS={concurrent_requests}",
+        "-s", "DOWNLOAD_DELAY={download_delay}",
+        "-s", "RETRY_TIMES={retry_times}",
+        "-s", "ROBOTSTXT_OBEY={robots}",
+    )
+    
     def __init__(self):
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
         self.config: Optional[SpiderConfig] = None
         self.status: SpiderStatus = SpiderStatus.IDLE
         self.stats: SpiderStats = SpiderStats()
         self.start_time: Optional[datetime] = None
+        # True from spawn until the monitor task (or stop) sees the exit
+        self._alive: bool = False
+        self.log_file: Optional[Path] = None
+        # Linux pidfd for the spider; signals sent through it cannot hit a
+        # recycled PID after the child watcher has reaped the process
+        self._pidfd: Optional[int] = None
         
-    def is_running(self) -> bool:
-        """Check if spider is currently running."""
-        if self.process is None:
-            return False
+        # Soft cap on scrapy concurrency; past a handful of in-flight requests
+        # the remote site and database become the bottleneck and retries grow
+        self.max_concurrent = int(os.getenv("RENEC_MAX_CONCURRENT", "5"))
+        # Refuse manual starts while this many scheduled harvests are waiting
+        self.max_queued_harvests = int(os.getenv("RENEC_MAX_QUEUED_HARVESTS", "1"))
+        self._broker = redis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+            socket_connect_timeout=1,
+            socket_timeout=1,
+        )
         
+    def harvest_queue_depth(self) -> int:
+        """Number of harvests waiting on the Celery broker (0 if unreachable)."""
         try:
-            # Check if process is still alive
-            return self.process.poll() is None
-        except Exception:
-            return False
+            return self._broker.llen(HARVEST_QUEUE)
+        except redis.RedisError:
+            return 0
+    
+    def is_overloaded(self) -> bool:
+        """Whether a new spider should be refused to let queued harvests drain."""
+        return self.harvest_queue_depth() > self.max_queued_harvests
+    
+    def is_running(self) -> bool:
+        """Check if spider is currently running."""
+        return self._alive
     
     async def start(self, config: SpiderConfig) -> bool:
         """Start spider with given configuration."""
@@ -39,32 +85,42 @@ class SpiderManager:
             if self.is_running():
                 return False
             
+            # Clamp in place so the caller sees the effective setting
+            config.concurrent_requests = min(config.concurrent_requests, self.max_concurrent)
+            
             # Build scrapy command
-            cmd = [
-                "python", "-m", "scrapy", "crawl", "renec",
-                "-a", f"mode={config.mode.value}",
-                "-a", f"max_depth={config.max_depth}",
-                "-s", f"CONCURRENT_REQUESTS={config.concurrent_requests}",
-                "-s", f"DOWNLOAD_DELAY={config.download_delay}",
-                "-s", f"RETRY_TIMES={config.retry_times}",
-                "-s", f"ROBOTSTXT_OBEY={str(config.respect_robots_txt).lower()}",
-            ]
+            values = {
+                "mode": config.mode.value,
+                "max_depth": config.max_depth,
+                "concurrent_requests": config.concurrent_requests,
+                "download_delay": config.download_delay,
+                "retry_times": config.retry_times,
+                "robots": str(config.respect_robots_txt).lower(),
+            }
+            cmd = [arg.format_map(values) for arg in self._CMD_TEMPLATE]
             
             # Add component filters
-            enabled_components = [
-                k for k, v in config.target_components.dict().items() if v
-            ]
+            enabled_components = [name for name, enabled in config.target_components if enabled]
             if enabled_components:
                 cmd.extend(["-a", f"components={','.join(enabled_components)}"])
             
+            # Spider output goes straight to a log file; nothing in the API
+            # reads it, so there is no pipe to drain
+            log_dir = SPIDER_CWD / "logs"
+            log_dir.mkdir(exist_ok=True)
+            self.log_file = log_dir / f"spider_{datetime.now():%Y%m%d_%H%M%S}.log"
+            
             # Start process
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd="/Users/aldoruizluna/labspace/renec-harvester"
-            )
+            with open(self.log_file, "ab", buffering=0) as log:
+                self.process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=log,
+                    stderr=asyncio.subprocess.STDOUT,
+                    cwd=SPIDER_CWD
+                )
+            
+            self._alive = True
+            self._pidfd = self._open_pidfd(self.process.pid)
             
             self.config = config
             self.status = SpiderStatus.RUNNING
@@ -72,7 +128,7 @@ class SpiderManager:
             self._reset_stats()
             
             # Start background task to monitor process
-            asyncio.create_task(self._monitor_process())
+            asyncio.create_task(self._monitor_process(self.process, self._pidfd))
             
             return True
         
@@ -90,21 +146,22 @@ class SpiderManager:
             if self.process:
                 try:
                     # Send SIGTERM first
-                    self.process.terminate()
+                    self._send_signal(signal.SIGTERM)
                     
                     # Wait up to 10 seconds for graceful shutdown
                     try:
-                        self.process.wait(timeout=10)
-                    except subprocess.TimeoutExpired:
+                        await asyncio.wait_for(self.process.wait(), 10)
+                    except asyncio.TimeoutError:
                         # Force kill if still running
-                        self.process.kill()
-                        self.process.wait()
+                        self._send_signal(signal.SIGKILL)
+                        await self.process.wait()
                 
                 except ProcessLookupError:
                     # Process already terminated
                     pass
             
             self.process = None
+            self._alive = False
             self.status = SpiderStatus.IDLE
             
             return True
@@ -121,7 +178,7 @@ class SpiderManager:
             
             if self.process:
                 # Send SIGSTOP to pause process
-                self.process.send_signal(signal.SIGSTOP)
+                self._send_signal(signal.SIGSTOP)
                 self.status = SpiderStatus.PAUSED
                 return True
             
@@ -139,7 +196,7 @@ class SpiderManager:
             
             if self.process:
                 # Send SIGCONT to resume process
-                self.process.send_signal(signal.SIGCONT)
+                self._send_signal(signal.SIGCONT)
                 self.status = SpiderStatus.RUNNING
                 return True
             
@@ -172,12 +229,7 @@ class SpiderManager:
     
     def get_status(self) -> SpiderStatus:
         """Get current spider status."""
-        if self.is_running():
-            return self.status
-        else:
-            # Process died, update status
-            self.status = SpiderStatus.IDLE
-            return self.status
+        return self.status if self._alive else SpiderStatus.IDLE
     
     def get_config(self) -> Optional[SpiderConfig]:
         """Get current spider configuration."""
@@ -185,24 +237,16 @@ class SpiderManager:
     
     def get_stats(self) -> SpiderStats:
         """Get current spider statistics."""
-        # Update runtime stats
-        if self.start_time and self.is_running():
-            uptime_delta = datetime.now() - self.start_time
-            self.stats.uptime = str(uptime_delta).split('.')[0]  # Remove microseconds
+        now = datetime.now()
+        running = self.is_running()
         
-        self.stats.status = self.get_status()
+        # Update runtime stats; the counters are refreshed by _monitor_process
+        if running and self.start_time:
+            hours, remainder = divmod(int((now - self.start_time).total_seconds()), 3600)
+            minutes, seconds = divmod(remainder, 60)
+            self.stats.uptime = f"{hours}:{minutes:02d}:{seconds:02d}"
         
-        # TODO: Get actual stats from spider/database
-        # For now, return mock stats that change over time
-        if self.is_running():
-            runtime_minutes = (datetime.now() - self.start_time).total_seconds() / 60 if self.start_time else 0
-            self.stats.total_requests = int(runtime_minutes * 45)  # Mock: 45 requests/minute
-            self.stats.successful_requests = int(self.stats.total_requests * 0.95)  # 95% success rate
-            self.stats.failed_requests = self.stats.total_requests - self.stats.successful_requests
-            self.stats.items_scraped = int(runtime_minutes * 12)  # Mock: 12 items/minute
-            self.stats.current_speed = 12.0
-            self.stats.avg_response_time = 150.0
-            self.stats.queue_size = max(0, 100 - int(runtime_minutes))
+        self.stats.status = self.get_status()
         
         return self.stats
     
@@ -211,22 +255,72 @@ class SpiderManager:
         if self.is_running():
             await self.stop()
     
-    async def _monitor_process(self):
-        """Background task to monitor spider process."""
-        while self.is_running():
-            try:
-                # Check if process is still alive
-                if self.process and self.process.poll() is not None:
-                    # Process terminated
-                    self.status = SpiderStatus.IDLE
-                    self.process = None
-                    break
-                
-                await asyncio.sleep(5)  # Check every 5 seconds
-            
-            except Exception as e:
-                print(f"Error monitoring process: {e}")
-                break
+    async def _monitor_process(self, process: asyncio.subprocess.Process, pidfd: Optional[int]):
+        """Background task updating stats until the spider exits."""
+        try:
+            exited = asyncio.ensure_future(process.wait())
+            while not exited.done():
+                self._update_stats()
+                await asyncio.wait({exited}, timeout=STATS_INTERVAL_SECONDS)
+        except Exception as e:
+            print(f"Error monitoring process: {e}")
+        
+        if pidfd is not None:
+            if self._pidfd == pidfd:
+                self._pidfd = None
+            os.close(pidfd)
+        
+        if self.process is process:
+            # Process terminated on its own
+            self.status = SpiderStatus.IDLE
+            self.process = None
+            self._alive = False
+        
+        await self._after_exit()
+    
+    async def _after_exit(self):
+        """Refresh reporting views and caches once a crawl has finished."""
+        # The crawl may have changed the data behind the materialized views,
+        # cached responses and the sector/comite lookup dicts
+        try:
+            await asyncio.to_thread(refresh_materialized_views)
+        except Exception as e:
+            print(f"Error refreshing materialized views: {e}")
+        response_cache.clear()
+        try:
+            await asyncio.to_thread(load_reference_data)
+        except Exception as e:
+            print(f"Error reloading reference data: {e}")
+    
+    @staticmethod
+    def _open_pidfd(pid: int) -> Optional[int]:
+        """Open a pidfd for the spider where the platform supports it."""
+        if not hasattr(os, "pidfd_open"):
+            return None
+        try:
+            return os.pidfd_open(pid)
+        except OSError:
+            return None
+    
+    def _send_signal(self, sig: int):
+        """Signal the spider, via its pidfd when one is open."""
+        if self._pidfd is not None:
+            signal.pidfd_send_signal(self._pidfd, sig)
+        else:
+            self.process.send_signal(sig)
+    
+    def _update_stats(self):
+        """Refresh the request/item counters while the spider runs."""
+        # TODO: Get actual stats from spider/database
+        # For now, mock stats that change over time
+        runtime_minutes = (datetime.now() - self.start_time).total_seconds() / 60 if self.start_time else 0
+        self.stats.total_requests = int(runtime_minutes * 45)  # Mock: 45 requests/minute
+        self.stats.successful_requests = int(self.stats.total_requests * 0.95)  # 95% success rate
+        self.stats.failed_requests = self.stats.total_requests - self.stats.successful_requests
+        self.stats.items_scraped = int(runtime_minutes * 12)  # Mock: 12 items/minute
+        self.stats.current_speed = 12.0
+        self.stats.avg_response_time = 150.0
+        self.stats.queue_size = max(0, 100 - int(runtime_minutes))
     
     def _reset_stats(self):
         """Reset statistics to initial values."""
@@ -2,12 +2,17 @@
 Input validation schemas for API endpoints.
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator, HttpUrl
+from typing import Annotated, Literal, Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator, model_validator, HttpUrl
 from datetime import datetime
 from enum import Enum
 
 
+# Finite choices are validated by set membership rather than a regex
+EntityType = Literal["ec_standard", "certificador", "centro", "sector", "curso"]
+EntityStatus = Literal["active", "inactive", "pending"]
+
+
 class HarvestMode(str, Enum):
     """Valid harvest modes."""
     CRAWL = "crawl"
@@ -25,14 +30,9 @@ class ExportFormat(str, Enum):
 
 class PaginationParams(BaseModel):
     """Common pagination parameters."""
+    # Bounds are enforced by pydantic-core; no Python validator needed
     page: int = Field(default=1, ge=1, description="Page number")
     per_page: int = Field(default=20, ge=1, le=100, description="Items per page")
-    
-    @validator('per_page')
-    def validate_per_page(cls, v):
-        if v > 100:
-            raise ValueError('per_page cannot exceed 100')
-        return v
 
 
 class SearchParams(BaseModel):
@@ -43,7 +43,8 @@ class SearchParams(BaseModel):
         description="Fields to search in"
     )
     
-    @validator('q')
+    @field_validator('q')
+    @classmethod
     def clean_query(cls, v):
         # Remove potentially dangerous characters
         return v.strip().replace('\x00', '')
@@ -60,12 +61,11 @@ class DateRangeParams(BaseModel):
         description="End date (ISO format)"
     )
     
-    @validator('end_date')
-    def validate_date_range(cls, v, values):
-        if v and 'start_date' in values and values['start_date']:
-            if v < values['start_date']:
-                raise ValueError('end_date must be after start_date')
-        return v
+    @model_validator(mode='after')
+    def validate_date_range(self):
+        if self.end_date and self.start_date and self.end_date < self.start_date:
+            raise ValueError('end_date must be after start_date')
+        return self
 
 
 class SpiderConfigValidated(BaseModel):
@@ -75,57 +75,34 @@ class SpiderConfigValidated(BaseModel):
     max_pages: Optional[int] = Field(default=None, ge=1, le=10000)
     concurrent_requests: int = Field(default=5, ge=1, le=20)
     download_delay: float = Field(default=1.0, ge=0.1, le=10.0)
-    allowed_domains: Optional[List[str]] = Field(default=None)
-    
-    @validator('allowed_domains')
-    def validate_domains(cls, v):
-        if v:
-            # Basic domain validation
-            for domain in v:
-                if not domain or len(domain) > 255:
-                    raise ValueError(f'Invalid domain: {domain}')
-        return v
+    # Basic domain validation: non-empty, at most 255 characters
+    allowed_domains: Optional[List[Annotated[str, StringConstraints(min_length=1, max_length=255)]]] = Field(
+        default=None
+    )
 
 
 class EntityFilterParams(BaseModel):
     """Entity filtering parameters."""
-    entity_type: Optional[str] = Field(
-        default=None, 
-        pattern="^(ec_standard|certificador|centro|sector|curso)$"
-    )
-    status: Optional[str] = Field(
-        default=None, 
-        pattern="^(active|inactive|pending)$"
-    )
+    entity_type: Optional[EntityType] = None
+    status: Optional[EntityStatus] = None
     sector_id: Optional[int] = Field(default=None, ge=1)
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "entity_type": "ec_standard",
-                "status": "active",
-                "sector_id": 1
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "entity_type": "ec_standard",
+            "status": "active",
+            "sector_id": 1
         }
+    })
 
 
 class ExportRequestValidated(BaseModel):
     """Validated export request."""
     format: ExportFormat
-    entity_type: Optional[str] = Field(
-        default=None,
-        pattern="^(ec_standard|certificador|centro|sector|curso|all)$"
-    )
-    filters: Optional[Dict[str, Any]] = Field(default=None)
+    entity_type: Optional[Literal[EntityType, "all"]] = None
+    # Limit filter complexity (max 10)
+    filters: Optional[Dict[str, Any]] = Field(default=None, max_length=10)
     include_metadata: bool = Field(default=False)
-    
-    @validator('filters')
-    def validate_filters(cls, v):
-        if v:
-            # Limit filter complexity
-            if len(v) > 10:
-                raise ValueError('Too many filters (max 10)')
-        return v
 
 
 class APIResponse(BaseModel):
@@ -1 +1,12 @@
-"""CLI command modules."""
\ No newline at end of file
+"""CLI command modules."""
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+@lru_cache(maxsize=16)
+def parse_entities(raw: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Split a comma-separated ``--entities`` option into unique entity types."""
+    if not raw:
+        return None
+    # dict.fromkeys drops duplicates but keeps the order given on the command line
+    return tuple(dict.fromkeys(e.strip() for e in raw.split(",")))
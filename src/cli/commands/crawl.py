@@ -1,11 +1,14 @@
 """Crawl command for site mapping."""
 
 import json
+import os
 import subprocess
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import typer
 from rich import print
 from rich.console import Console
@@ -16,6 +19,11 @@ app = typer.Typer(help="Site crawling and mapping commands")
 console = Console()
 
 
+def _meta_path(crawl_map: Path) -> Path:
+    """Sidecar file holding a crawl map's URL count and type histogram."""
+    return crawl_map.with_suffix(".meta.json")
+
+
 @app.command()
 def start(
     max_depth: int = typer.Option(5, "--depth", "-d", help="Maximum crawl depth"),
@@ -55,7 +63,10 @@ def start(
         task = progress.add_task("Crawling site...", total=None)
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Scrapy logs go to a file next to the map instead of into memory
+            log_file = output.with_suffix(".log")
+            with open(log_file, "wb") as log:
+                result = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT)
             
             if result.returncode == 0:
                 console.print(f"\n[green]✅ Crawl completed successfully![/green]")
@@ -63,17 +74,18 @@ def start(
                 
                 # Show summary
                 if output.exists():
-                    with open(output) as f:
-                        data = json.load(f)
+                    data = orjson.loads(output.read_bytes())
                     
                     console.print(f"\n[bold]Crawl Summary:[/bold]")
                     console.print(f"Total URLs discovered: {len(data)}")
                     
                     # Count by type
-                    type_counts = {}
-                    for item in data:
-                        item_type = item.get("type", "unknown")
-                        type_counts[item_type] = type_counts.get(item_type, 0) + 1
+                    type_counts = Counter(item.get("type", "unknown") for item in data)
+                    
+                    # Cache the summary so `crawl list` need not parse the map
+                    _meta_path(output).write_bytes(
+                        orjson.dumps({"count": sum(type_counts.values()), "types": type_counts})
+                    )
                     
                     table = Table(title="URLs by Type")
                     table.add_column("Type", style="cyan")
@@ -85,8 +97,7 @@ def start(
                     console.print(table)
             else:
                 console.print(f"[red]❌ Crawl failed with exit code: {result.returncode}[/red]")
-                if result.stderr:
-                    console.print(f"[red]Error: {result.stderr}[/red]")
+                console.print(f"[red]See log: {log_file}[/red]")
                 
         except Exception as e:
             console.print(f"[red]❌ Error running crawler: {e}[/red]")
@@ -104,12 +115,14 @@ def network(
     # Find network capture file
     if not session_id:
         # Find most recent
-        capture_files = list(Path("artifacts").glob("network_requests_*.json"))
-        if not capture_files:
+        capture_file = max(
+            Path("artifacts").glob("network_requests_*.json"),
+            key=lambda p: p.stat().st_mtime,
+            default=None,
+        )
+        if capture_file is None:
             console.print("[red]No network capture files found[/red]")
             raise typer.Exit(1)
-        
-        capture_file = max(capture_files, key=lambda p: p.stat().st_mtime)
     else:
         capture_file = Path(f"artifacts/network_requests_{session_id}.json")
     
@@ -143,13 +156,9 @@ def network(
         table.add_column("Count", justify="right")
         
         # Count unique endpoints
-        endpoint_counts = {}
-        for req in api_endpoints:
-            key = f"{req['method']} {req['url']}"
-            endpoint_counts[key] = endpoint_counts.get(key, 0) + 1
+        endpoint_counts = Counter((req["method"], req["url"]) for req in api_endpoints)
         
-        for endpoint, count in sorted(endpoint_counts.items()):
-            method, url = endpoint.split(" ", 1)
+        for (method, url), count in sorted(endpoint_counts.items()):
             # Truncate long URLs
             if len(url) > 80:
                 url = url[:77] + "..."
@@ -183,8 +192,16 @@ def list():
         console.print("[yellow]No crawl maps found[/yellow]")
         return
     
-    crawl_files = list(crawl_dir.glob("crawl_map_*.json"))
-    if not crawl_files:
+    # One directory pass; DirEntry keeps the name and caches its stat
+    with os.scandir(crawl_dir) as it:
+        entries = [
+            (entry.name, entry.stat())
+            for entry in it
+            if entry.name.startswith("crawl_map_")
+            and entry.name.endswith(".json")
+            and not entry.name.endswith(".meta.json")
+        ]
+    if not entries:
         console.print("[yellow]No crawl maps found[/yellow]")
         return
     
@@ -195,21 +212,23 @@ def list():
     table.add_column("URLs", justify="right")
     table.add_column("Size", justify="right")
     
-    for file_path in sorted(crawl_files, reverse=True):
+    for name, stats in sorted(entries, key=lambda e: e[1].st_mtime, reverse=True):
+        file_path = crawl_dir / name
         # Extract session ID from filename
         session_id = file_path.stem.replace("crawl_map_", "")
         
-        # Get file stats
-        stats = file_path.stat()
         date = datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M")
         size = f"{stats.st_size / 1024:.1f} KB"
         
-        # Count URLs
+        # Count URLs, from the sidecar when the crawl wrote one
         try:
-            with open(file_path) as f:
-                data = json.load(f)
-                url_count = str(len(data))
-        except:
+            url_count = str(orjson.loads(_meta_path(file_path).read_bytes())["count"])
+        except FileNotFoundError:
+            try:
+                url_count = str(len(orjson.loads(file_path.read_bytes())))
+            except Exception:
+                url_count = "?"
+        except Exception:
             url_count = "?"
         
         table.add_row(session_id, date, url_count, size)
@@ -1,7 +1,12 @@
 """Database management commands."""
 
+import os
+import shutil
+import socket
 import subprocess
+from functools import lru_cache
 from pathlib import Path
+from typing import List
 
 import typer
 from rich import print
@@ -12,6 +17,42 @@ app = typer.Typer(help="Database management commands")
 console = Console()
 
 
+@lru_cache(maxsize=None)
+def _postgres_reachable(host: str, port: str) -> bool:
+    """Check whether Postgres accepts connections at host:port (or a socket directory)."""
+    if host.startswith("/"):
+        return os.path.exists(os.path.join(host, f".s.PGSQL.{port}"))
+    try:
+        with socket.create_connection((host, int(port)), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def _postgres_command(tool: str, db_name: str) -> List[str]:
+    """
+    Build a pg_dump/psql command line for the harvester database.
+    
+    By default the tool runs inside the renec-postgres container, which needs
+    no password and always matches the server version. With RENEC_PG_DIRECT=1
+    the host's client connects to DATABASE_HOST instead, skipping the docker
+    CLI round trip, as long as the tool is installed and the server is
+    reachable. Credentials then come from PGPASSWORD, falling back to
+    POSTGRES_PASSWORD, or ~/.pgpass.
+    """
+    db_host = os.getenv("DATABASE_HOST", "localhost")
+    db_port = os.getenv("DATABASE_PORT", "5432")
+    db_user = os.getenv("DATABASE_USER", "renec")
+    direct = os.getenv("RENEC_PG_DIRECT", "").lower() in ("1", "true", "yes")
+    
+    if direct and shutil.which(tool) and _postgres_reachable(db_host, db_port):
+        if "POSTGRES_PASSWORD" in os.environ:
+            # Inherited by the child; never put the password on the command line
+            os.environ.setdefault("PGPASSWORD", os.environ["POSTGRES_PASSWORD"])
+        return [tool, "-h", db_host, "-p", db_port, "-U", db_user, "-d", db_name]
+    return ["docker", "exec", "-i", "renec-postgres", tool, "-U", db_user, "-d", db_name]
+
+
 @app.command()
 def init(
     drop: bool = typer.Option(False, "--drop", help="Drop existing tables first"),
@@ -56,26 +97,23 @@ def migrate(
     if message:
         # Create new migration
         console.print(f"Creating migration: {message}")
-        result = subprocess.run(
-            ["alembic", "revision", "--autogenerate", "-m", message],
-            capture_output=True,
-            text=True,
-        )
+        # Alembic output streams straight to the terminal
+        result = subprocess.run(["alembic", "revision", "--autogenerate", "-m", message])
         
         if result.returncode == 0:
             console.print("[green]✅ Migration created[/green]")
         else:
-            console.print(f"[red]❌ Failed to create migration: {result.stderr}[/red]")
+            console.print(f"[red]❌ Failed to create migration (exit code {result.returncode})[/red]")
             raise typer.Exit(1)
     
     # Run migrations
     console.print("Applying migrations...")
-    result = subprocess.run(["alembic", "upgrade", "head"], capture_output=True, text=True)
+    result = subprocess.run(["alembic", "upgrade", "head"])
     
     if result.returncode == 0:
         console.print("[green]✅ Migrations applied successfully![/green]")
     else:
-        console.print(f"[red]❌ Migration failed: {result.stderr}[/red]")
+        console.print(f"[red]❌ Migration failed (exit code {result.returncode})[/red]")
         raise typer.Exit(1)
 
 
@@ -127,7 +165,6 @@ def backup(
     output: Path = typer.Option(Path("backups"), "--output", "-o", help="Backup directory"),
 ):
     """Backup database to file."""
-    import os
     from datetime import datetime
     
     console.print("[bold cyan]Creating database backup[/bold cyan]\n")
@@ -139,30 +176,40 @@ def backup(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_file = output / f"renec_backup_{timestamp}.sql"
     
-    # Get database credentials from environment
-    db_host = os.getenv("DATABASE_HOST", "localhost")
-    db_port = os.getenv("DATABASE_PORT", "5432")
-    db_name = os.getenv("DATABASE_NAME", "renec_harvester")
-    db_user = os.getenv("DATABASE_USER", "renec")
-    
     # Run pg_dump
-    cmd = [
-        "docker", "exec", "renec-postgres",
-        "pg_dump", "-U", db_user, "-d", db_name,
-    ]
+    cmd = _postgres_command("pg_dump", os.getenv("DATABASE_NAME", "renec_harvester"))
     
+    # Compress on the fly when zstd is available; SQL dumps shrink 5-10x
+    zstd = shutil.which("zstd")
+    if zstd:
+        backup_file = backup_file.with_suffix(".sql.zst")
+    
+    # pg_dump warnings and errors stream straight to the terminal
     try:
-        with open(backup_file, "w") as f:
-            result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, text=True)
+        if zstd:
+            dump = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+            compress = subprocess.Popen(
+                [zstd, "-T0", "-3", "-q", "-f", "-o", str(backup_file)],
+                stdin=dump.stdout,
+            )
+            # Only zstd holds the read end, so pg_dump sees SIGPIPE if it dies
+            dump.stdout.close()
+            # Reap both before judging either, so a failed dump never leaves
+            # zstd running (or a zombie) while the file is removed
+            dump_returncode, compress_returncode = dump.wait(), compress.wait()
+            returncode = dump_returncode or compress_returncode
+        else:
+            with open(backup_file, "wb") as f:
+                returncode = subprocess.run(cmd, stdout=f).returncode
         
-        if result.returncode == 0:
+        if returncode == 0:
             size = backup_file.stat().st_size / 1024 / 1024  # MB
             console.print(f"[green]✅ Backup created successfully![/green]")
             console.print(f"File: {backup_file}")
             console.print(f"Size: {size:.1f} MB")
         else:
-            console.print(f"[red]❌ Backup failed: {result.stderr}[/red]")
-            backup_file.unlink()  # Remove failed backup
+            console.print(f"[red]❌ Backup failed (exit code {returncode})[/red]")
+            backup_file.unlink(missing_ok=True)  # Remove failed backup
             raise typer.Exit(1)
             
     except Exception as e:
@@ -188,25 +235,13 @@ def restore(
             console.print("[yellow]Aborted[/yellow]")
             raise typer.Exit(0)
     
-    # Get database credentials
-    import os
-    db_user = os.getenv("DATABASE_USER", "renec")
     db_name = os.getenv("DATABASE_NAME", "renec_harvester")
     
     # Drop and recreate database
     console.print("Preparing database...")
     
-    drop_cmd = [
-        "docker", "exec", "renec-postgres",
-        "psql", "-U", db_user, "-d", "postgres",
-        "-c", f"DROP DATABASE IF EXISTS {db_name};"
-    ]
-    
-    create_cmd = [
-        "docker", "exec", "renec-postgres",
-        "psql", "-U", db_user, "-d", "postgres",
-        "-c", f"CREATE DATABASE {db_name};"
-    ]
+    drop_cmd = _postgres_command("psql", "postgres") + ["-c", f"DROP DATABASE IF EXISTS {db_name};"]
+    create_cmd = _postgres_command("psql", "postgres") + ["-c", f"CREATE DATABASE {db_name};"]
     
     # Execute commands
     subprocess.run(drop_cmd, capture_output=True)
@@ -215,16 +250,25 @@ def restore(
     # Restore from backup
     console.print("Restoring data...")
     
-    with open(backup_file, "r") as f:
-        restore_cmd = [
-            "docker", "exec", "-i", "renec-postgres",
-            "psql", "-U", db_user, "-d", db_name,
-        ]
-        
-        result = subprocess.run(restore_cmd, stdin=f, capture_output=True, text=True)
+    restore_cmd = _postgres_command("psql", db_name)
     
-    if result.returncode == 0:
+    # psql echoes a line per statement; discard those and let errors
+    # stream to the terminal
+    if backup_file.suffix == ".zst":
+        # Decompress straight into psql
+        decompress = subprocess.Popen(["zstd", "-dc", str(backup_file)], stdout=subprocess.PIPE)
+        result = subprocess.run(restore_cmd, stdin=decompress.stdout, stdout=subprocess.DEVNULL)
+        decompress.stdout.close()
+        # A corrupt or truncated archive feeds psql partial SQL, which it may
+        # still accept with exit code 0; judge both processes
+        decompress_returncode = decompress.wait()
+        returncode = result.returncode or decompress_returncode
+    else:
+        with open(backup_file, "rb") as f:
+            returncode = subprocess.run(restore_cmd, stdin=f, stdout=subprocess.DEVNULL).returncode
+    
+    if returncode == 0:
         console.print("[green]✅ Database restored successfully![/green]")
     else:
-        console.print(f"[red]❌ Restore failed: {result.stderr}[/red]")
+        console.print(f"[red]❌ Restore failed (exit code {returncode})[/red]")
         raise typer.Exit(1)
\ No newline at end of file
@@ -2,19 +2,27 @@
 Diff and change detection commands.
 """
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 import typer
 from rich import print
 from rich.console import Console
 from rich.table import Table
 
-from src.diff import DiffEngine, DiffReporter
+from src.cli.commands import parse_entities
 
 app = typer.Typer(help="Diff and change detection commands")
 console = Console()
 
+# Baseline collections and the key identifying each row
+BASELINE_KEYS = {"ec_standards": "ec_clave", "certificadores": "cert_id"}
+
+# Fold the delta log back into the base snapshot once it grows past this
+BASELINE_COMPACT_BYTES = 16 * 1024 * 1024
+
 
 @app.command()
 def compare(
@@ -27,27 +35,27 @@ def compare(
     """Compare data between two harvest dates."""
     console.print("[bold cyan]Running diff comparison[/bold cyan]\n")
     
+    now = datetime.now()
+    
     # Parse dates
     try:
         if date1 == "yesterday":
-            timestamp1 = datetime.now() - timedelta(days=1)
+            timestamp1 = now - timedelta(days=1)
         else:
-            timestamp1 = datetime.strptime(date1, "%Y-%m-%d")
+            timestamp1 = datetime.fromisoformat(date1)
         
         if date2 == "today":
-            timestamp2 = datetime.now()
+            timestamp2 = now
         else:
-            timestamp2 = datetime.strptime(date2, "%Y-%m-%d")
+            timestamp2 = datetime.fromisoformat(date2)
     except ValueError as e:
         console.print(f"[red]Invalid date format: {e}[/red]")
         raise typer.Exit(1)
     
-    # Parse entity types
-    entities = None
-    if entity_types:
-        entities = [e.strip() for e in entity_types.split(",")]
+    entities = parse_entities(entity_types)
     
     # Run diff
+    from src.diff import DiffEngine, DiffReporter
     engine = DiffEngine()
     console.print(f"Comparing data between {timestamp1.date()} and {timestamp2.date()}...")
     
@@ -64,7 +72,7 @@ def compare(
     reporter = DiffReporter()
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp_str = now.strftime("%Y%m%d_%H%M%S")
     generated_reports = []
     
     if output_format in ["html", "all"]:
@@ -99,7 +107,7 @@ def baseline(
     from src.models import get_session
     from src.models.ec_standard import ECStandard
     from src.models.certificador import Certificador
-    import json
+    from sqlalchemy import select
     
     baseline_path = Path("artifacts/baseline.json")
     
@@ -113,34 +121,33 @@ def baseline(
         }
         
         with get_session() as session:
-            # Get all EC standards
-            for ec in session.query(ECStandard).all():
-                baseline_data["ec_standards"].append({
-                    "ec_clave": ec.ec_clave,
-                    "titulo": ec.titulo,
-                    "version": ec.version,
-                    "vigente": ec.vigente,
-                    "content_hash": ec.content_hash
-                })
+            # Stream plain rows in batches; no ORM objects are built
+            baseline_data["ec_standards"] = [
+                dict(row._mapping) for row in session.execute(
+                    select(ECStandard.ec_clave, ECStandard.titulo, ECStandard.version,
+                           ECStandard.vigente, ECStandard.content_hash)
+                    .execution_options(yield_per=1000)
+                )
+            ]
             
-            # Get all certificadores
-            for cert in session.query(Certificador).all():
-                baseline_data["certificadores"].append({
-                    "cert_id": cert.cert_id,
-                    "tipo": cert.tipo,
-                    "nombre_legal": cert.nombre_legal,
-                    "estatus": cert.estatus,
-                    "row_hash": cert.row_hash
-                })
+            baseline_data["certificadores"] = [
+                dict(row._mapping) for row in session.execute(
+                    select(Certificador.cert_id, Certificador.tipo, Certificador.nombre_legal,
+                           Certificador.estatus, Certificador.row_hash)
+                    .execution_options(yield_per=1000)
+                )
+            ]
         
         # Save baseline
         baseline_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(baseline_path, 'w', encoding='utf-8') as f:
-            json.dump(baseline_data, f, indent=2, ensure_ascii=False)
+        rows_written = _save_baseline(baseline_path, baseline_data)
+        # Cache the summary so --show need not parse the snapshot
+        _baseline_meta_path(baseline_path).write_bytes(orjson.dumps(_summarize_baseline(baseline_data)))
         
         console.print(f"[green]✅ Baseline created with:[/green]")
         console.print(f"  • EC Standards: {len(baseline_data['ec_standards'])}")
         console.print(f"  • Certificadores: {len(baseline_data['certificadores'])}")
+        console.print(f"  • Rows written: {rows_written}")
         console.print(f"  • Saved to: {baseline_path}")
     
     elif show:
@@ -148,13 +155,22 @@ def baseline(
             console.print("[red]No baseline found. Create one with --create[/red]")
             raise typer.Exit(1)
         
-        with open(baseline_path, 'r') as f:
-            baseline_data = json.load(f)
+        # The sidecar is only trusted if written after the snapshot and delta
+        meta_path = _baseline_meta_path(baseline_path)
+        delta_path = _baseline_delta_path(baseline_path)
+        snapshot_mtime = max(
+            baseline_path.stat().st_mtime,
+            delta_path.stat().st_mtime if delta_path.exists() else 0,
+        )
+        if meta_path.exists() and meta_path.stat().st_mtime >= snapshot_mtime:
+            summary = orjson.loads(meta_path.read_bytes())
+        else:
+            summary = _summarize_baseline(_load_baseline(baseline_path))
         
         console.print("[bold cyan]Current Baseline:[/bold cyan]")
-        console.print(f"Created: {baseline_data['created_at']}")
-        console.print(f"EC Standards: {len(baseline_data['ec_standards'])}")
-        console.print(f"Certificadores: {len(baseline_data['certificadores'])}")
+        console.print(f"Created: {summary['created_at']}")
+        console.print(f"EC Standards: {summary['ec_standards']}")
+        console.print(f"Certificadores: {summary['certificadores']}")
     
     elif compare_with:
         if not baseline_path.exists():
@@ -164,48 +180,17 @@ def baseline(
         console.print("[bold cyan]Comparing with baseline...[/bold cyan]")
         
         # Load baseline
-        with open(baseline_path, 'r') as f:
-            baseline_data = json.load(f)
-        
-        # Load current data
-        current_data = {
-            "ec_standards": [],
-            "certificadores": []
-        }
+        baseline_data = _load_baseline(baseline_path)
         
+        # Stage the baseline keys/hashes next to the live tables and let
+        # Postgres compute the counts; no current rows cross the wire
         with get_session() as session:
-            for ec in session.query(ECStandard).all():
-                current_data["ec_standards"].append({
-                    "ec_clave": ec.ec_clave,
-                    "titulo": ec.titulo,
-                    "version": ec.version,
-                    "vigente": ec.vigente,
-                    "content_hash": ec.content_hash
-                })
-            
-            for cert in session.query(Certificador).all():
-                current_data["certificadores"].append({
-                    "cert_id": cert.cert_id,
-                    "tipo": cert.tipo,
-                    "nombre_legal": cert.nombre_legal,
-                    "estatus": cert.estatus,
-                    "row_hash": cert.row_hash
-                })
-        
-        # Compare
-        engine = DiffEngine()
-        
-        ec_comparison = engine.compare_with_baseline(
-            current_data["ec_standards"],
-            baseline_data["ec_standards"],
-            "ec_clave"
-        )
-        
-        cert_comparison = engine.compare_with_baseline(
-            current_data["certificadores"],
-            baseline_data["certificadores"],
-            "cert_id"
-        )
+            ec_comparison = _compare_in_database(
+                session, ECStandard.ec_clave, ECStandard.content_hash, baseline_data["ec_standards"]
+            )
+            cert_comparison = _compare_in_database(
+                session, Certificador.cert_id, Certificador.row_hash, baseline_data["certificadores"]
+            )
         
         # Display results
         console.print("\n[bold]EC Standards Changes:[/bold]")
@@ -224,6 +209,137 @@ def baseline(
         console.print("Use --create to create baseline, --show to view, or --compare to compare")
 
 
+def _baseline_meta_path(baseline_path: Path) -> Path:
+    """Sidecar file holding a baseline's creation time and row counts."""
+    return baseline_path.with_suffix(".meta.json")
+
+
+def _baseline_delta_path(baseline_path: Path) -> Path:
+    """Append-only log of rows changed since the base snapshot was written."""
+    return baseline_path.with_name(f"{baseline_path.stem}_delta.jsonl")
+
+
+def _save_baseline(baseline_path: Path, baseline_data: Dict) -> int:
+    """
+    Persist a snapshot as the base file plus an append-only delta.
+    
+    Only rows that differ from the current effective baseline are appended
+    (``row: null`` marks a removal). The base is rewritten in full, and the
+    delta dropped, when there is no base yet or the delta has grown past
+    BASELINE_COMPACT_BYTES. Returns the number of rows written.
+    """
+    delta_path = _baseline_delta_path(baseline_path)
+    
+    if not baseline_path.exists() or (
+        delta_path.exists() and delta_path.stat().st_size > BASELINE_COMPACT_BYTES
+    ):
+        baseline_path.write_bytes(orjson.dumps(baseline_data, option=orjson.OPT_INDENT_2))
+        delta_path.unlink(missing_ok=True)
+        return sum(len(baseline_data[entity]) for entity in BASELINE_KEYS)
+    
+    previous = _load_baseline(baseline_path)
+    lines = [orjson.dumps({"created_at": baseline_data["created_at"]})]
+    for entity, key_field in BASELINE_KEYS.items():
+        before = {row[key_field]: row for row in previous[entity]}
+        for row in baseline_data[entity]:
+            if before.pop(row[key_field], None) != row:
+                lines.append(orjson.dumps({"entity": entity, "key": row[key_field], "row": row}))
+        # Whatever is left no longer exists
+        lines.extend(orjson.dumps({"entity": entity, "key": key, "row": None}) for key in before)
+    
+    with open(delta_path, "ab") as f:
+        f.write(b"\n".join(lines) + b"\n")
+    
+    return len(lines) - 1
+
+
+def _load_baseline(baseline_path: Path) -> Dict:
+    """Read the base snapshot and replay the delta log over it, last write wins."""
+    baseline_data = orjson.loads(baseline_path.read_bytes())
+    delta_path = _baseline_delta_path(baseline_path)
+    if not delta_path.exists():
+        return baseline_data
+    
+    rows = {
+        entity: {row[key_field]: row for row in baseline_data[entity]}
+        for entity, key_field in BASELINE_KEYS.items()
+    }
+    with open(delta_path, "rb") as f:
+        for line in f:
+            entry = orjson.loads(line)
+            if "entity" not in entry:
+                baseline_data["created_at"] = entry["created_at"]
+            elif entry["row"] is None:
+                rows[entry["entity"]].pop(entry["key"], None)
+            else:
+                rows[entry["entity"]][entry["key"]] = entry["row"]
+    
+    for entity, by_key in rows.items():
+        baseline_data[entity] = list(by_key.values())
+    return baseline_data
+
+
+def _summarize_baseline(baseline_data: Dict) -> Dict:
+    """Reduce a baseline snapshot to what --show prints."""
+    return {
+        "created_at": baseline_data["created_at"],
+        "ec_standards": len(baseline_data["ec_standards"]),
+        "certificadores": len(baseline_data["certificadores"]),
+    }
+
+
+def _compare_in_database(session, key_column, hash_column, baseline_rows: List[Dict]) -> Dict:
+    """
+    Count added/removed/modified/unchanged rows against a baseline in SQL.
+    
+    The baseline's (key, hash) pairs go into a temp table dropped at commit,
+    which is FULL JOINed to the live table on the key. Baseline rows are read
+    by the columns' attribute names (e.g. ``ec_clave``/``content_hash``).
+    When either side is empty every row is simply added or removed, so the
+    staging and join are skipped.
+    """
+    from sqlalchemy import Column, MetaData, Table, Text, and_, func, insert, select
+    
+    if not baseline_rows:
+        added = session.scalar(select(func.count(key_column)))
+        return {'summary': {
+            'total_current': added, 'total_baseline': 0, 'added_count': added,
+            'removed_count': 0, 'modified_count': 0, 'unchanged_count': 0,
+        }}
+    if session.scalar(select(key_column).limit(1)) is None:
+        removed = len(baseline_rows)
+        return {'summary': {
+            'total_current': 0, 'total_baseline': removed, 'added_count': 0,
+            'removed_count': removed, 'modified_count': 0, 'unchanged_count': 0,
+        }}
+    
+    staged = Table(
+        f"baseline_{key_column.class_.__tablename__}",
+        MetaData(),
+        Column("key", Text, primary_key=True),
+        Column("hash", Text),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+    staged.create(session.connection())
+    session.execute(insert(staged), [
+        {"key": row[key_column.key], "hash": row[hash_column.key]} for row in baseline_rows
+    ])
+    
+    current = select(key_column.label("key"), hash_column.label("hash")).subquery()
+    in_both = and_(current.c.key.is_not(None), staged.c.key.is_not(None))
+    stmt = select(
+        func.count(current.c.key).label("total_current"),
+        func.count(staged.c.key).label("total_baseline"),
+        func.count().filter(staged.c.key.is_(None)).label("added_count"),
+        func.count().filter(current.c.key.is_(None)).label("removed_count"),
+        func.count().filter(in_both & current.c.hash.is_distinct_from(staged.c.hash)).label("modified_count"),
+        func.count().filter(in_both & current.c.hash.is_not_distinct_from(staged.c.hash)).label("unchanged_count"),
+    ).select_from(current.join(staged, current.c.key == staged.c.key, full=True))
+    
+    return {'summary': dict(session.execute(stmt).one()._mapping)}
+
+
 def _display_diff_summary(diff_report: Dict):
     """Display diff summary in console."""
     summary = diff_report.get('summary', {})
@@ -233,37 +349,47 @@ def _display_diff_summary(diff_report: Dict):
     
     # Changes by operation
     if 'by_operation' in summary:
-        table = Table(title="Changes by Operation")
-        table.add_column("Operation", style="cyan")
-        table.add_column("Count", justify="right")
-        
-        for op, count in summary['by_operation'].items():
-            table.add_row(op.capitalize(), str(count))
-        
-        console.print(table)
+        console.print(_operation_table(tuple(summary['by_operation'].items())))
     
     # Changes by entity
     if 'by_entity' in summary:
-        table = Table(title="Changes by Entity")
-        table.add_column("Entity", style="cyan")
-        table.add_column("Added", justify="right", style="green")
-        table.add_column("Removed", justify="right", style="red")
-        table.add_column("Modified", justify="right", style="yellow")
-        table.add_column("Total", justify="right")
-        
-        for entity, stats in summary['by_entity'].items():
-            table.add_row(
-                entity,
-                str(stats.get('added', 0)),
-                str(stats.get('removed', 0)),
-                str(stats.get('modified', 0)),
-                str(stats.get('total', 0))
-            )
-        
-        console.print(table)
+        console.print(_entity_table(tuple(
+            (entity, stats.get('added', 0), stats.get('removed', 0),
+             stats.get('modified', 0), stats.get('total', 0))
+            for entity, stats in summary['by_entity'].items()
+        )))
     
     # Notable changes
     if summary.get('notable_changes'):
         console.print("\n[bold]Notable Changes:[/bold]")
         for change in summary['notable_changes']:
-            console.print(f"  • {change['description']}")
\ No newline at end of file
+            console.print(f"  • {change['description']}")
+
+
+@lru_cache(maxsize=32)
+def _operation_table(by_operation: Tuple[Tuple[str, int], ...]) -> Table:
+    """Build the changes-by-operation table; cached per distinct summary."""
+    table = Table(title="Changes by Operation")
+    table.add_column("Operation", style="cyan")
+    table.add_column("Count", justify="right")
+    
+    for op, count in by_operation:
+        table.add_row(op.capitalize(), str(count))
+    
+    return table
+
+
+@lru_cache(maxsize=32)
+def _entity_table(by_entity: Tuple[Tuple[str, int, int, int, int], ...]) -> Table:
+    """Build the changes-by-entity table; cached per distinct summary."""
+    table = Table(title="Changes by Entity")
+    table.add_column("Entity", style="cyan")
+    table.add_column("Added", justify="right", style="green")
+    table.add_column("Removed", justify="right", style="red")
+    table.add_column("Modified", justify="right", style="yellow")
+    table.add_column("Total", justify="right")
+    
+    for row in by_entity:
+        table.add_row(*(str(value) for value in row))
+    
+    return table
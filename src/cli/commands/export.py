@@ -1,27 +1,57 @@
 """
 Data export commands.
 """
+import heapq
+import os
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import typer
 from rich import print
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from sqlalchemy import text
 
-from src.export import DataExporter
+from src.cli.commands import parse_entities
 
 app = typer.Typer(help="Data export commands")
 console = Console()
 
+# Every count shown by `stats` in one statement: FILTER aggregates for the
+# breakdowns, scalar subqueries for the plain totals
+_STATS_COUNTS = text("""
+    SELECT
+        ec.total AS total_ec,
+        ec.vigente AS vigente_ec,
+        cert.total AS total_cert,
+        cert.ece AS ece_count,
+        cert.oc AS oc_count,
+        (SELECT COUNT(*) FROM centros_v2) AS total_centers,
+        (SELECT COUNT(*) FROM sectors) AS total_sectors,
+        (SELECT COUNT(*) FROM comites) AS total_comites,
+        (SELECT COUNT(*) FROM ece_ec) AS ece_ec_count,
+        (SELECT COUNT(*) FROM centro_ec) AS centro_ec_count,
+        (SELECT COUNT(*) FROM ec_sector) AS ec_sector_count
+    FROM
+        (SELECT COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE vigente) AS vigente
+         FROM ec_standards_v2) AS ec,
+        (SELECT COUNT(*) AS total,
+                COUNT(*) FILTER (WHERE tipo = 'ECE') AS ece,
+                COUNT(*) FILTER (WHERE tipo = 'OC') AS oc
+         FROM certificadores_v2) AS cert
+""")
+
 
 @app.command()
 def json(
     output: Path = typer.Option("artifacts/exports/data.json", "--output", "-o", help="Output file path"),
     entities: Optional[str] = typer.Option(None, "--entities", "-e", help="Comma-separated entity types"),
-    pretty: bool = typer.Option(True, "--pretty", help="Pretty print JSON"),
+    pretty: bool = typer.Option(True, "--pretty/--compact", help="Pretty print JSON, or write it compact"),
+    stream: bool = typer.Option(False, "--stream", help="Write newline-delimited JSON record by record"),
     vigente_only: bool = typer.Option(False, "--vigente", help="Export only vigente EC standards"),
     tipo: Optional[str] = typer.Option(None, "--tipo", help="Filter certificadores by type (ECE/OC)"),
 ):
@@ -35,12 +65,10 @@ def json(
     if tipo:
         filters['tipo'] = tipo.upper()
     
-    # Parse entity types
-    entity_types = None
-    if entities:
-        entity_types = [e.strip() for e in entities.split(",")]
+    entity_types = parse_entities(entities)
     
     # Export data
+    from src.export import DataExporter
     exporter = DataExporter()
     
     with Progress(
@@ -50,12 +78,20 @@ def json(
     ) as progress:
         task = progress.add_task("Exporting...", total=None)
         
-        exported_path = exporter.export_to_json(
-            str(output),
-            entity_types=entity_types,
-            filters=filters if filters else None,
-            pretty=pretty
-        )
+        if stream:
+            # Bounded memory for large exports; --pretty does not apply
+            exported_path = exporter.export_to_ndjson(
+                str(output),
+                entity_types=entity_types,
+                filters=filters if filters else None
+            )
+        else:
+            exported_path = exporter.export_to_json(
+                str(output),
+                entity_types=entity_types,
+                filters=filters if filters else None,
+                pretty=pretty
+            )
         
         progress.update(task, completed=True)
     
@@ -84,12 +120,10 @@ def csv(
     if tipo:
         filters['tipo'] = tipo.upper()
     
-    # Parse entity types
-    entity_types = None
-    if entities:
-        entity_types = [e.strip() for e in entities.split(",")]
+    entity_types = parse_entities(entities)
     
     # Export data
+    from src.export import DataExporter
     exporter = DataExporter()
     
     with Progress(
@@ -127,11 +161,9 @@ def excel(
     """Export data to Excel format."""
     console.print("[bold cyan]Exporting data to Excel...[/bold cyan]\n")
     
-    # Check if pandas is available
-    try:
-        import pandas as pd
-    except ImportError:
-        console.print("[red]Error: pandas is required for Excel export[/red]")
+    # Check that pandas and openpyxl are installed without importing them
+    if find_spec("pandas") is None or find_spec("openpyxl") is None:
+        console.print("[red]Error: pandas and openpyxl are required for Excel export[/red]")
         console.print("Install with: pip install pandas openpyxl")
         raise typer.Exit(1)
     
@@ -142,12 +174,10 @@ def excel(
     if tipo:
         filters['tipo'] = tipo.upper()
     
-    # Parse entity types
-    entity_types = None
-    if entities:
-        entity_types = [e.strip() for e in entities.split(",")]
+    entity_types = parse_entities(entities)
     
     # Export data
+    from src.export import DataExporter
     exporter = DataExporter()
     
     with Progress(
@@ -175,10 +205,10 @@ def excel(
 
 @app.command()
 def bundle(
-    output: Path = typer.Option(
-        f"artifacts/exports/bundle_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+    output: Optional[Path] = typer.Option(
+        None,
         "--output", "-o",
-        help="Output ZIP file path"
+        help="Output ZIP file path (default: artifacts/exports/bundle_<timestamp>.zip)"
     ),
     formats: str = typer.Option("json,csv,excel", "--formats", "-f", help="Comma-separated export formats"),
     entities: Optional[str] = typer.Option(None, "--entities", "-e", help="Comma-separated entity types"),
@@ -188,6 +218,10 @@ def bundle(
     """Export data bundle with multiple formats in ZIP."""
     console.print("[bold cyan]Creating export bundle...[/bold cyan]\n")
     
+    # Timestamp the default name when the command runs, not at import
+    if output is None:
+        output = Path(f"artifacts/exports/bundle_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip")
+    
     # Parse formats
     format_list = [f.strip() for f in formats.split(",")]
     invalid_formats = [f for f in format_list if f not in ['json', 'csv', 'excel']]
@@ -203,12 +237,10 @@ def bundle(
     if tipo:
         filters['tipo'] = tipo.upper()
     
-    # Parse entity types
-    entity_types = None
-    if entities:
-        entity_types = [e.strip() for e in entities.split(",")]
+    entity_types = parse_entities(entities)
     
     # Export data
+    from src.export import DataExporter
     exporter = DataExporter()
     
     with Progress(
@@ -244,12 +276,10 @@ def graph(
     """Export data in graph format (nodes and edges) for visualization."""
     console.print("[bold cyan]Exporting data to graph format...[/bold cyan]\n")
     
-    # Parse entity types
-    entity_types = None
-    if entities:
-        entity_types = [e.strip() for e in entities.split(",")]
+    entity_types = parse_entities(entities)
     
     # Export data
+    from src.export import DataExporter
     exporter = DataExporter()
     
     with Progress(
@@ -283,12 +313,10 @@ def denormalized(
     """Export denormalized data with embedded relationships."""
     console.print("[bold cyan]Exporting denormalized data...[/bold cyan]\n")
     
-    # Parse entity types
-    entity_types = None
-    if entities:
-        entity_types = [e.strip() for e in entities.split(",")]
+    entity_types = parse_entities(entities)
     
     # Export data
+    from src.export import DataExporter
     exporter = DataExporter()
     
     with Progress(
@@ -319,59 +347,39 @@ def stats():
     """Show export statistics and available data."""
     console.print("[bold cyan]Export Statistics[/bold cyan]\n")
     
-    from src.models import get_session
-    from src.models.ec_standard import ECStandard
-    from src.models.certificador import Certificador
-    from src.models.centro import Centro
-    from src.models.sector import Sector
-    from src.models.comite import Comite
+    from src.models.base import engine
     
-    with get_session() as session:
-        # Get counts for all entities
-        stats_data = []
-        
-        # EC Standards
-        total_ec = session.query(ECStandard).count()
-        vigente_ec = session.query(ECStandard).filter(ECStandard.vigente == True).count()
-        stats_data.append({
+    # Plain SQL on a bare connection: no ORM session, no mapper configuration
+    with engine.connect() as conn:
+        counts = conn.execute(_STATS_COUNTS).one()
+    
+    stats_data = [
+        {
             'entity': 'EC Standards',
-            'total': total_ec,
-            'details': f"Vigente: {vigente_ec}, Inactive: {total_ec - vigente_ec}"
-        })
-        
-        # Certificadores
-        total_cert = session.query(Certificador).count()
-        ece_count = session.query(Certificador).filter(Certificador.tipo == 'ECE').count()
-        oc_count = session.query(Certificador).filter(Certificador.tipo == 'OC').count()
-        stats_data.append({
+            'total': counts.total_ec,
+            'details': f"Vigente: {counts.vigente_ec}, Inactive: {counts.total_ec - counts.vigente_ec}"
+        },
+        {
             'entity': 'Certificadores',
-            'total': total_cert,
-            'details': f"ECE: {ece_count}, OC: {oc_count}"
-        })
-        
-        # Centers
-        total_centers = session.query(Centro).count()
-        stats_data.append({
+            'total': counts.total_cert,
+            'details': f"ECE: {counts.ece_count}, OC: {counts.oc_count}"
+        },
+        {
             'entity': 'Centros',
-            'total': total_centers,
+            'total': counts.total_centers,
             'details': f"Evaluation Centers"
-        })
-        
-        # Sectors
-        total_sectors = session.query(Sector).count()
-        stats_data.append({
+        },
+        {
             'entity': 'Sectors',
-            'total': total_sectors,
+            'total': counts.total_sectors,
             'details': f"Productive Sectors"
-        })
-        
-        # Committees
-        total_comites = session.query(Comite).count()
-        stats_data.append({
+        },
+        {
             'entity': 'Comités',
-            'total': total_comites,
+            'total': counts.total_comites,
             'details': f"Management Committees"
-        })
+        },
+    ]
     
     # Display stats
     table = Table(title="Available Data for Export")
@@ -388,34 +396,23 @@ def stats():
     
     console.print(table)
     
-    # Show relationships count
-    from src.models.relations import ECEEC, CentroEC, ECSector
-    with get_session() as session:
-        ece_ec_count = session.query(ECEEC).count()
-        centro_ec_count = session.query(CentroEC).count()
-        ec_sector_count = session.query(ECSector).count()
-    
     console.print("\n[bold]Relationships:[/bold]")
-    console.print(f"  • ECE-EC: {ece_ec_count} accreditations")
-    console.print(f"  • Centro-EC: {centro_ec_count} center evaluations")
-    console.print(f"  • EC-Sector: {ec_sector_count} sector assignments")
+    console.print(f"  • ECE-EC: {counts.ece_ec_count} accreditations")
+    console.print(f"  • Centro-EC: {counts.centro_ec_count} center evaluations")
+    console.print(f"  • EC-Sector: {counts.ec_sector_count} sector assignments")
     
     # Show recent exports
     export_dir = Path("artifacts/exports")
     if export_dir.exists():
         console.print("\n[bold]Recent Exports:[/bold]")
         
-        export_files = sorted(
-            [f for f in export_dir.rglob("*") if f.is_file()],
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )[:10]
+        export_files = _recent_files(export_dir)
         
         if export_files:
-            for f in export_files:
-                size_mb = f.stat().st_size / (1024 * 1024)
-                mod_time = datetime.fromtimestamp(f.stat().st_mtime)
-                console.print(f"  • {f.name} ({size_mb:.2f} MB) - {mod_time.strftime('%Y-%m-%d %H:%M')}")
+            for name, stat in export_files:
+                size_mb = stat.st_size / (1024 * 1024)
+                mod_time = datetime.fromtimestamp(stat.st_mtime)
+                console.print(f"  • {name} ({size_mb:.2f} MB) - {mod_time.strftime('%Y-%m-%d %H:%M')}")
         else:
             console.print("  No exports found")
     
@@ -426,4 +423,27 @@ def stats():
     console.print("  • Excel - Multi-sheet workbook")
     console.print("  • Graph - Node-edge format for visualization")
     console.print("  • Denormalized - Pre-joined data with embedded relations")
-    console.print("  • Bundle - ZIP with multiple formats")
\ No newline at end of file
+    console.print("  • Bundle - ZIP with multiple formats")
+
+
+def _recent_files(directory: Path, limit: int = 10) -> List[Tuple[str, os.stat_result]]:
+    """
+    Newest ``limit`` files under ``directory`` as (name, stat) pairs.
+    
+    Subdirectories are only walked when the top level holds fewer than
+    ``limit`` files, and each entry is stat'ed once.
+    """
+    files = []
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_file():
+                files.append((entry.name, entry.stat()))
+            elif entry.is_dir():
+                subdirs.append(entry.path)
+    
+    if len(files) < limit:
+        for path in subdirs:
+            files.extend(_recent_files(Path(path), limit))
+    
+    return heapq.nlargest(limit, files, key=lambda f: f[1].st_mtime)
@@ -1,6 +1,8 @@
 """Harvest command for data extraction."""
 
+import re
 import subprocess
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -14,6 +16,9 @@ from rich.table import Table
 app = typer.Typer(help="Data harvesting commands")
 console = Console()
 
+# Item counts from scrapy's periodic LogStats line and its final stats dump
+SCRAPED_ITEMS_PATTERN = re.compile(r"scraped (\d+) items|'item_scraped_count':\s*(\d+)")
+
 
 @app.command()
 def start(
@@ -46,8 +51,9 @@ def start(
         "-s", f"CONCURRENT_REQUESTS_PER_DOMAIN={concurrent}",
     ]
     
-    if not verbose:
-        cmd.extend(["-L", "WARNING"])
+    # Progress is read from scrapy's INFO-level stats lines, so keep them
+    # and emit them every few seconds instead of once a minute
+    cmd.extend(["-L", "DEBUG" if verbose else "INFO", "-s", "LOGSTATS_INTERVAL=5"])
     
     # Add component filter if specified
     if components:
@@ -58,28 +64,34 @@ def start(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TextColumn("{task.completed} items"),
         console=console,
+        refresh_per_second=4,
     ) as progress:
-        task = progress.add_task("Harvesting data...", total=100)
+        # The number of items is not known up front
+        task = progress.add_task("Harvesting data...", total=None)
         
         try:
             # Run the harvest
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
                 text=True,
             )
             
-            # Monitor progress (simplified for now)
-            for i in range(100):
-                import time
-                time.sleep(0.1)  # Simulate progress
-                progress.update(task, advance=1)
+            # Advance as scrapy reports items; keep the tail for error output
+            tail = deque(maxlen=20)
+            for line in iter(process.stdout.readline, ''):
+                tail.append(line)
+                if verbose:
+                    progress.console.print(line.rstrip(), markup=False, highlight=False)
+                match = SCRAPED_ITEMS_PATTERN.search(line)
+                if match:
+                    progress.update(task, completed=int(match.group(1) or match.group(2)))
             
-            # Wait for completion
-            stdout, stderr = process.communicate()
+            process.wait()
             
             if process.returncode == 0:
                 console.print(f"\n[green]✅ Harvest completed successfully![/green]")
@@ -89,8 +101,8 @@ def start(
                 _show_harvest_summary(session_id)
             else:
                 console.print(f"[red]❌ Harvest failed with exit code: {process.returncode}[/red]")
-                if stderr:
-                    console.print(f"[red]Error: {stderr}[/red]")
+                if tail:
+                    console.print("".join(tail), markup=False, highlight=False)
                 
         except Exception as e:
             console.print(f"[red]❌ Error running harvest: {e}[/red]")
@@ -176,6 +188,7 @@ def export(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        refresh_per_second=4,
     ) as progress:
         task = progress.add_task(f"Exporting to {format}...", total=None)
         
@@ -22,6 +22,7 @@ def check(
     """Validate data quality and integrity."""
     console.print("[bold cyan]Running data validation[/bold cyan]\n")
     
+    from sqlalchemy import select
     from src.qa.validator import DataValidator
     from src.models import get_session
     from src.models.components import ECStandard, Certificador, EvaluationCenter, Course
@@ -49,15 +50,18 @@ def check(
         console.print(f"\n[bold]Validating {comp_type}...[/bold]")
         
         with get_session() as session:
-            # Get sample items
-            items = session.query(models[comp_type]).limit(limit).all()
+            # Stream sample items in batches rather than loading them all
+            items = session.execute(
+                select(models[comp_type]).limit(limit).execution_options(yield_per=1000)
+            ).scalars()
             
-            if not items:
+            # Validate each item
+            comp_results = validator.validate_component(comp_type, items, auto_fix=fix)
+            
+            if not comp_results['total']:
                 console.print(f"[yellow]No {comp_type} items found[/yellow]")
                 continue
             
-            # Validate each item
-            comp_results = validator.validate_component(comp_type, items, auto_fix=fix)
             results[comp_type] = comp_results
             
             # Show results
@@ -98,6 +102,7 @@ def relationships():
     """Validate entity relationships and referential integrity."""
     console.print("[bold cyan]Validating entity relationships[/bold cyan]\n")
     
+    from sqlalchemy import func, select
     from src.models import get_session
     from src.models.components import ECStandard, Certificador, EvaluationCenter, Course
     
@@ -105,10 +110,12 @@ def relationships():
     
     with get_session() as session:
         # Check centers without certificadores
-        orphan_centers = session.query(EvaluationCenter).filter(
-            EvaluationCenter.certificador_id.is_(None),
-            EvaluationCenter.certificador_code.isnot(None),
-        ).count()
+        orphan_centers = session.scalar(
+            select(func.count(EvaluationCenter.id)).where(
+                EvaluationCenter.certificador_id.is_(None),
+                EvaluationCenter.certificador_code.isnot(None),
+            )
+        )
         
         if orphan_centers:
             issues.append({
@@ -118,10 +125,12 @@ def relationships():
             })
         
         # Check courses without EC standards
-        orphan_courses = session.query(Course).filter(
-            Course.ec_standard_id.is_(None),
-            Course.ec_code.isnot(None),
-        ).count()
+        orphan_courses = session.scalar(
+            select(func.count(Course.id)).where(
+                Course.ec_standard_id.is_(None),
+                Course.ec_code.isnot(None),
+            )
+        )
         
         if orphan_courses:
             issues.append({
@@ -131,11 +140,10 @@ def relationships():
             })
         
         # Check duplicate codes
-        from sqlalchemy import func
-        
-        duplicate_ec = session.query(
-            ECStandard.code, func.count(ECStandard.id)
-        ).group_by(ECStandard.code).having(func.count(ECStandard.id) > 1).count()
+        duplicate_codes = select(ECStandard.code).group_by(ECStandard.code).having(
+            func.count(ECStandard.id) > 1
+        ).subquery()
+        duplicate_ec = session.scalar(select(func.count()).select_from(duplicate_codes))
         
         if duplicate_ec:
             issues.append({
@@ -172,80 +180,91 @@ def coverage():
     
     from src.models import get_session
     from src.models.components import ECStandard, Certificador, EvaluationCenter, Course
-    from sqlalchemy import func
+    from sqlalchemy import func, select
+    
+    # Every count in one statement; COUNT(column) skips NULLs, so each
+    # table is scanned once for its total and its filled-in fields
+    ec_counts = select(
+        func.count(ECStandard.id).label("total"),
+        func.count(ECStandard.sector).label("with_sector"),
+        func.count(ECStandard.level).label("with_level"),
+    ).subquery()
+    cert_counts = select(
+        func.count(Certificador.id).label("total"),
+        func.count(Certificador.contact_email).label("with_email"),
+        func.count(Certificador.contact_phone).label("with_phone"),
+    ).subquery()
     
     with get_session() as session:
-        # Get coverage statistics
-        coverage_stats = []
-        
-        # EC Standards coverage
-        total_ec = session.query(ECStandard).count()
-        ec_with_sector = session.query(ECStandard).filter(
-            ECStandard.sector.isnot(None)
-        ).count()
-        ec_with_level = session.query(ECStandard).filter(
-            ECStandard.level.isnot(None)
-        ).count()
-        
-        coverage_stats.append({
-            "entity": "EC Standards",
-            "total": total_ec,
-            "with_sector": ec_with_sector,
-            "with_level": ec_with_level,
-            "sector_coverage": f"{ec_with_sector/total_ec*100:.1f}%" if total_ec else "0%",
-            "level_coverage": f"{ec_with_level/total_ec*100:.1f}%" if total_ec else "0%",
-        })
-        
-        # Certificadores coverage
-        total_cert = session.query(Certificador).count()
-        cert_with_email = session.query(Certificador).filter(
-            Certificador.contact_email.isnot(None)
-        ).count()
-        cert_with_phone = session.query(Certificador).filter(
-            Certificador.contact_phone.isnot(None)
-        ).count()
-        
-        coverage_stats.append({
-            "entity": "Certificadores",
-            "total": total_cert,
-            "with_email": cert_with_email,
-            "with_phone": cert_with_phone,
-            "email_coverage": f"{cert_with_email/total_cert*100:.1f}%" if total_cert else "0%",
-            "phone_coverage": f"{cert_with_phone/total_cert*100:.1f}%" if total_cert else "0%",
-        })
-        
-        # Show results
-        table = Table(title="Data Coverage Analysis")
-        table.add_column("Entity", style="cyan")
-        table.add_column("Total", justify="right")
-        table.add_column("Field", style="yellow")
-        table.add_column("Count", justify="right")
-        table.add_column("Coverage", justify="right", style="green")
-        
-        for stats in coverage_stats:
-            table.add_row(
-                stats['entity'],
-                str(stats['total']),
-                "Sector" if 'sector_coverage' in stats else "Email",
-                str(stats.get('with_sector', stats.get('with_email', 0))),
-                stats.get('sector_coverage', stats.get('email_coverage', '0%')),
-            )
-            table.add_row(
-                "",
-                "",
-                "Level" if 'level_coverage' in stats else "Phone",
-                str(stats.get('with_level', stats.get('with_phone', 0))),
-                stats.get('level_coverage', stats.get('phone_coverage', '0%')),
-            )
-        
-        console.print(table)
-        
-        # Overall coverage
-        console.print("\n[bold]Overall Statistics:[/bold]")
-        console.print(f"Total EC Standards: {total_ec:,}")
-        console.print(f"Total Certificadores: {total_cert:,}")
-        console.print(f"Total Evaluation Centers: {session.query(EvaluationCenter).count():,}")
-        console.print(f"Total Courses: {session.query(Course).count():,}")
+        counts = session.execute(select(
+            ec_counts.c.total.label("total_ec"),
+            ec_counts.c.with_sector.label("ec_with_sector"),
+            ec_counts.c.with_level.label("ec_with_level"),
+            cert_counts.c.total.label("total_cert"),
+            cert_counts.c.with_email.label("cert_with_email"),
+            cert_counts.c.with_phone.label("cert_with_phone"),
+            select(func.count(EvaluationCenter.id)).scalar_subquery().label("total_centers"),
+            select(func.count(Course.id)).scalar_subquery().label("total_courses"),
+        ).select_from(ec_counts, cert_counts)).one()
+    
+    total_ec, ec_with_sector, ec_with_level = counts.total_ec, counts.ec_with_sector, counts.ec_with_level
+    total_cert, cert_with_email, cert_with_phone = counts.total_cert, counts.cert_with_email, counts.cert_with_phone
+    
+    # Get coverage statistics
+    coverage_stats = []
+    
+    # EC Standards coverage
+    coverage_stats.append({
+        "entity": "EC Standards",
+        "total": total_ec,
+        "with_sector": ec_with_sector,
+        "with_level": ec_with_level,
+        "sector_coverage": f"{ec_with_sector/total_ec*100:.1f}%" if total_ec else "0%",
+        "level_coverage": f"{ec_with_level/total_ec*100:.1f}%" if total_ec else "0%",
+    })
+    
+    # Certificadores coverage
+    coverage_stats.append({
+        "entity": "Certificadores",
+        "total": total_cert,
+        "with_email": cert_with_email,
+        "with_phone": cert_with_phone,
+        "email_coverage": f"{cert_with_email/total_cert*100:.1f}%" if total_cert else "0%",
+        "phone_coverage": f"{cert_with_phone/total_cert*100:.1f}%" if total_cert else "0%",
+    })
+    
+    # Show results
+    table = Table(title="Data Coverage Analysis")
+    table.add_column("Entity", style="cyan")
+    table.add_column("Total", justify="right")
+    table.add_column("Field", style="yellow")
+    table.add_column("Count", justify="right")
+    table.add_column("Coverage", justify="right", style="green")
+    
+    for stats in coverage_stats:
+        table.add_row(
+            stats['entity'],
+            str(stats['total']),
+            "Sector" if 'sector_coverage' in stats else "Email",
+            str(stats.get('with_sector', stats.get('with_email', 0))),
+            stats.get('sector_coverage', stats.get('email_coverage', '0%')),
+        )
+        table.add_row(
+            "",
+            "",
+            "Level" if 'level_coverage' in stats else "Phone",
+            str(stats.get('with_level', stats.get('with_phone', 0))),
+            stats.get('level_coverage', stats.get('phone_coverage', '0%')),
+        )
+    
+    console.print(table)
+    
+    # Overall coverage
+    console.print("\n[bold]Overall Statistics:[/bold]")
+    console.print(f"Total EC Standards: {total_ec:,}")
+    console.print(f"Total Certificadores: {total_cert:,}")
+    console.print(f"Total Evaluation Centers: {counts.total_centers:,}")
+    console.print(f"Total Courses: {counts.total_courses:,}")
 
 
 @app.command()
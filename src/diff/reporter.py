@@ -80,8 +80,9 @@ class DiffReporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(diff_data, f, indent=2, ensure_ascii=False, default=str)
+        output_path.write_text(
+            json.dumps(diff_data, indent=2, ensure_ascii=False, default=str), encoding='utf-8'
+        )
         
         logger.info(f"JSON diff report saved to {output_path}")
         return str(output_path)
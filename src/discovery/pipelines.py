@@ -13,6 +13,7 @@ from structlog import get_logger
 
 from src.core.constants import VALIDATION_PATTERNS
 from src.models import get_session
+from src.models.base import refresh_materialized_views
 from src.models.components import ECStandard, Certificador, EvaluationCenter, Course
 from src.models.crawl import CrawlMap, NetworkCapture
 from src.monitoring.metrics import harvest_metrics
@@ -400,7 +401,13 @@ class DatabasePipeline:
         logger.info("Database pipeline opened")
     
     def close_spider(self, spider):
-        """Close database session and log stats."""
+        """Close database session, refresh reporting views and log stats."""
+        if self.stats["saved"] or self.stats["updated"]:
+            try:
+                refresh_materialized_views()
+            except Exception as e:
+                logger.error("Materialized view refresh failed", error=str(e))
+        
         logger.info(
             "Database pipeline closed",
             stats=self.stats,
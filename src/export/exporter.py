@@ -4,14 +4,15 @@ Data exporter for various formats.
 import csv
 import json
 import logging
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Union
 from datetime import datetime
 from pathlib import Path
 import zipfile
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.orm import Session
-import pandas as pd
 
 from src.models import get_session
 from src.models.ec_standard import ECStandard
@@ -80,11 +81,57 @@ class DataExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
-            else:
-                json.dump(export_data, f, ensure_ascii=False, default=str)
+        # Encode once and write once; without indent the C encoder is used
+        output_path.write_text(
+            json.dumps(export_data, indent=2 if pretty else None, ensure_ascii=False, default=str),
+            encoding='utf-8'
+        )
+        
+        self.export_stats['files_created'].append(str(output_path))
+        logger.info(f"Exported {self.export_stats['total_records']} records to {output_path}")
+        
+        return str(output_path)
+    
+    def export_to_ndjson(self,
+                        output_path: str,
+                        entity_types: Optional[List[str]] = None,
+                        filters: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Export data as newline-delimited JSON, one record per line.
+        
+        Records are written as they are fetched, so memory stays bounded by
+        the fetch batch instead of the whole export. Each line carries an
+        ``entity_type`` field naming its collection.
+        
+        Args:
+            output_path: Path for output file
+            entity_types: Entity types to export (default: all)
+            filters: Optional filters to apply
+            
+        Returns:
+            Path to exported file
+        """
+        if not entity_types:
+            entity_types = ['ec_standards', 'certificadores']
+        
+        logger.info(f"Exporting to NDJSON: {entity_types}")
+        
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        iterators = {
+            'ec_standards': self._iter_ec_standards,
+            'certificadores': self._iter_certificadores,
+        }
+        
+        with open(output_path, 'wb') as f:
+            for entity_type in entity_types:
+                if entity_type not in iterators:
+                    continue
+                for record in iterators[entity_type](filters):
+                    f.write(orjson.dumps({'entity_type': entity_type, **record}))
+                    f.write(b'\n')
+                    self.export_stats['total_records'] += 1
         
         self.export_stats['files_created'].append(str(output_path))
         logger.info(f"Exported {self.export_stats['total_records']} records to {output_path}")
@@ -156,6 +203,9 @@ class DataExporter:
         if not entity_types:
             entity_types = ['ec_standards', 'certificadores']
         
+        # pandas is only needed here; keep it out of the other formats' startup
+        import pandas as pd
+        
         logger.info(f"Exporting to Excel: {entity_types}")
         
         output_path = Path(output_path)
@@ -217,46 +267,45 @@ class DataExporter:
         temp_dir = Path(output_path).parent / f"export_temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         temp_dir.mkdir(parents=True, exist_ok=True)
         
-        bundle_files = []
-        
         try:
-            # Export to each format
-            if 'json' in formats:
-                json_path = temp_dir / "data.json"
-                self.export_to_json(str(json_path), entity_types, filters)
-                bundle_files.append(json_path)
-            
-            if 'csv' in formats:
-                csv_dir = temp_dir / "csv"
-                csv_files = self.export_to_csv(str(csv_dir), entity_types, filters)
-                bundle_files.extend([Path(f) for f in csv_files])
-            
-            if 'excel' in formats:
-                excel_path = temp_dir / "data.xlsx"
-                self.export_to_excel(str(excel_path), entity_types, filters)
-                bundle_files.append(excel_path)
-            
-            # Add specialized JSON exports
-            if 'json' in formats:
-                # Graph format
-                graph_path = temp_dir / "graph.json"
-                self.export_graph_json(str(graph_path), entity_types, filters)
-                bundle_files.append(graph_path)
+            # The formats are independent, so write them concurrently; each
+            # task gets its own exporter so export_stats is never shared
+            workers = []
+            with ThreadPoolExecutor(max_workers=5) as pool:
+                def submit(method: str, *args):
+                    worker = DataExporter()
+                    workers.append(worker)
+                    return pool.submit(getattr(worker, method), *args, entity_types, filters)
+                
+                futures = []
+                if 'json' in formats:
+                    futures.append(submit('export_to_json', str(temp_dir / "data.json")))
+                    # Specialized JSON exports
+                    futures.append(submit('export_graph_json', str(temp_dir / "graph.json")))
+                    futures.append(submit('export_denormalized_json', str(temp_dir / "denormalized.json")))
+                if 'csv' in formats:
+                    futures.append(submit('export_to_csv', str(temp_dir / "csv")))
+                if 'excel' in formats:
+                    futures.append(submit('export_to_excel', str(temp_dir / "data.xlsx")))
                 
-                # Denormalized format
-                denorm_path = temp_dir / "denormalized.json"
-                self.export_denormalized_json(str(denorm_path), entity_types, filters)
-                bundle_files.append(denorm_path)
+                # Re-raise the first failure
+                for future in futures:
+                    future.result()
+            
+            # Every format carries the same records; report them once
+            self.export_stats['total_records'] = max(w.export_stats['total_records'] for w in workers)
+            bundle_files = sorted(p for p in temp_dir.rglob("*") if p.is_file())
             
             # Create ZIP file
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            # Level 1 deflate: slightly larger archive, much faster to build.
+            # XLSX files are already zip archives, so they are stored as is.
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
                 for file_path in bundle_files:
-                    if file_path.exists():
-                        arcname = file_path.relative_to(temp_dir)
-                        zf.write(file_path, arcname)
+                    compress_type = zipfile.ZIP_STORED if file_path.suffix == '.xlsx' else None
+                    zf.write(file_path, file_path.relative_to(temp_dir), compress_type=compress_type)
             
             logger.info(f"Created export bundle: {output_path}")
             return str(output_path)
@@ -345,8 +394,9 @@ class DataExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(graph_data, f, indent=2, ensure_ascii=False, default=str)
+        output_path.write_text(
+            json.dumps(graph_data, indent=2, ensure_ascii=False, default=str), encoding='utf-8'
+        )
         
         logger.info(f"Exported graph format to {output_path}")
         return str(output_path)
@@ -442,16 +492,19 @@ class DataExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(denorm_data, f, indent=2, ensure_ascii=False, default=str)
+        output_path.write_text(
+            json.dumps(denorm_data, indent=2, ensure_ascii=False, default=str), encoding='utf-8'
+        )
         
         logger.info(f"Exported denormalized format to {output_path}")
         return str(output_path)
     
     def _export_ec_standards(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Export EC standards data."""
-        records = []
-        
+        return list(self._iter_ec_standards(filters))
+    
+    def _iter_ec_standards(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield EC standard records, fetching rows in batches."""
         with get_session() as session:
             query = select(ECStandard)
             
@@ -462,8 +515,8 @@ class DataExporter:
                 if 'sector_id' in filters:
                     query = query.where(ECStandard.sector_id == filters['sector_id'])
             
-            for ec in session.execute(query).scalars():
-                records.append({
+            for ec in session.execute(query.execution_options(yield_per=1000)).scalars():
+                yield {
                     'ec_clave': ec.ec_clave,
                     'titulo': ec.titulo,
                     'version': ec.version,
@@ -484,14 +537,14 @@ class DataExporter:
                     'renec_url': ec.renec_url,
                     'first_seen': ec.first_seen.isoformat() if ec.first_seen else None,
                     'last_seen': ec.last_seen.isoformat() if ec.last_seen else None
-                })
-        
-        return records
+                }
     
     def _export_certificadores(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Export certificadores data."""
-        records = []
-        
+        return list(self._iter_certificadores(filters))
+    
+    def _iter_certificadores(self, filters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield certificador records, fetching rows in batches."""
         with get_session() as session:
             query = select(Certificador)
             
@@ -504,8 +557,8 @@ class DataExporter:
                 if 'estatus' in filters:
                     query = query.where(Certificador.estatus == filters['estatus'])
             
-            for cert in session.execute(query).scalars():
-                records.append({
+            for cert in session.execute(query.execution_options(yield_per=1000)).scalars():
+                yield {
                     'cert_id': cert.cert_id,
                     'tipo': cert.tipo,
                     'nombre_legal': cert.nombre_legal,
@@ -526,9 +579,7 @@ class DataExporter:
                     'src_url': cert.src_url,
                     'first_seen': cert.first_seen.isoformat() if cert.first_seen else None,
                     'last_seen': cert.last_seen.isoformat() if cert.last_seen else None
-                })
-        
-        return records
+                }
     
     def _write_ec_standards_csv(self, data: List[Dict[str, Any]], file_path: Path):
         """Write EC standards to CSV."""
@@ -1,6 +1,6 @@
 """Database models for RENEC harvester."""
 
-from src.models.base import Base, get_session
+from src.models.base import Base, get_session, get_db
 from src.models.components import (
     ECStandard,
     Certificador,
@@ -24,6 +24,7 @@ from src.models.relations import ECEEC, CentroEC, ECSector, HarvestRun
 __all__ = [
     "Base",
     "get_session",
+    "get_db",
     "ECStandard",
     "Certificador",
     "EvaluationCenter",
@@ -4,7 +4,7 @@ import os
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine, event, MetaData
+from sqlalchemy import create_engine, event, MetaData, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool, QueuePool
@@ -20,8 +20,13 @@ engine = create_engine(
     DATABASE_URL,
     poolclass=QueuePool,
     pool_size=int(os.getenv("DATABASE_POOL_SIZE", "20")),
-    max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "0")),
+    max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
+    pool_timeout=int(os.getenv("DATABASE_POOL_TIMEOUT", "30")),
+    pool_recycle=int(os.getenv("DATABASE_POOL_RECYCLE", "3600")),  # Seconds
     pool_pre_ping=True,  # Verify connections before using
+    # Compiled-statement cache shared by every session; sized for the API
+    # routers plus the CLI commands so hot statements are never evicted
+    query_cache_size=int(os.getenv("DATABASE_QUERY_CACHE_SIZE", "1200")),
     echo=os.getenv("SQLALCHEMY_ECHO", "false").lower() == "true",
 )
 
@@ -60,6 +65,16 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+def get_db() -> Generator[Session, None, None]:
+    """FastAPI dependency yielding a database session.
+
+    Declared as a plain generator so FastAPI drives it (and the sync handlers
+    using it) from its threadpool instead of the event loop.
+    """
+    with get_session() as session:
+        yield session
+
+
 def init_db() -> None:
     """Initialize database tables."""
     # Import all models to register them
@@ -73,6 +88,19 @@ def drop_db() -> None:
     Base.metadata.drop_all(bind=engine)
 
 
+# Reporting views maintained by migrations; refreshed after each harvest
+MATERIALIZED_VIEWS = ("mv_cert_stats_by_state",)
+# Tables the views are built on; writes to these must refresh the views
+MATERIALIZED_VIEW_SOURCES = frozenset({"certificadores_v2"})
+
+
+def refresh_materialized_views() -> None:
+    """Refresh reporting materialized views without blocking readers."""
+    with engine.begin() as conn:
+        for view in MATERIALIZED_VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+
+
 # Add event listeners for performance monitoring
 @event.listens_for(engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -4,8 +4,9 @@ Centro (Evaluation Center) model definition.
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -41,6 +42,13 @@ class Centro(Base):
     src_url = Column(String(500))
     content_hash = Column(String(64))
     
+    # Full-text search vector maintained by Postgres (migration 006);
+    # deferred so regular selects do not fetch it
+    search_vec = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(centro_id, '') || ' ' || coalesce(nombre, ''))", persisted=True)
+    ))
+    
     # Temporal tracking
     first_seen = Column(DateTime, server_default=func.now(), nullable=False)
     last_seen = Column(DateTime, server_default=func.now(), nullable=False)
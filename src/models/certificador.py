@@ -4,8 +4,9 @@ Certificador model definition.
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, CheckConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, CheckConstraint, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -54,6 +55,22 @@ class Certificador(Base):
     # Change detection
     row_hash = Column(String(64))
     
+    # Full-text search vector maintained by Postgres (migration 006);
+    # deferred so regular selects do not fetch it
+    search_vec = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(cert_id, '') || ' ' || coalesce(nombre_legal, '') || ' ' || coalesce(siglas, ''))", persisted=True)
+    ))
+    
+    # Relationships. Lazy by default so list endpoints never pay for them;
+    # detail queries opt in with selectinload(Certificador.acreditaciones).
+    acreditaciones = relationship(
+        "ECEEC",
+        order_by="ECEEC.ec_clave",
+        viewonly=True,
+        lazy="select",
+    )
+    
     # Constraints
     __table_args__ = (
         CheckConstraint("tipo IN ('ECE', 'OC')", name='check_cert_tipo'),
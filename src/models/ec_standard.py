@@ -4,8 +4,9 @@ EC Standard model definition.
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -53,8 +54,26 @@ class ECStandard(Base):
     first_seen = Column(DateTime, server_default=func.now(), nullable=False)
     last_seen = Column(DateTime, server_default=func.now(), nullable=False, index=True)
     
-    # Change detection
-    content_hash = Column(String(64))
+    # Change detection; hash of the content fields maintained by Postgres
+    # (migration 009), so writers must not set it
+    content_hash = Column(
+        String(64),
+        Computed(
+            "md5(coalesce(titulo, '') || '|' || coalesce(version, '') || '|' || "
+            "coalesce(vigente::text, '') || '|' || coalesce(sector, '') || '|' || "
+            "coalesce(comite, '') || '|' || coalesce(nivel, '') || '|' || "
+            "coalesce(tipo_norma, '') || '|' || coalesce(duracion_horas::text, '') || '|' || "
+            "coalesce(descripcion, ''))",
+            persisted=True
+        )
+    )
+    
+    # Full-text search vector maintained by Postgres (migration 006);
+    # deferred so regular selects do not fetch it
+    search_vec = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(ec_clave, '') || ' ' || coalesce(titulo, ''))", persisted=True)
+    ))
     
     def __repr__(self):
         return f"<ECStandard(ec_clave='{self.ec_clave}', titulo='{self.titulo[:50]}...')>"
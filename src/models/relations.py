@@ -6,6 +6,7 @@ from typing import Optional
 
 from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -22,6 +23,9 @@ class ECEEC(Base):
     acreditado_desde = Column(Date)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     
+    # Many-to-one: always wanted alongside the link row, so join it in.
+    ec_standard = relationship("src.models.ec_standard.ECStandard", viewonly=True, lazy="joined")
+    
     __table_args__ = (
         UniqueConstraint('cert_id', 'ec_clave', name='unique_cert_ec'),
     )
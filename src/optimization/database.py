@@ -11,7 +11,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.pool import QueuePool
 
 from src.models import get_session
-from src.models.base import Base
+from src.models.base import Base, MATERIALIZED_VIEW_SOURCES, refresh_materialized_views
 
 logger = logging.getLogger(__name__)
 
@@ -194,7 +194,6 @@ class BulkOperations:
                 'tipo_norma': std.get('tipo_norma'),
                 'fecha_publicacion': std.get('fecha_publicacion'),
                 'fecha_vigencia': std.get('fecha_vigencia'),
-                'content_hash': std.get('content_hash'),
                 'last_seen': datetime.utcnow(),
                 'created_at': datetime.utcnow(),
                 'updated_at': datetime.utcnow()
@@ -247,6 +246,9 @@ class BulkOperations:
             logger.info(f"Bulk updated {len(to_update)} records")
         
         session.commit()
+        
+        if model_class.__tablename__ in MATERIALIZED_VIEW_SOURCES and (to_insert or to_update):
+            refresh_materialized_views()
 
 
 class QueryOptimizer:
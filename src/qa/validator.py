@@ -2,7 +2,7 @@
 
 import re
 from collections import defaultdict
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any
 
 from src.core.constants import VALIDATION_PATTERNS
 from structlog import get_logger
@@ -39,14 +39,14 @@ class DataValidator:
         
         return results
     
-    def validate_component(self, component_type: str, items: List[Any], auto_fix: bool = False) -> Dict[str, Any]:
-        """Validate a specific component type."""
+    def validate_component(self, component_type: str, items: Iterable[Any], auto_fix: bool = False) -> Dict[str, Any]:
+        """Validate a specific component type; ``items`` may be a stream."""
         if component_type not in self.validation_rules:
             raise ValueError(f"Unknown component type: {component_type}")
         
         results = {
             "component_type": component_type,
-            "total": len(items),
+            "total": 0,
             "valid": 0,
             "invalid": 0,
             "errors": [],
@@ -54,8 +54,9 @@ class DataValidator:
         
         error_counts = defaultdict(lambda: {"count": 0, "examples": []})
         
+        validation_func = self.validation_rules[component_type]
         for item in items:
-            validation_func = self.validation_rules[component_type]
+            results["total"] += 1
             errors = validation_func(item)
             
             if errors:
@@ -14,7 +14,7 @@ def test_ec_standards():
     # List standards
     response = requests.get(f"{BASE_URL}/ec-standards?limit=5")
     if response.status_code == 200:
-        data = response.json()
+        data = response.json()['items']
         print(f"✓ List EC standards: {len(data)} items")
         if data:
             # Get detail for first standard
@@ -61,7 +61,7 @@ class TestCertificadoresRouter:
         mock_query.limit.return_value = mock_query
         mock_query.all.return_value = [sample_certificador]
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/certificadores")
                 
@@ -79,7 +79,7 @@ class TestCertificadoresRouter:
         mock_query.limit.return_value = mock_query
         mock_query.all.return_value = []
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/certificadores?tipo=OC&estado_inegi=09")
                 
@@ -95,7 +95,7 @@ class TestCertificadoresRouter:
         mock_count_query = Mock()
         mock_count_query.filter.return_value.count.return_value = 15
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[mock_query, mock_count_query]):
                 response = client.get("/api/v1/certificadores/ECE001-99")
                 
@@ -110,7 +110,7 @@ class TestCertificadoresRouter:
         mock_query = Mock()
         mock_query.filter.return_value.first.return_value = None
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/certificadores/INVALID")
                 
@@ -140,7 +140,7 @@ class TestCertificadoresRouter:
         mock_query_ece = Mock()
         mock_query_ece.join.return_value.filter.return_value.all.return_value = [mock_relation]
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[
                 mock_query_cert,    # Certificador lookup
                 mock_query_ece      # ECE relations with join
@@ -174,7 +174,7 @@ class TestCertificadoresRouter:
         mock_query_centros = Mock()
         mock_query_centros.filter.return_value.all.return_value = [centro]
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[
                 mock_query_cert,      # Certificador lookup
                 mock_query_centros    # Centros query
@@ -196,7 +196,7 @@ class TestCertificadoresRouter:
         mock_query.limit.return_value = mock_query
         mock_query.all.return_value = [sample_certificador]
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/certificadores?search=CONOCER")
                 
@@ -224,7 +224,7 @@ class TestCertificadoresRouter:
         mock_query = Mock()
         mock_query.filter.return_value.all.return_value = [cert1, cert2]
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/certificadores/by-state/09")
                 
@@ -269,7 +269,7 @@ class TestCertificadoresRouter:
         mock_date_query = Mock()
         mock_date_query.one.return_value = mock_date_result.one.return_value
         
-        with patch('src.api.routers.certificadores.get_session', return_value=mock_session):
+        with patch('src.api.routers.certificadores.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[
                 mock_count,           # Total count
                 mock_tipo_query,      # By tipo
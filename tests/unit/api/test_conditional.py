@@ -0,0 +1,80 @@
+"""
+Tests for conditional GET (ETag) support.
+"""
+import pytest
+from unittest.mock import Mock, patch
+from datetime import datetime
+
+from fastapi import HTTPException, Response
+from starlette.requests import Request
+from sqlalchemy.orm import Session
+
+from src.api import conditional
+from src.api.conditional import ConditionalGet
+from src.models import CertificadorV2 as Certificador
+
+
+def make_request(headers=None):
+    """Build a bare GET request with the given headers."""
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+@pytest.fixture
+def mock_session():
+    """Create mock database session returning a fixed MAX(last_seen)."""
+    session = Mock(spec=Session)
+    session.execute.return_value.scalar.return_value = datetime(2025, 8, 20, 12, 0, 0)
+    return session
+
+
+@pytest.fixture(autouse=True)
+def local_cache():
+    """Use an empty in-process cache instead of Redis."""
+    cache = conditional.DataVersionCache.__new__(conditional.DataVersionCache)
+    cache.ttl = 30
+    cache.redis_client = None
+    cache._local = {}
+    with patch.object(conditional, "data_version_cache", cache):
+        yield cache
+
+
+class TestConditionalGet:
+    """Test the ConditionalGet dependency."""
+
+    def test_sets_etag_and_last_modified(self, mock_session):
+        """Fresh requests get validators attached to the response."""
+        response = Response()
+        ConditionalGet(Certificador)(make_request(), response, mock_session)
+
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Last-Modified"] == "Wed, 20 Aug 2025 12:00:00 GMT"
+
+    def test_matching_etag_returns_304(self, mock_session):
+        """A current If-None-Match short-circuits with 304."""
+        dependency = ConditionalGet(Certificador)
+        response = Response()
+        dependency(make_request(), response, mock_session)
+        etag = response.headers["ETag"]
+
+        with pytest.raises(HTTPException) as exc_info:
+            dependency(make_request({"If-None-Match": etag}), Response(), mock_session)
+
+        assert exc_info.value.status_code == 304
+        assert exc_info.value.headers["ETag"] == etag
+
+    def test_max_last_seen_is_cached(self, mock_session):
+        """The MAX(last_seen) query runs once per TTL window."""
+        dependency = ConditionalGet(Certificador)
+        dependency(make_request(), Response(), mock_session)
+        dependency(make_request(), Response(), mock_session)
+
+        assert mock_session.execute.call_count == 1
+
+    def test_empty_table_skips_validators(self, mock_session):
+        """No data means no ETag."""
+        mock_session.execute.return_value.scalar.return_value = None
+        response = Response()
+        ConditionalGet(Certificador)(make_request(), response, mock_session)
+
+        assert "ETag" not in response.headers
@@ -70,15 +70,15 @@ class TestECStandardsRouter:
         mock_result = Mock()
         mock_result.scalars.return_value.all.return_value = [sample_ec_standard]
         
-        with patch('src.api.routers.ec_standards.get_session', return_value=mock_session):
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
             with patch.object(mock_session, 'execute', return_value=mock_result):
                 response = client.get("/api/v1/ec-standards")
                 
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 1
-        assert data[0]["ec_clave"] == "EC0217"
-        assert data[0]["vigente"] is True
+        assert len(data["items"]) == 1
+        assert data["items"][0]["ec_clave"] == "EC0217"
+        assert data["items"][0]["vigente"] is True
     
     def test_list_ec_standards_with_filters(self, client, mock_session):
         """Test listing EC standards with filters."""
@@ -89,12 +89,12 @@ class TestECStandardsRouter:
         mock_result = Mock()
         mock_result.scalars.return_value.all.return_value = []
         
-        with patch('src.api.routers.ec_standards.get_session', return_value=mock_session):
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
             with patch.object(mock_session, 'execute', return_value=mock_result):
                 response = client.get("/api/v1/ec-standards?vigente=true&sector_id=1")
                 
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {"items": [], "next_cursor": None}
     
     def test_get_ec_standard_detail(self, client, mock_session, sample_ec_standard):
         """Test getting EC standard details."""
@@ -106,7 +106,7 @@ class TestECStandardsRouter:
         mock_query_ece = Mock()
         mock_query_ece.filter.return_value.all.return_value = mock_ece_relations
         
-        with patch('src.api.routers.ec_standards.get_session', return_value=mock_session):
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[mock_query, mock_query_ece, mock_query]):
                 response = client.get("/api/v1/ec-standards/EC0217")
                 
@@ -121,7 +121,7 @@ class TestECStandardsRouter:
         mock_query = Mock()
         mock_query.filter.return_value.first.return_value = None
         
-        with patch('src.api.routers.ec_standards.get_session', return_value=mock_session):
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/ec-standards/INVALID")
                 
@@ -146,7 +146,7 @@ class TestECStandardsRouter:
         mock_query_cert = Mock()
         mock_query_cert.filter.return_value.first.return_value = sample_certificador
         
-        with patch('src.api.routers.ec_standards.get_session', return_value=mock_session):
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[
                 mock_query_ec,    # EC lookup
                 mock_query_ece,   # ECE relations
@@ -180,7 +180,7 @@ class TestECStandardsRouter:
         mock_query_centros = Mock()
         mock_query_centros.join.return_value.filter.return_value.all.return_value = [mock_centro]
         
-        with patch('src.api.routers.ec_standards.get_session', return_value=mock_session):
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[
                 mock_query_ec,       # EC lookup
                 mock_query_centros   # Centros query
@@ -203,27 +203,57 @@ class TestECStandardsRouter:
         mock_result = Mock()
         mock_result.scalars.return_value.all.return_value = [sample_ec_standard]
         
-        with patch('src.api.routers.ec_standards.get_session', return_value=mock_session):
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
             with patch.object(mock_session, 'execute', return_value=mock_result):
                 response = client.get("/api/v1/ec-standards?search=formación")
                 
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 1
+        assert len(data["items"]) == 1
     
     def test_pagination(self, client, mock_session):
         """Test pagination parameters."""
-        mock_query = Mock()
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = []
         
-        with patch('src.api.routers.ec_standards.get_session', return_value=mock_session):
-            with patch.object(mock_session, 'execute', return_value=mock_result):
-                response = client.get("/api/v1/ec-standards?skip=10&limit=20")
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
+            with patch.object(mock_session, 'execute', return_value=mock_result) as mock_execute:
+                response = client.get("/api/v1/ec-standards?after=EC0217&limit=20")
                 
         assert response.status_code == 200
-        # Verify offset and limit were called
-        mock_query.offset.assert_called_with(10)
-        mock_query.limit.assert_called_with(20)
\ No newline at end of file
+        assert response.json()["next_cursor"] is None
+        # Keyset seek instead of OFFSET
+        sql = str(mock_execute.call_args[0][0])
+        assert "ec_standards_v2.ec_clave >" in sql
+        assert "OFFSET" not in sql
+
+    def test_pagination_full_page_returns_cursor(self, client, mock_session):
+        """A page holding exactly `limit` rows points next_cursor at its last key."""
+        rows = [
+            Mock(
+                ec_clave=f"EC{n:04d}",
+                _mapping={
+                    "ec_clave": f"EC{n:04d}",
+                    "titulo": f"Estándar {n}",
+                    "version": "1.00",
+                    "vigente": True,
+                    "sector": None,
+                    "sector_id": None,
+                    "nivel": None,
+                    "duracion_horas": None,
+                    "last_seen": datetime(2025, 1, 1),
+                },
+            )
+            for n in range(218, 221)
+        ]
+        mock_result = Mock()
+        mock_result.all.return_value = rows
+
+        with patch('src.api.routers.ec_standards.get_db', return_value=mock_session):
+            with patch.object(mock_session, 'execute', return_value=mock_result):
+                response = client.get("/api/v1/ec-standards?after=EC0217&limit=3")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == 3
+        assert data["next_cursor"] == rows[-1].ec_clave
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Tests for the in-memory sector and comite catalogues.
+"""
+import pytest
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from src.api import reference_data
+
+
+@pytest.fixture(autouse=True)
+def empty_catalogues():
+    """Start and finish every test with empty catalogues."""
+    reference_data.SECTOR_BY_ID.clear()
+    reference_data.COMITE_BY_ID.clear()
+    yield
+    reference_data.SECTOR_BY_ID.clear()
+    reference_data.COMITE_BY_ID.clear()
+
+
+def fake_session(sectors, comites):
+    """Build a get_session replacement returning the given rows in order."""
+    session = Mock()
+    session.execute.side_effect = [
+        [SimpleNamespace(sector_id=i, nombre=n) for i, n in sectors],
+        [SimpleNamespace(comite_id=i, nombre=n) for i, n in comites],
+    ]
+
+    @contextmanager
+    def get_session():
+        yield session
+
+    return get_session
+
+
+class TestLoadReferenceData:
+    """Test load_reference_data."""
+
+    def test_reload_updates_and_drops_entries(self):
+        """Changed entries are replaced and vanished ones removed."""
+        with patch.object(reference_data, "get_session", fake_session([(1, "A"), (2, "B")], [(7, "X")])):
+            reference_data.load_reference_data()
+        with patch.object(reference_data, "get_session", fake_session([(2, "B2"), (3, "C")], [(8, "Y")])):
+            reference_data.load_reference_data()
+
+        assert reference_data.SECTOR_BY_ID == {
+            2: {"sector_id": 2, "nombre": "B2"},
+            3: {"sector_id": 3, "nombre": "C"},
+        }
+        assert reference_data.COMITE_BY_ID == {8: {"comite_id": 8, "nombre": "Y"}}
+
+    def test_catalogue_never_empty_during_swap(self):
+        """Readers never observe an empty dict while entries are replaced."""
+        reference_data.SECTOR_BY_ID.update({1: {"sector_id": 1, "nombre": "A"}})
+        sizes = []
+
+        class Recording(dict):
+            def __delitem__(self, key):
+                sizes.append(len(self))
+                super().__delitem__(key)
+
+        target = Recording(reference_data.SECTOR_BY_ID)
+        reference_data._replace_contents(target, {2: {"sector_id": 2, "nombre": "B"}})
+
+        assert sizes and min(sizes) > 0
+        assert target == {2: {"sector_id": 2, "nombre": "B"}}
+
+    def test_failed_query_keeps_previous_catalogue(self):
+        """A failing reload leaves the current entries in place."""
+        reference_data.SECTOR_BY_ID.update({1: {"sector_id": 1, "nombre": "A"}})
+        session = Mock()
+        session.execute.side_effect = RuntimeError("db down")
+
+        @contextmanager
+        def get_session():
+            yield session
+
+        with patch.object(reference_data, "get_session", get_session):
+            with pytest.raises(RuntimeError):
+                reference_data.load_reference_data()
+
+        assert reference_data.SECTOR_BY_ID == {1: {"sector_id": 1, "nombre": "A"}}
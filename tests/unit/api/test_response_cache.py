@@ -0,0 +1,125 @@
+"""
+Tests for response caching of read-mostly endpoints.
+"""
+import pytest
+from typing import List
+from unittest.mock import patch
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.api import response_cache
+from src.api.response_cache import cache_response
+
+
+@pytest.fixture(autouse=True)
+def local_cache():
+    """Use an empty in-process cache instead of Redis."""
+    cache = response_cache.ResponseCache.__new__(response_cache.ResponseCache)
+    cache.prefix = "test"
+    cache.redis_client = None
+    cache._local = {}
+    with patch.object(response_cache, "response_cache", cache):
+        yield cache
+
+
+class Item(BaseModel):
+    name: str
+
+
+@pytest.fixture
+def app_and_calls():
+    """Create an app with a cached endpoint that records its calls."""
+    app = FastAPI()
+    calls = []
+
+    @app.get("/items")
+    @cache_response(expire=60)
+    def list_items(q: str = Query("all")):
+        calls.append(q)
+        if q == "missing":
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"q": q}
+
+    @app.get("/async-items")
+    @cache_response(expire=300)
+    async def list_async_items(q: str = Query("all")):
+        calls.append(q)
+        return {"q": q}
+
+    @app.get("/models", response_model=List[Item])
+    @cache_response(expire=60)
+    def list_models(q: str = Query("all")):
+        calls.append(q)
+        return [Item(name=q)]
+
+    return app, calls
+
+
+class TestCacheResponse:
+    """Test the cache_response decorator."""
+
+    def test_repeated_request_served_from_cache(self, app_and_calls):
+        """The handler runs once per distinct query string."""
+        app, calls = app_and_calls
+        client = TestClient(app)
+
+        first = client.get("/items?q=a")
+        second = client.get("/items?q=a")
+        client.get("/items?q=b")
+
+        assert first.json() == second.json() == {"q": "a"}
+        assert second.headers["Cache-Control"] == "public, max-age=60"
+        assert calls == ["a", "b"]
+
+    def test_errors_are_not_cached(self, app_and_calls):
+        """HTTPExceptions propagate and are retried on the next request."""
+        app, calls = app_and_calls
+        client = TestClient(app)
+
+        assert client.get("/items?q=missing").status_code == 404
+        assert client.get("/items?q=missing").status_code == 404
+        assert calls == ["missing", "missing"]
+
+    def test_query_params_still_documented(self, app_and_calls):
+        """The injected request parameter does not leak into the schema."""
+        app, _ = app_and_calls
+        parameters = app.openapi()["paths"]["/items"]["get"]["parameters"]
+
+        assert [p["name"] for p in parameters] == ["q"]
+
+    def test_async_handler_cached(self, app_and_calls):
+        """Coroutine handlers are awaited once and then replayed."""
+        app, calls = app_and_calls
+        client = TestClient(app)
+
+        first = client.get("/async-items?q=a")
+        second = client.get("/async-items?q=a")
+
+        assert first.json() == second.json() == {"q": "a"}
+        assert second.headers["Cache-Control"] == "public, max-age=300"
+        assert calls == ["a"]
+
+    def test_clear_drops_entries(self, app_and_calls, local_cache):
+        """Clearing the cache forces the handler to run again."""
+        app, calls = app_and_calls
+        client = TestClient(app)
+
+        client.get("/items?q=a")
+        local_cache.clear()
+        client.get("/items?q=a")
+
+        assert calls == ["a", "a"]
+
+    def test_pydantic_models_cached(self, app_and_calls):
+        """Handlers returning response models are encoded and replayed."""
+        app, calls = app_and_calls
+        client = TestClient(app)
+
+        first = client.get("/models?q=a")
+        second = client.get("/models?q=a")
+
+        assert first.status_code == 200
+        assert first.json() == second.json() == [{"name": "a"}]
+        assert calls == ["a"]
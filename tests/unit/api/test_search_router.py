@@ -55,7 +55,7 @@ class TestSearchRouter:
         mock_centro_query = Mock()
         mock_centro_query.filter.return_value.limit.return_value.all.return_value = []
         
-        with patch('src.api.routers.search.get_session', return_value=mock_session):
+        with patch('src.api.routers.search.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[
                 mock_ec_query,
                 mock_cert_query,
@@ -84,7 +84,7 @@ class TestSearchRouter:
         mock_query = Mock()
         mock_query.filter.return_value.limit.return_value.all.return_value = []
         
-        with patch('src.api.routers.search.get_session', return_value=mock_session):
+        with patch('src.api.routers.search.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/search?q=test&entity_types=ec_standards,certificadores")
                 
@@ -104,7 +104,7 @@ class TestSearchRouter:
         mock_query = Mock()
         mock_query.filter.return_value.limit.return_value.all.return_value = [(mock_result.ec_clave, mock_result.titulo)]
         
-        with patch('src.api.routers.search.get_session', return_value=mock_session):
+        with patch('src.api.routers.search.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/search/suggest?q=EC02&entity_type=ec_standards")
                 
@@ -141,7 +141,7 @@ class TestSearchRouter:
         mock_centro_query = Mock()
         mock_centro_query.filter.return_value.all.return_value = [centro]
         
-        with patch('src.api.routers.search.get_session', return_value=mock_session):
+        with patch('src.api.routers.search.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[
                 mock_cert_query,
                 mock_centro_query,
@@ -200,7 +200,7 @@ class TestSearchRouter:
         mock_centro_lookup = Mock()
         mock_centro_lookup.filter.return_value.all.return_value = [mock_centro]
         
-        with patch('src.api.routers.search.get_session', return_value=mock_session):
+        with patch('src.api.routers.search.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', side_effect=[
                 mock_ec_query,          # EC lookup
                 mock_relation_query,    # ECE relations
@@ -226,7 +226,7 @@ class TestSearchRouter:
         mock_query = Mock()
         mock_query.filter.return_value.first.return_value = None
         
-        with patch('src.api.routers.search.get_session', return_value=mock_session):
+        with patch('src.api.routers.search.get_db', return_value=mock_session):
             with patch.object(mock_session, 'query', return_value=mock_query):
                 response = client.get("/api/v1/search/related/ec_standard/INVALID")
                 
@@ -0,0 +1,75 @@
+"""
+Tests for statistics and monitoring API endpoints.
+"""
+import pytest
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import response_cache
+from src.api.routers import stats
+
+
+@pytest.fixture(autouse=True)
+def local_cache():
+    """Use an empty in-process cache instead of Redis."""
+    cache = response_cache.ResponseCache.__new__(response_cache.ResponseCache)
+    cache.prefix = "test"
+    cache.redis_client = None
+    cache._local = {}
+    with patch.object(response_cache, "response_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def client():
+    """Create test client for the stats router alone."""
+    app = FastAPI()
+    app.include_router(stats.router)
+    return TestClient(app)
+
+
+class TestSystemHealth:
+    """Test the /health endpoint."""
+
+    def test_health_returns_model_fields(self, client):
+        """The cached SystemHealth model is served as JSON."""
+        sample = {"memory": 40.0, "disk": 60.0}
+        with patch.dict(stats._resource_sample, sample, clear=True):
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["database"] == "healthy"
+        assert data["memory_usage"] == 40.0
+        assert data["disk_usage"] == 60.0
+
+    def test_health_served_from_cache(self, client):
+        """A repeated call replays the cached body."""
+        with patch.dict(stats._resource_sample, {"memory": 1.0, "disk": 2.0}, clear=True):
+            first = client.get("/health")
+        with patch.dict(stats._resource_sample, {"memory": 3.0, "disk": 4.0}, clear=True):
+            second = client.get("/health")
+
+        assert second.status_code == 200
+        assert first.json() == second.json()
+        assert second.headers["Cache-Control"] == "public, max-age=15"
+
+
+class TestMetricsHistory:
+    """Test the /metrics/history endpoint."""
+
+    def test_points_every_five_minutes(self, client):
+        """One point per 5 minutes, inclusive of both ends."""
+        response = client.get("/metrics/history?hours=2")
+
+        assert response.status_code == 200
+        assert response.json()["total_points"] == 25
+
+    @pytest.mark.parametrize("hours", [0, 169, 100000])
+    def test_hours_out_of_range_rejected(self, client, hours):
+        """The window is bounded so no huge series is built or cached."""
+        response = client.get(f"/metrics/history?hours={hours}")
+
+        assert response.status_code == 422
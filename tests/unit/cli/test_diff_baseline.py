@@ -0,0 +1,155 @@
+"""
+Tests for baseline snapshot storage (base file plus append-only delta).
+"""
+import pytest
+from unittest.mock import patch
+
+import orjson
+
+from src.cli.commands import diff
+from src.cli.commands.diff import (
+    _baseline_delta_path,
+    _load_baseline,
+    _save_baseline,
+)
+
+
+def ec(clave, content_hash):
+    return {"ec_clave": clave, "titulo": f"Estándar {clave}", "content_hash": content_hash}
+
+
+def cert(cert_id, row_hash):
+    return {"cert_id": cert_id, "nombre_legal": f"Certificador {cert_id}", "row_hash": row_hash}
+
+
+def snapshot(created_at, ec_standards, certificadores):
+    return {"created_at": created_at, "ec_standards": ec_standards, "certificadores": certificadores}
+
+
+def by_key(rows, key):
+    return {row[key]: row for row in rows}
+
+
+@pytest.fixture
+def baseline_path(tmp_path):
+    return tmp_path / "baseline.json"
+
+
+@pytest.fixture
+def first(baseline_path):
+    """Write and return an initial snapshot."""
+    data = snapshot(
+        "2025-09-01T00:00:00",
+        [ec("EC0001", "a"), ec("EC0002", "b"), ec("EC0003", "c")],
+        [cert("CERT1", "x"), cert("CERT2", "y")],
+    )
+    _save_baseline(baseline_path, data)
+    return data
+
+
+class TestSaveBaseline:
+    """Test _save_baseline."""
+
+    def test_first_write_creates_base_only(self, baseline_path, first):
+        """With no base yet, the whole snapshot becomes the base file."""
+        assert orjson.loads(baseline_path.read_bytes()) == first
+        assert not _baseline_delta_path(baseline_path).exists()
+
+    def test_first_write_returns_row_count(self, tmp_path):
+        """The return value counts every row written."""
+        data = snapshot("2025-09-01T00:00:00", [ec("EC0001", "a")], [cert("CERT1", "x"), cert("CERT2", "y")])
+
+        assert _save_baseline(tmp_path / "b.json", data) == 3
+
+    def test_unchanged_snapshot_appends_no_rows(self, baseline_path, first):
+        """Rerunning with identical rows only records the new timestamp."""
+        written = _save_baseline(baseline_path, {**first, "created_at": "2025-09-02T00:00:00"})
+
+        lines = _baseline_delta_path(baseline_path).read_bytes().splitlines()
+        assert written == 0
+        assert [orjson.loads(line) for line in lines] == [{"created_at": "2025-09-02T00:00:00"}]
+
+    def test_delta_records_changed_added_and_removed(self, baseline_path, first):
+        """Only differing rows are appended; removals are null tombstones."""
+        second = snapshot(
+            "2025-09-02T00:00:00",
+            [ec("EC0001", "a"), ec("EC0002", "b2"), ec("EC0004", "d")],
+            [cert("CERT1", "x")],
+        )
+
+        written = _save_baseline(baseline_path, second)
+
+        entries = [orjson.loads(line) for line in _baseline_delta_path(baseline_path).read_bytes().splitlines()]
+        assert entries[0] == {"created_at": "2025-09-02T00:00:00"}
+        assert {(e["entity"], e["key"]): e["row"] for e in entries[1:]} == {
+            ("ec_standards", "EC0002"): ec("EC0002", "b2"),
+            ("ec_standards", "EC0004"): ec("EC0004", "d"),
+            ("ec_standards", "EC0003"): None,
+            ("certificadores", "CERT2"): None,
+        }
+        assert written == 4
+        # The base file is left untouched
+        assert orjson.loads(baseline_path.read_bytes()) == first
+
+    def test_compacts_when_delta_too_large(self, baseline_path, first):
+        """Past the size threshold the base is rewritten and the delta dropped."""
+        second = snapshot("2025-09-02T00:00:00", [ec("EC0001", "a2")], [cert("CERT1", "x")])
+        _save_baseline(baseline_path, second)
+        assert _baseline_delta_path(baseline_path).exists()
+
+        third = snapshot("2025-09-03T00:00:00", [ec("EC0001", "a3"), ec("EC0005", "e")], [])
+        with patch.object(diff, "BASELINE_COMPACT_BYTES", 0):
+            written = _save_baseline(baseline_path, third)
+
+        assert written == 2
+        assert not _baseline_delta_path(baseline_path).exists()
+        assert orjson.loads(baseline_path.read_bytes()) == third
+        assert _load_baseline(baseline_path) == third
+
+
+class TestLoadBaseline:
+    """Test _load_baseline."""
+
+    def test_without_delta_returns_base(self, baseline_path, first):
+        """A fresh baseline loads exactly as written."""
+        assert _load_baseline(baseline_path) == first
+
+    def test_replays_delta_over_base(self, baseline_path, first):
+        """Changes, additions and removals are applied to the base rows."""
+        second = snapshot(
+            "2025-09-02T00:00:00",
+            [ec("EC0001", "a"), ec("EC0002", "b2"), ec("EC0004", "d")],
+            [cert("CERT1", "x")],
+        )
+        _save_baseline(baseline_path, second)
+
+        loaded = _load_baseline(baseline_path)
+
+        assert loaded["created_at"] == "2025-09-02T00:00:00"
+        assert by_key(loaded["ec_standards"], "ec_clave") == by_key(second["ec_standards"], "ec_clave")
+        assert by_key(loaded["certificadores"], "cert_id") == by_key(second["certificadores"], "cert_id")
+
+    def test_last_write_wins_across_runs(self, baseline_path, first):
+        """Several appended runs replay in order."""
+        runs = [
+            snapshot("2025-09-02T00:00:00", [ec("EC0001", "a2")], [cert("CERT1", "x")]),
+            snapshot("2025-09-03T00:00:00", [ec("EC0001", "a3"), ec("EC0003", "c")], []),
+            snapshot("2025-09-04T00:00:00", [ec("EC0003", "c2")], [cert("CERT2", "y2")]),
+        ]
+        for run in runs:
+            _save_baseline(baseline_path, run)
+            loaded = _load_baseline(baseline_path)
+
+            assert loaded["created_at"] == run["created_at"]
+            assert by_key(loaded["ec_standards"], "ec_clave") == by_key(run["ec_standards"], "ec_clave")
+            assert by_key(loaded["certificadores"], "cert_id") == by_key(run["certificadores"], "cert_id")
+
+    def test_readded_row_after_removal(self, baseline_path, first):
+        """A row removed in one run and restored in the next is present again."""
+        _save_baseline(baseline_path, snapshot("2025-09-02T00:00:00", [ec("EC0001", "a")], []))
+        _save_baseline(baseline_path, first)
+
+        loaded = _load_baseline(baseline_path)
+
+        assert by_key(loaded["ec_standards"], "ec_clave") == by_key(first["ec_standards"], "ec_clave")
+        assert by_key(loaded["certificadores"], "cert_id") == by_key(first["certificadores"], "cert_id")